@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
 import random
@@ -12,8 +13,9 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from kora.executor import run_graph
-from kora.task_ir import TaskGraph, normalize_graph, validate_graph
+from kora.executor import run_graphs
+from kora.task_ir import TaskGraph
+from kora.templates import GraphTemplate
 from kora.telemetry import summarize_run
 
 SHORT_TEXT = "Summarize quickly."
@@ -31,14 +33,13 @@ def _percentile(values: list[int], pct: float) -> int:
     return sorted(values)[idx]
 
 
-def _build_graph(
+@functools.lru_cache(maxsize=None)
+def _graph_template(
     *,
-    idx: int,
-    text: str,
     adapter: str,
     force_budget_failure: bool,
     exhaust_mode: str,
-) -> TaskGraph:
+) -> GraphTemplate:
     llm_budget = {"max_time_ms": 3000, "max_tokens": 400, "max_retries": 1}
     if force_budget_failure:
         llm_budget = {"max_time_ms": 1, "max_tokens": 1, "max_retries": 0}
@@ -52,7 +53,7 @@ def _build_graph(
         }
 
     graph_payload: dict[str, Any] = {
-        "graph_id": f"stress-{idx}",
+        "graph_id": "stress",
         "version": "0.1",
         "root": "task_llm",
         "defaults": {"budget": {"max_time_ms": 3000, "max_tokens": 400, "max_retries": 1}},
@@ -61,8 +62,8 @@ def _build_graph(
                 "id": "task_pre",
                 "type": "det.classify_simple",
                 "deps": [],
-                "in": {"text": text},
-                "run": {"kind": "det", "spec": {"handler": "classify_simple", "args": {"text": text}}},
+                "in": {"text": "{{text}}"},
+                "run": {"kind": "det", "spec": {"handler": "classify_simple", "args": {"text": "{{text}}"}}},
                 "verify": {
                     "schema": det_verify_schema,
                     "rules": [{"kind": "required", "paths": ["status", "task_id", "is_simple"]}],
@@ -79,7 +80,7 @@ def _build_graph(
                     "kind": "llm",
                     "spec": {
                         "adapter": adapter,
-                        "input": {"question": text, "skip_if": {"path": "$.is_simple", "equals": True}},
+                        "input": {"question": "{{text}}", "skip_if": {"path": "$.is_simple", "equals": True}},
                         "output_schema": {
                             "type": "object",
                             "properties": {
@@ -100,10 +101,23 @@ def _build_graph(
             },
         ],
     }
-    graph = TaskGraph.model_validate(graph_payload)
-    normalized = normalize_graph(graph)
-    validate_graph(normalized)
-    return normalized
+    return GraphTemplate(graph_payload)
+
+
+def _build_graph(
+    *,
+    idx: int,
+    text: str,
+    adapter: str,
+    force_budget_failure: bool,
+    exhaust_mode: str,
+) -> TaskGraph:
+    template = _graph_template(
+        adapter=adapter,
+        force_budget_failure=force_budget_failure,
+        exhaust_mode=exhaust_mode,
+    )
+    return template.bind({"text": text}, graph_id=f"stress-{idx}")
 
 
 def _is_budget_error_message(message: str) -> bool:
@@ -190,6 +204,7 @@ def _render_markdown(report: dict[str, Any]) -> str:
             f"| latency_p50_ms | {s['latency_ms']['p50']} |",
             f"| latency_p95_ms | {s['latency_ms']['p95']} |",
             f"| latency_p99_ms | {s['latency_ms']['p99']} |",
+            f"| throughput_per_s | {s['throughput_per_s']} |",
             f"| budget_breach_count | {s['budget_breach_count']} |",
             f"| escalation_required_count | {s['escalation_required_count']} |",
             "",
@@ -209,6 +224,7 @@ def main() -> None:
     parser.add_argument("--exhaust-n", type=int, help="number of exhaustion-case runs")
     parser.add_argument("--exhaust-mode", choices=["schema", "budget"], default="schema")
     parser.add_argument("--use-openai", action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument("--concurrency", type=int, default=1, help="graphs executed concurrently")
     parser.add_argument("--out", default="docs/reports/stress_report")
     args = parser.parse_args()
 
@@ -235,6 +251,7 @@ def main() -> None:
     latencies_ms: list[int] = []
 
     start_all = time.monotonic()
+    cases: list[tuple[str, bool]] = []
     for idx in range(n):
         is_trivial = rng.random() < mix
         text = SHORT_TEXT if is_trivial else LONG_TEXT
@@ -242,16 +259,21 @@ def main() -> None:
         if force_budget_failure and args.exhaust_mode == "budget":
             # Force LLM execution path for deterministic budget-exhaustion classification.
             text = LONG_TEXT
+        cases.append((text, force_budget_failure))
 
-        graph_start = time.monotonic()
-        graph = _build_graph(
+    graphs = (
+        _build_graph(
             idx=idx,
             text=text,
             adapter=adapter,
             force_budget_failure=force_budget_failure,
             exhaust_mode=args.exhaust_mode,
         )
-        result = run_graph(graph)
+        for idx, (text, force_budget_failure) in enumerate(cases)
+    )
+    batch = run_graphs(graphs, concurrency=max(1, int(args.concurrency)), ordered=True)
+    for (_, force_budget_failure), result in zip(cases, batch):
+        total_time_ms = int(result["stage_timings"]["overall_total_s"] * 1000)
         if force_budget_failure and args.exhaust_mode == "budget":
             err = result.get("error")
             if result.get("ok") is True:
@@ -268,7 +290,6 @@ def main() -> None:
                     result["error"] = mapped
             else:
                 result = _normalize_budget_failure_result(result)
-        total_time_ms = int((time.monotonic() - graph_start) * 1000)
         latencies_ms.append(total_time_ms)
 
         run_summary = summarize_run(result)
@@ -313,6 +334,7 @@ def main() -> None:
         "budget_breach_count": budget_breach_count,
         "escalation_required_count": escalation_required_count,
         "wall_time_ms": int((time.monotonic() - start_all) * 1000),
+        "throughput_per_s": batch.stats()["throughput_per_s"],
     }
 
     report = {
@@ -326,6 +348,7 @@ def main() -> None:
             "use_openai_effective": use_openai,
             "exhaustion_runs": min(exhaustion_runs, n),
             "exhaust_mode": args.exhaust_mode,
+            "concurrency": max(1, int(args.concurrency)),
         },
         "summary": summary,
     }
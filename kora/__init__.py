@@ -6,4 +6,11 @@ __all__ = [
     "executor",
     "budget",
     "verification",
+    "plan",
+    "templates",
+    "semantic_retrieval",
+    "batching",
+    "handlers",
+    "checkpoint",
+    "events",
 ]
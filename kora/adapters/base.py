@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 
 class BaseAdapter:
-    """Minimal adapter interface for v0.1."""
+    """Minimal adapter interface for v0.1.
+
+    Adapters that set ``supports_batch = True`` have concurrent calls grouped
+    by the executor's micro-batcher and delivered through ``run_batch``.
+    """
+
+    supports_batch = False
 
     def run(
         self,
@@ -17,3 +24,77 @@ class BaseAdapter:
         output_schema: dict[str, Any],
     ) -> dict[str, Any]:
         raise NotImplementedError
+
+    def run_batch(self, requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Run several requests (``run`` keyword arguments) and return results in order."""
+        return [self.run(**request) for request in requests]
+
+    def close(self) -> None:
+        """Release pooled resources such as HTTP sessions."""
+
+
+class AsyncBaseAdapter(BaseAdapter):
+    """Adapter interface for backends with a native asyncio client.
+
+    ``arun`` returns the same result contract as ``BaseAdapter.run``. The sync
+    ``run`` drives ``arun`` on a private event loop so async adapters also work
+    with the synchronous executor (it must not be called from a running loop).
+    """
+
+    async def arun(
+        self,
+        *,
+        task_id: str,
+        input: dict[str, Any],
+        budget: dict[str, Any],
+        output_schema: dict[str, Any],
+    ) -> dict[str, Any]:
+        raise NotImplementedError
+
+    def run(
+        self,
+        *,
+        task_id: str,
+        input: dict[str, Any],
+        budget: dict[str, Any],
+        output_schema: dict[str, Any],
+    ) -> dict[str, Any]:
+        return asyncio.run(
+            self.arun(task_id=task_id, input=input, budget=budget, output_schema=output_schema)
+        )
+
+
+class SyncAdapterShim(AsyncBaseAdapter):
+    """Expose a synchronous adapter through ``arun`` by running it in a worker thread."""
+
+    def __init__(self, adapter: BaseAdapter) -> None:
+        self.adapter = adapter
+
+    async def arun(
+        self,
+        *,
+        task_id: str,
+        input: dict[str, Any],
+        budget: dict[str, Any],
+        output_schema: dict[str, Any],
+    ) -> dict[str, Any]:
+        return await asyncio.to_thread(
+            self.adapter.run,
+            task_id=task_id,
+            input=input,
+            budget=budget,
+            output_schema=output_schema,
+        )
+
+    def run(
+        self,
+        *,
+        task_id: str,
+        input: dict[str, Any],
+        budget: dict[str, Any],
+        output_schema: dict[str, Any],
+    ) -> dict[str, Any]:
+        return self.adapter.run(task_id=task_id, input=input, budget=budget, output_schema=output_schema)
+
+    def close(self) -> None:
+        self.adapter.close()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from typing import Any
 
 from .base import BaseAdapter
@@ -34,3 +36,37 @@ class MockAdapter(BaseAdapter):
             },
             "meta": {"adapter": "mock", "model": "mock-v0"},
         }
+
+
+class BatchMockAdapter(MockAdapter):
+    """Batch-capable mock that charges a fixed overhead per invocation, not per request."""
+
+    supports_batch = True
+    overhead_s = 0.02
+
+    def __init__(self) -> None:
+        self.batch_sizes: list[int] = []
+        self._lock = threading.Lock()
+
+    def run(
+        self,
+        *,
+        task_id: str,
+        input: dict[str, Any],
+        budget: dict[str, Any],
+        output_schema: dict[str, Any],
+    ) -> dict[str, Any]:
+        return self.run_batch(
+            [{"task_id": task_id, "input": input, "budget": budget, "output_schema": output_schema}]
+        )[0]
+
+    def run_batch(self, requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        with self._lock:
+            self.batch_sizes.append(len(requests))
+        time.sleep(self.overhead_s)
+        results = []
+        for request in requests:
+            result = MockAdapter.run(self, **request)
+            result["meta"] = {"adapter": "mock_batch", "model": "mock-v0", "batch_size": len(requests)}
+            results.append(result)
+        return results
@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any
 
 import requests
+import requests.adapters
 
 from .base import BaseAdapter
 
@@ -49,19 +50,45 @@ def harden_schema_for_openai(schema: dict[str, Any]) -> dict[str, Any]:
 
 
 class OpenAIAdapter(BaseAdapter):
-    """OpenAI Responses API adapter using requests."""
+    """OpenAI Responses API adapter using a pooled requests session."""
 
     def __init__(
         self,
         model: str = "gpt-4o-mini",
         force_json_schema: dict[str, Any] | None = None,
         max_output_tokens: int | None = None,
+        pool_size: int | None = None,
     ) -> None:
         env_model = os.getenv("KORA_OPENAI_MODEL", "").strip()
         self.model = env_model or model
         self.force_json_schema = force_json_schema
         self.max_output_tokens = max_output_tokens
         self.endpoint = "https://api.openai.com/v1/responses"
+        self.api_key = os.getenv("OPENAI_API_KEY")
+
+        timeout_env = os.getenv("OPENAI_HTTP_TIMEOUT_SECONDS", "").strip()
+        try:
+            self.env_timeout_seconds = float(timeout_env) if timeout_env else 30.0
+        except ValueError:
+            self.env_timeout_seconds = 30.0
+
+        if pool_size is None:
+            pool_env = os.getenv("KORA_OPENAI_POOL_SIZE", "").strip()
+            try:
+                pool_size = int(pool_env) if pool_env else 10
+            except ValueError:
+                pool_size = 10
+        self.pool_size = max(1, int(pool_size))
+        self._session = requests.Session()
+        http_adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+        )
+        self._session.mount("https://", http_adapter)
+        self._session.mount("http://", http_adapter)
+
+    def close(self) -> None:
+        self._session.close()
 
     def run(
         self,
@@ -72,7 +99,7 @@ class OpenAIAdapter(BaseAdapter):
         output_schema: dict[str, Any],
     ) -> dict[str, Any]:
         start = time.monotonic()
-        api_key = os.getenv("OPENAI_API_KEY")
+        api_key = self.api_key
         if not api_key:
             return {
                 "ok": False,
@@ -82,14 +109,9 @@ class OpenAIAdapter(BaseAdapter):
                 "meta": {"adapter": "openai", "model": self.model},
             }
 
-        timeout_env = os.getenv("OPENAI_HTTP_TIMEOUT_SECONDS", "").strip()
-        try:
-            env_timeout_seconds = float(timeout_env) if timeout_env else 30.0
-        except ValueError:
-            env_timeout_seconds = 30.0
         timeout_seconds = max(
             float(budget.get("max_time_ms", 1500)) / 1000.0 + 1.0,
-            env_timeout_seconds,
+            self.env_timeout_seconds,
             0.1,
         )
         max_tokens = int(budget.get("max_tokens", 300))
@@ -147,7 +169,7 @@ class OpenAIAdapter(BaseAdapter):
         }
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.endpoint,
                 headers=headers,
                 json=request_payload,
@@ -437,7 +459,7 @@ class OpenAIAdapter(BaseAdapter):
 class OpenAIMiniAdapter(OpenAIAdapter):
     """OpenAI adapter bound to the mini-stage model."""
 
-    def __init__(self) -> None:
+    def __init__(self, pool_size: int | None = None) -> None:
         mini_schema: dict[str, Any] = {
             "type": "object",
             "properties": {
@@ -464,11 +486,12 @@ class OpenAIMiniAdapter(OpenAIAdapter):
             model=os.getenv("KORA_OPENAI_MODEL_MINI", "gpt-4o-mini"),
             force_json_schema=mini_schema,
             max_output_tokens=3000,
+            pool_size=pool_size,
         )
 
 
 class OpenAIFullAdapter(OpenAIAdapter):
     """OpenAI adapter bound to the full-stage model."""
 
-    def __init__(self) -> None:
-        super().__init__(model=os.getenv("KORA_OPENAI_MODEL_FULL", "gpt-4o"))
+    def __init__(self, pool_size: int | None = None) -> None:
+        super().__init__(model=os.getenv("KORA_OPENAI_MODEL_FULL", "gpt-4o"), pool_size=pool_size)
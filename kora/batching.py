@@ -0,0 +1,141 @@
+"""Cross-request micro-batching of adapter calls for batch-capable adapters."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from kora.adapters.base import BaseAdapter
+from kora.verification import schema_hash
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.getenv(name, "").strip()
+    try:
+        return float(raw) if raw else default
+    except ValueError:
+        return default
+
+
+@dataclass
+class _PendingBatch:
+    adapter: BaseAdapter
+    opened_at: float
+    requests: list[dict[str, Any]] = field(default_factory=list)
+    futures: list[Future] = field(default_factory=list)
+
+
+class MicroBatcher:
+    """Collect requests per (adapter, output schema) and flush them through ``run_batch``.
+
+    A batch is flushed once it holds ``max_batch_size`` requests or its oldest
+    request has waited ``window_ms``. Flushes run on a small worker pool so one
+    slow batch does not hold back others; results are scattered back to the
+    per-request futures in submission order.
+    """
+
+    def __init__(self, *, window_ms: float = 5.0, max_batch_size: int = 16, workers: int = 4) -> None:
+        self.window_ms = max(0.0, float(window_ms))
+        self.max_batch_size = max(1, int(max_batch_size))
+        self._workers = max(1, int(workers))
+        self._pending: dict[tuple[int, str], _PendingBatch] = {}
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._pool: ThreadPoolExecutor | None = None
+
+    def configure(self, *, window_ms: float | None = None, max_batch_size: int | None = None) -> None:
+        with self._cond:
+            if window_ms is not None:
+                self.window_ms = max(0.0, float(window_ms))
+            if max_batch_size is not None:
+                self.max_batch_size = max(1, int(max_batch_size))
+            self._cond.notify()
+
+    def submit(self, adapter: BaseAdapter, request: dict[str, Any]) -> Future:
+        """Queue one ``run`` request; the future resolves to that request's result dict."""
+        future: Future = Future()
+        key = (id(adapter), schema_hash(request["output_schema"]))
+        with self._cond:
+            self._ensure_started()
+            batch = self._pending.get(key)
+            if batch is None:
+                batch = _PendingBatch(adapter=adapter, opened_at=time.monotonic())
+                self._pending[key] = batch
+            batch.requests.append(request)
+            batch.futures.append(future)
+            if len(batch.requests) >= self.max_batch_size:
+                del self._pending[key]
+                self._dispatch(batch)
+            else:
+                self._cond.notify()
+        return future
+
+    def _ensure_started(self) -> None:
+        if self._thread is None:
+            self._pool = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="kora-batch")
+            self._thread = threading.Thread(target=self._loop, name="kora-batcher", daemon=True)
+            self._thread.start()
+
+    def _dispatch(self, batch: _PendingBatch) -> None:
+        assert self._pool is not None
+        self._pool.submit(self._flush, batch)
+
+    def _loop(self) -> None:
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                window_s = self.window_ms / 1000.0
+                wait_s: float | None = None
+                for key, batch in list(self._pending.items()):
+                    due_in = batch.opened_at + window_s - now
+                    if due_in <= 0:
+                        del self._pending[key]
+                        self._dispatch(batch)
+                    elif wait_s is None or due_in < wait_s:
+                        wait_s = due_in
+                self._cond.wait(timeout=wait_s)
+
+    @staticmethod
+    def _flush(batch: _PendingBatch) -> None:
+        # Callers abandon requests (deadlines, hedging, early stops) by cancelling
+        # their futures; drop those and pin the rest as running so they stay settable.
+        live = [
+            (request, future)
+            for request, future in zip(batch.requests, batch.futures)
+            if future.set_running_or_notify_cancel()
+        ]
+        if not live:
+            return
+        requests = [request for request, _ in live]
+        try:
+            results = batch.adapter.run_batch(requests)
+            if len(results) != len(requests):
+                raise ValueError(f"run_batch returned {len(results)} results for {len(requests)} requests")
+        except Exception as exc:
+            for _, future in live:
+                _settle(future, exception=exc)
+            return
+        for (_, future), result in zip(live, results):
+            _settle(future, result=result)
+
+
+def _settle(future: Future, *, result: Any = None, exception: BaseException | None = None) -> None:
+    try:
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass
+
+
+MICRO_BATCHER = MicroBatcher(
+    window_ms=_env_number("KORA_BATCH_WINDOW_MS", 5.0),
+    max_batch_size=int(_env_number("KORA_BATCH_MAX_SIZE", 16)),
+)
+
+__all__ = ["MICRO_BATCHER", "MicroBatcher"]
@@ -1,7 +1,184 @@
-"""Budget policy and tracking (placeholder)."""
+"""Budget policy and tracking: deadlines, spend ledger and latency estimates."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Callable
+
+from kora.cost_model import estimate_cost
+from kora.errors import ErrorType, KoraRuntimeError, Stage
+
+
+class LatencyTracker:
+    """Sliding window of observed call latencies per key (e.g. adapter name)."""
+
+    def __init__(self, *, window: int = 256) -> None:
+        self._window = max(1, int(window))
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, latency_ms: float) -> None:
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = deque(maxlen=self._window)
+                self._samples[key] = samples
+            samples.append(float(latency_ms))
+
+    def percentile(self, key: str, pct: float, *, min_samples: int = 1) -> float | None:
+        """Return the ``pct`` (0..1) latency for ``key`` or None without enough samples."""
+        with self._lock:
+            samples = list(self._samples.get(key, ()))
+        if len(samples) < max(1, int(min_samples)):
+            return None
+        ordered = sorted(samples)
+        idx = max(0, min(len(ordered) - 1, int(math.ceil(pct * len(ordered))) - 1))
+        return ordered[idx]
+
+    def count(self, key: str) -> int:
+        with self._lock:
+            return len(self._samples.get(key, ()))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+
+class BudgetLedger:
+    """Graph-wide accounting of adapter token usage and estimated cost."""
+
+    def __init__(self, *, max_tokens: int | None = None, max_cost_usd: float | None = None) -> None:
+        self.max_tokens = max_tokens
+        self.max_cost_usd = max_cost_usd
+        self.tokens_in = 0
+        self.tokens_out = 0
+        self.cost_usd = 0.0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def charge(self, result: dict[str, Any]) -> None:
+        """Record the usage reported by one adapter result."""
+        usage = result.get("usage")
+        meta = result.get("meta")
+        tokens_in = tokens_out = 0
+        if isinstance(usage, dict):
+            tokens_in = int(usage.get("tokens_in", 0) or 0)
+            tokens_out = int(usage.get("tokens_out", 0) or 0)
+        model = meta.get("model") if isinstance(meta, dict) else None
+        cost = estimate_cost(model, tokens_in, tokens_out) if isinstance(model, str) else 0.0
+        with self._lock:
+            self.tokens_in += tokens_in
+            self.tokens_out += tokens_out
+            self.cost_usd = round(self.cost_usd + cost, 8)
+            self.calls += 1
+
+    def exhausted(self) -> str | None:
+        """Return a description of the first exhausted cap, or None."""
+        with self._lock:
+            tokens = self.tokens_in + self.tokens_out
+            if self.max_tokens is not None and tokens >= self.max_tokens:
+                return f"graph token budget exhausted ({tokens}/{self.max_tokens})"
+            if self.max_cost_usd is not None and self.cost_usd >= self.max_cost_usd:
+                return f"graph cost budget exhausted ({self.cost_usd}/{self.max_cost_usd} usd)"
+        return None
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "tokens_in": self.tokens_in,
+                "tokens_out": self.tokens_out,
+                "cost_usd": self.cost_usd,
+                "max_tokens": self.max_tokens,
+                "max_cost_usd": self.max_cost_usd,
+            }
 
 
 class BudgetManager:
-    """Placeholder budget manager for v0.1-alpha."""
+    """Monotonic deadlines and the spend ledger for one graph run.
+
+    A manager built without limits is disabled: every deadline is None and no
+    check ever fails, which keeps graphs without a ``budget`` block unchanged.
+    Usage is still recorded in the ledger for reporting.
+    """
+
+    def __init__(
+        self,
+        *,
+        graph_max_time_ms: int | float | None = None,
+        enforce_task_deadlines: bool = False,
+        max_tokens: int | None = None,
+        max_cost_usd: float | None = None,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        self._clock = clock or time.monotonic
+        self.started_at = self._clock()
+        self.enforce_task_deadlines = enforce_task_deadlines
+        self.ledger = BudgetLedger(max_tokens=max_tokens, max_cost_usd=max_cost_usd)
+        self.graph_deadline: float | None = None
+        if graph_max_time_ms is not None:
+            self.graph_deadline = self._clock() + max(0.0, float(graph_max_time_ms)) / 1000.0
+
+    @classmethod
+    def for_graph(cls, graph: Any, *, clock: Callable[[], float] | None = None) -> "BudgetManager":
+        graph_budget = getattr(graph, "budget", None)
+        if graph_budget is None:
+            return cls(clock=clock)
+        return cls(
+            graph_max_time_ms=graph_budget.max_time_ms,
+            enforce_task_deadlines=graph_budget.enforce_task_deadlines,
+            max_tokens=graph_budget.max_tokens,
+            max_cost_usd=graph_budget.max_cost_usd,
+            clock=clock,
+        )
+
+    def task_deadline(self, max_time_ms: int | float | None) -> float | None:
+        """Start a task clock; the deadline never extends past the graph deadline."""
+        deadline = self.graph_deadline
+        if self.enforce_task_deadlines and isinstance(max_time_ms, (int, float)) and not isinstance(max_time_ms, bool):
+            task_deadline = self._clock() + max(0.0, float(max_time_ms)) / 1000.0
+            deadline = task_deadline if deadline is None else min(deadline, task_deadline)
+        return deadline
+
+    def remaining_ms(self, deadline: float | None) -> float | None:
+        if deadline is None:
+            return None
+        return (deadline - self._clock()) * 1000.0
+
+    def expired(self, deadline: float | None) -> bool:
+        remaining = self.remaining_ms(deadline)
+        return remaining is not None and remaining <= 0
+
+    def can_fit(self, deadline: float | None, estimate_ms: float | None) -> bool:
+        """Return False when a step expected to take ``estimate_ms`` cannot finish in time."""
+        remaining = self.remaining_ms(deadline)
+        if remaining is None:
+            return True
+        if estimate_ms is None:
+            return remaining > 0
+        return remaining >= estimate_ms
+
+    def check_spend(self, *, task_id: str | None, action: str) -> None:
+        """Raise a budget breach if the graph ledger is already exhausted."""
+        exhausted = self.ledger.exhausted()
+        if exhausted is not None:
+            raise self.breach(task_id=task_id, details=f"{exhausted}; refused {action}")
+
+    def snapshot(self) -> dict[str, Any]:
+        report = self.ledger.snapshot()
+        report["elapsed_ms"] = int((self._clock() - self.started_at) * 1000)
+        return report
 
-    pass
+    @staticmethod
+    def breach(*, task_id: str | None, details: str) -> KoraRuntimeError:
+        return KoraRuntimeError(
+            error_type=ErrorType.BUDGET_BREACH,
+            stage=Stage.BUDGET,
+            details=details,
+            task_id=task_id,
+            retryable=False,
+            budget_breached=True,
+        )
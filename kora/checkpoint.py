@@ -0,0 +1,203 @@
+"""Checkpoint sinks that persist completed task outputs for crash recovery."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Any
+
+from kora.sqlite_connections import ThreadLocalConnections
+
+
+class CheckpointSink:
+    """Checkpoint backend interface.
+
+    ``record`` is called once per completed task with its verified output, its
+    events and its input fingerprint; ``load`` returns everything recorded for
+    a graph in the shape ``run_graph(previous=...)`` accepts.
+    """
+
+    def record(
+        self,
+        graph_id: str,
+        task_id: str,
+        *,
+        fingerprint: str,
+        output: dict[str, Any],
+        events: list[dict[str, Any]],
+    ) -> None:
+        raise NotImplementedError
+
+    def load(self, graph_id: str) -> dict[str, Any]:
+        raise NotImplementedError
+
+    def clear(self, graph_id: str | None = None) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release backend resources such as file handles or database connections."""
+
+
+def _empty_checkpoint() -> dict[str, Any]:
+    return {"outputs": {}, "fingerprints": {}, "events": []}
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class FileCheckpointSink(CheckpointSink):
+    """Append-only JSON Lines checkpoint file.
+
+    Each completed task appends one line and flushes it, so a killed worker
+    loses at most the task it was running; ``fsync=True`` also survives host
+    crashes at the cost of a disk sync per task. A torn final line is ignored
+    on load, and later lines for the same task win.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, fsync: bool = False) -> None:
+        self.path = os.fspath(path)
+        self._fsync = fsync
+        self._lock = threading.Lock()
+        self._handle = open(self.path, "a", encoding="utf-8")
+        if self._handle.tell() > 0:
+            with open(self.path, "rb") as handle:
+                handle.seek(-1, os.SEEK_END)
+                torn = handle.read(1) != b"\n"
+            if torn:
+                self._handle.write("\n")
+                self._handle.flush()
+
+    def record(
+        self,
+        graph_id: str,
+        task_id: str,
+        *,
+        fingerprint: str,
+        output: dict[str, Any],
+        events: list[dict[str, Any]],
+    ) -> None:
+        line = _dumps(
+            {
+                "graph_id": graph_id,
+                "task_id": task_id,
+                "fingerprint": fingerprint,
+                "output": output,
+                "events": events,
+            }
+        )
+        with self._lock:
+            self._handle.write(line + "\n")
+            self._handle.flush()
+            if self._fsync:
+                os.fsync(self._handle.fileno())
+
+    def load(self, graph_id: str) -> dict[str, Any]:
+        checkpoint = _empty_checkpoint()
+        with self._lock:
+            self._handle.flush()
+            with open(self.path, encoding="utf-8") as handle:
+                lines = handle.readlines()
+        events: dict[str, list[dict[str, Any]]] = {}
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(entry, dict) or entry.get("graph_id") != graph_id:
+                continue
+            task_id = entry["task_id"]
+            checkpoint["outputs"][task_id] = entry["output"]
+            checkpoint["fingerprints"][task_id] = entry["fingerprint"]
+            events.pop(task_id, None)
+            events[task_id] = entry.get("events") or []
+        for task_events in events.values():
+            checkpoint["events"].extend(task_events)
+        return checkpoint
+
+    def clear(self, graph_id: str | None = None) -> None:
+        with self._lock:
+            self._handle.flush()
+            with open(self.path, encoding="utf-8") as handle:
+                lines = handle.readlines()
+            kept: list[str] = []
+            if graph_id is not None:
+                for line in lines:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(entry, dict) and entry.get("graph_id") != graph_id:
+                        kept.append(line)
+            self._handle.close()
+            with open(self.path, "w", encoding="utf-8") as handle:
+                handle.writelines(kept)
+            self._handle = open(self.path, "a", encoding="utf-8")
+
+    def close(self) -> None:
+        with self._lock:
+            self._handle.close()
+
+
+class SQLiteCheckpointSink(CheckpointSink):
+    """SQLite checkpoint store in WAL mode, one row per (graph, task)."""
+
+    def __init__(self, path: str | os.PathLike[str], *, timeout_s: float = 30.0) -> None:
+        self.path = os.fspath(path)
+        self._connections = ThreadLocalConnections(path, timeout_s=timeout_s)
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints ("
+                "graph_id TEXT NOT NULL, task_id TEXT NOT NULL, fingerprint TEXT NOT NULL, "
+                "output TEXT NOT NULL, events TEXT NOT NULL, seq INTEGER NOT NULL, "
+                "PRIMARY KEY (graph_id, task_id))"
+            )
+
+    def _conn(self) -> sqlite3.Connection:
+        return self._connections.get()
+
+    def record(
+        self,
+        graph_id: str,
+        task_id: str,
+        *,
+        fingerprint: str,
+        output: dict[str, Any],
+        events: list[dict[str, Any]],
+    ) -> None:
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (graph_id, task_id, fingerprint, output, events, seq) "
+                "VALUES (?, ?, ?, ?, ?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM checkpoints))",
+                (graph_id, task_id, fingerprint, _dumps(output), _dumps(events)),
+            )
+
+    def load(self, graph_id: str) -> dict[str, Any]:
+        checkpoint = _empty_checkpoint()
+        rows = self._conn().execute(
+            "SELECT task_id, fingerprint, output, events FROM checkpoints WHERE graph_id = ? ORDER BY seq",
+            (graph_id,),
+        )
+        for task_id, fingerprint, output, events in rows:
+            checkpoint["outputs"][task_id] = json.loads(output)
+            checkpoint["fingerprints"][task_id] = fingerprint
+            checkpoint["events"].extend(json.loads(events))
+        return checkpoint
+
+    def clear(self, graph_id: str | None = None) -> None:
+        conn = self._conn()
+        with conn:
+            if graph_id is None:
+                conn.execute("DELETE FROM checkpoints")
+            else:
+                conn.execute("DELETE FROM checkpoints WHERE graph_id = ?", (graph_id,))
+
+    def close(self) -> None:
+        self._connections.close()
+
+
+__all__ = ["CheckpointSink", "FileCheckpointSink", "SQLiteCheckpointSink"]
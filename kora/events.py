@@ -0,0 +1,144 @@
+"""Event sinks that receive task events while a graph is still running."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import queue
+import threading
+from collections import deque
+from collections.abc import AsyncIterator
+from typing import Any, Callable
+
+Event = dict[str, Any]
+
+
+class EventSink:
+    """Receiver for task events, called as soon as each event is recorded.
+
+    ``emit`` may be called from worker threads and must be thread-safe. The
+    executor never closes a sink, so one sink can observe many runs; emitted
+    events carry the ``graph_id`` of the run that produced them.
+    """
+
+    def emit(self, event: Event) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Flush and release resources; called by the owner after the last run."""
+
+
+class CallbackEventSink(EventSink):
+    """Forward every event to a callable."""
+
+    def __init__(self, callback: Callable[[Event], None]) -> None:
+        self._callback = callback
+
+    def emit(self, event: Event) -> None:
+        self._callback(event)
+
+
+class QueueEventSink(EventSink):
+    """Put events on a thread-safe ``queue.Queue``; ``close`` puts a ``None`` sentinel."""
+
+    def __init__(self, events: queue.Queue | None = None) -> None:
+        self.queue: queue.Queue = events if events is not None else queue.Queue()
+
+    def emit(self, event: Event) -> None:
+        self.queue.put(event)
+
+    def close(self) -> None:
+        self.queue.put(None)
+
+
+class AsyncEventStream(EventSink):
+    """Async iterator over events, fed from any thread.
+
+    Create it on the event loop that consumes it. Iteration ends after
+    ``close``, which is safe to call from any thread.
+    """
+
+    _DONE = object()
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        self._loop = loop or asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    def emit(self, event: Event) -> None:
+        self._put(event)
+
+    def close(self) -> None:
+        self._put(self._DONE)
+
+    def _put(self, item: Any) -> None:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._queue.put_nowait(item)
+        else:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, item)
+
+    def __aiter__(self) -> AsyncIterator[Event]:
+        return self
+
+    async def __anext__(self) -> Event:
+        item = await self._queue.get()
+        if item is self._DONE:
+            self._queue.put_nowait(self._DONE)
+            raise StopAsyncIteration
+        return item
+
+
+class JsonlEventSink(EventSink):
+    """Append events to a JSON Lines file, one flushed line per event."""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._handle = open(self.path, "a", encoding="utf-8")
+
+    def emit(self, event: Event) -> None:
+        line = json.dumps(event, sort_keys=True, separators=(",", ":"), default=str)
+        with self._lock:
+            self._handle.write(line + "\n")
+            self._handle.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._handle.close()
+
+
+class RingBufferEventSink(EventSink):
+    """Keep only the most recent ``capacity`` events in memory."""
+
+    def __init__(self, capacity: int = 1000) -> None:
+        self._events: deque[Event] = deque(maxlen=max(1, int(capacity)))
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def emit(self, event: Event) -> None:
+        with self._lock:
+            if len(self._events) == self._events.maxlen:
+                self.dropped += 1
+            self._events.append(event)
+
+    def events(self) -> list[Event]:
+        with self._lock:
+            return list(self._events)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+
+__all__ = [
+    "AsyncEventStream",
+    "CallbackEventSink",
+    "Event",
+    "EventSink",
+    "JsonlEventSink",
+    "QueueEventSink",
+    "RingBufferEventSink",
+]
@@ -2,23 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import json
 import hashlib
+import multiprocessing
 import os
 import re
+import threading
 import time
-from typing import Any, Callable
-
-from kora.adapters.base import BaseAdapter
-from kora.adapters.mock import MockAdapter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, Generator, Literal
+
+from kora.adapters.base import AsyncBaseAdapter, BaseAdapter, SyncAdapterShim
+from kora.adapters.mock import BatchMockAdapter, MockAdapter
 from kora.adapters.openai_adapter import OpenAIAdapter, OpenAIFullAdapter, OpenAIMiniAdapter
+from kora.batching import MICRO_BATCHER
+from kora.budget import BudgetManager, LatencyTracker
+from kora.checkpoint import CheckpointSink
 from kora.errors import ErrorType, KoraRuntimeError, Stage
-from kora.retrieval import InMemoryRetrievalStore, build_retrieval_key
-from kora.scheduler import get_task_map, topo_sort
-from kora.task_ir import Task, TaskGraph
+from kora.events import EventSink
+from kora.handlers import HANDLER_REGISTRY, Handler, HandlerRegistry
+from kora.retrieval import InMemoryRetrievalStore, RetrievalStore, build_retrieval_key, retrieval_store_from_env
+from kora.semantic_retrieval import SemanticRetrievalIndex
+from kora.plan import ExecutionPlan, compile_plan
+from kora.task_ir import AdaptiveRoutingPolicy, HedgePolicy, Task, TaskGraph
+from kora.templates import GraphTemplate
 from kora.verification import verify_output
 
-Handler = Callable[[Task, dict[str, Any]], dict[str, Any]]
 ADAPTIVE_META_KEYS: tuple[str, ...] = (
     "confidence",
     "uncertainty",
@@ -30,23 +45,77 @@ ADAPTIVE_META_KEYS: tuple[str, ...] = (
     "gate_retrieval_key",
     "gate_retrieval_strategy",
 )
-GATE_RETRIEVAL_STORE = InMemoryRetrievalStore()
+GATE_RETRIEVAL_STORE: RetrievalStore = retrieval_store_from_env()
+GATE_SEMANTIC_INDEX = SemanticRetrievalIndex()
+DET_OUTPUT_CACHE: RetrievalStore = InMemoryRetrievalStore(max_entries=1024)
+ADAPTER_LATENCY = LatencyTracker()
+_ADAPTER_CALL_POOL: ThreadPoolExecutor | None = None
+_ADAPTER_CALL_POOL_LOCK = threading.Lock()
+_DET_PROCESS_POOL: ProcessPoolExecutor | None = None
+_DET_PROCESS_POOL_LOCK = threading.Lock()
 
 
 class _AdapterRegistry:
+    """Provider lookup plus a per-process pool of adapter instances.
+
+    Instances are created once per (provider, class, options) and reused by
+    every task so adapters can keep HTTP keep-alive pools warm. Replacing a
+    provider class or its options yields a fresh instance; ``close`` releases
+    every pooled instance.
+    """
+
     providers: dict[str, type[BaseAdapter]] = {
         "openai": OpenAIAdapter,
         "openai_mini": OpenAIMiniAdapter,
         "openai_full": OpenAIFullAdapter,
         "mock": MockAdapter,
+        "mock_batch": BatchMockAdapter,
     }
+    options: dict[str, dict[str, Any]] = {}
+    _instances: dict[tuple[str, type[BaseAdapter], str], BaseAdapter] = {}
+    _lock = threading.Lock()
 
     @classmethod
     def get(cls, name: str) -> BaseAdapter:
         adapter_cls = cls.providers.get(name)
         if adapter_cls is None:
             raise ValueError(f"unknown llm adapter: {name}")
-        return adapter_cls()
+        options = cls.options.get(name, {})
+        key = (name, adapter_cls, json.dumps(options, sort_keys=True, default=str))
+        adapter = cls._instances.get(key)
+        if adapter is not None:
+            return adapter
+        stale: list[BaseAdapter] = []
+        with cls._lock:
+            adapter = cls._instances.get(key)
+            if adapter is None:
+                stale = cls._pop_instances(name)
+                adapter = adapter_cls(**options)
+                cls._instances[key] = adapter
+        for existing in stale:
+            existing.close()
+        return adapter
+
+    @classmethod
+    def configure(cls, name: str, **options: Any) -> None:
+        """Set constructor options for a provider and drop its pooled instances."""
+        with cls._lock:
+            cls.options[name] = dict(options)
+            adapters = cls._pop_instances(name)
+        for adapter in adapters:
+            adapter.close()
+
+    @classmethod
+    def close(cls, name: str | None = None) -> None:
+        with cls._lock:
+            adapters = cls._pop_instances(name)
+        for adapter in adapters:
+            adapter.close()
+
+    @classmethod
+    def _pop_instances(cls, name: str | None) -> list[BaseAdapter]:
+        keys = [key for key in cls._instances if name is None or key[0] == name]
+        return [cls._instances.pop(key) for key in keys]
 
 
 def _handle_echo(task: Task, state: dict[str, Any]) -> dict[str, Any]:
@@ -243,13 +312,16 @@ def _handle_quality_gate(task: Task, state: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-DETERMINISTIC_HANDLERS: dict[str, Handler] = {
-    "echo": _handle_echo,
-    "classify_simple": _handle_classify_simple,
-    "flaky_once": _handle_flaky_once,
-    "parse_request_constraints": _handle_parse_request_constraints,
-    "quality_gate": _handle_quality_gate,
-}
+DETERMINISTIC_HANDLERS: HandlerRegistry = HANDLER_REGISTRY
+DETERMINISTIC_HANDLERS.update(
+    {
+        "echo": _handle_echo,
+        "classify_simple": _handle_classify_simple,
+        "flaky_once": _handle_flaky_once,
+        "parse_request_constraints": _handle_parse_request_constraints,
+        "quality_gate": _handle_quality_gate,
+    }
+)
 
 
 def normalize_answer_json_string(output: dict[str, Any]) -> dict[str, Any]:
@@ -275,16 +347,59 @@ def normalize_answer_json_string(output: dict[str, Any]) -> dict[str, Any]:
     return normalized
 
 
-def _run_det_task(task: Task, state: dict[str, Any]) -> dict[str, Any]:
+def _is_cpu_bound(handler: Handler) -> bool:
+    return bool(getattr(handler, "cpu_bound", False))
+
+
+def _resolve_det_handler(task: Task) -> Handler:
     if task.run.kind != "det":
         raise ValueError(f"task '{task.id}' is not deterministic")
 
     handler_name = task.run.spec.handler
-    handler = DETERMINISTIC_HANDLERS.get(handler_name)
-    if handler is None:
-        raise ValueError(f"unknown deterministic handler: {handler_name}")
+    try:
+        return DETERMINISTIC_HANDLERS[handler_name]
+    except KeyError:
+        raise ValueError(f"unknown deterministic handler: {handler_name}") from None
 
-    return handler(task, state)
+
+def _run_det_task(task: Task, state: dict[str, Any]) -> dict[str, Any]:
+    return _resolve_det_handler(task)(task, state)
+
+
+def _det_process_pool() -> ProcessPoolExecutor:
+    global _DET_PROCESS_POOL
+    if _DET_PROCESS_POOL is None:
+        with _DET_PROCESS_POOL_LOCK:
+            if _DET_PROCESS_POOL is None:
+                workers_env = os.getenv("KORA_DET_PROCESS_WORKERS", "").strip()
+                try:
+                    workers = int(workers_env) if workers_env else (os.cpu_count() or 1)
+                except ValueError:
+                    workers = os.cpu_count() or 1
+                # spawn: forking a process that already runs adapter threads is unsafe
+                _DET_PROCESS_POOL = ProcessPoolExecutor(
+                    max_workers=max(1, workers),
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _DET_PROCESS_POOL
+
+
+def shutdown_det_process_pool() -> None:
+    """Stop the det process pool; the next CPU-bound task starts a fresh one."""
+    global _DET_PROCESS_POOL
+    with _DET_PROCESS_POOL_LOCK:
+        pool, _DET_PROCESS_POOL = _DET_PROCESS_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _discard_det_process_pool(broken: ProcessPoolExecutor) -> None:
+    """Drop a pool whose worker died so the next submit starts a fresh one."""
+    global _DET_PROCESS_POOL
+    with _DET_PROCESS_POOL_LOCK:
+        if _DET_PROCESS_POOL is broken:
+            _DET_PROCESS_POOL = None
+    broken.shutdown(wait=False, cancel_futures=True)
 
 
 def _skip_if_matches(task: Task, outputs: dict[str, dict[str, Any]]) -> bool:
@@ -309,30 +424,126 @@ def _skip_if_matches(task: Task, outputs: dict[str, dict[str, Any]]) -> bool:
     return False
 
 
-def _run_llm_task(
+class _EscalationStats:
+    """EWMA of how often each (task type, stage) recommends escalating."""
+
+    def __init__(self, *, alpha: float = 0.2, min_samples: int = 5) -> None:
+        self._alpha = alpha
+        self._min_samples = min_samples
+        self._stats: dict[tuple[str, str], tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, task_type: str, stage_token: str, escalated: bool) -> None:
+        key = (task_type, stage_token)
+        observed = 1.0 if escalated else 0.0
+        with self._lock:
+            rate, count = self._stats.get(key, (observed, 0))
+            self._stats[key] = (self._alpha * observed + (1.0 - self._alpha) * rate, count + 1)
+
+    def probability(self, task_type: str, stage_token: str) -> float | None:
+        with self._lock:
+            rate, count = self._stats.get((task_type, stage_token), (0.0, 0))
+        return rate if count >= self._min_samples else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+ESCALATION_STATS = _EscalationStats()
+
+
+@dataclass(eq=False)
+class _AdapterCall:
+    """One adapter invocation requested by a task body and performed by a driver.
+
+    ``speculative`` is an optional next-stage call the driver may start in
+    parallel. The body later yields that same object to collect its result;
+    drivers cancel speculation the body does not come back for.
+    """
+
+    task: Task
+    adapter_name: str
+    input: dict[str, Any]
+    budget: dict[str, Any]
+    output_schema: dict[str, Any]
+    deadline: float | None = None
+    speculative: "_AdapterCall | None" = None
+    hedge: HedgePolicy | None = None
+
+
+@dataclass
+class _SampleBatch:
+    """Concurrent self-consistency samples; drivers stop once the majority is decided.
+
+    ``seed_hashes`` are output hashes already observed for this vote. Drivers
+    reply with the consumed ``(output, adapter_result)`` pairs in completion order.
+    """
+
+    calls: list[_AdapterCall]
+    seed_hashes: list[str]
+
+
+@dataclass
+class _DetCall:
+    """A CPU-bound deterministic handler invocation shipped to the det process pool."""
+
+    task: Task
+    handler: Handler
+    state: dict[str, Any]
+    deadline: float | None = None
+
+
+def _output_hash(output: Any) -> str:
+    serialized = json.dumps(output, sort_keys=True, separators=(",", ":"), ensure_ascii=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _majority_decided(counts: dict[str, int], outstanding: int) -> bool:
+    """True when outstanding samples can no longer change the leading hash."""
+    ranked = sorted(counts.values(), reverse=True)
+    if not ranked:
+        return False
+    runner_up = ranked[1] if len(ranked) > 1 else 0
+    return ranked[0] > runner_up + outstanding
+
+
+def _prepare_llm_call(
     task: Task,
-    outputs: dict[str, dict[str, Any]],
     *,
+    base_budget: dict[str, Any] | None = None,
     adapter_override: str | None = None,
     budget_override: dict[str, Any] | None = None,
-) -> tuple[dict[str, Any], dict[str, Any]]:
+    deadline: float | None = None,
+    hedge: HedgePolicy | None = None,
+) -> _AdapterCall:
     if task.run.kind != "llm":
         raise ValueError(f"task '{task.id}' is not an llm task")
 
-    adapter_name = adapter_override or task.run.spec.adapter
-    adapter = _AdapterRegistry.get(adapter_name)
     adapter_input = dict(task.run.spec.input)
     adapter_input.pop("skip_if", None)
 
-    budget = task.policy.budget.model_dump() if task.policy.budget is not None else {}
+    if base_budget is not None:
+        budget = dict(base_budget)
+    else:
+        budget = task.policy.budget.model_dump() if task.policy.budget is not None else {}
     if isinstance(budget_override, dict):
         budget.update(budget_override)
-    result = adapter.run(
-        task_id=task.id,
+    if deadline is not None:
+        remaining_ms = max(0, int((deadline - time.monotonic()) * 1000))
+        budget["max_time_ms"] = min(int(budget.get("max_time_ms", remaining_ms)), remaining_ms)
+    return _AdapterCall(
+        task=task,
+        adapter_name=adapter_override or task.run.spec.adapter,
         input=adapter_input,
         budget=budget,
         output_schema=task.run.spec.output_schema,
+        deadline=deadline,
+        hedge=hedge,
     )
+
+
+def _finish_llm_call(result: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
     meta = result.get("meta")
     if not isinstance(meta, dict):
         meta = {}
@@ -352,6 +563,410 @@ def _run_llm_task(
     return output, result
 
 
+def _adapter_request(call: _AdapterCall) -> dict[str, Any]:
+    return {
+        "task_id": call.task.id,
+        "input": call.input,
+        "budget": call.budget,
+        "output_schema": call.output_schema,
+    }
+
+
+def _call_adapter(
+    call: _AdapterCall, budget: BudgetManager, pooled: _PooledCall | None = None
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    adapter = _AdapterRegistry.get(call.adapter_name)
+    call_start = time.monotonic()
+    if adapter.supports_batch:
+        result = MICRO_BATCHER.submit(adapter, _adapter_request(call)).result()
+    else:
+        result = adapter.run(**_adapter_request(call))
+    ADAPTER_LATENCY.record(call.adapter_name, (time.monotonic() - call_start) * 1000.0)
+    if pooled is None or pooled.claim():
+        budget.ledger.charge(result)
+    return _finish_llm_call(result)
+
+
+def _adapter_call_pool() -> ThreadPoolExecutor:
+    global _ADAPTER_CALL_POOL
+    if _ADAPTER_CALL_POOL is None:
+        with _ADAPTER_CALL_POOL_LOCK:
+            if _ADAPTER_CALL_POOL is None:
+                workers_env = os.getenv("KORA_ADAPTER_CALL_WORKERS", "").strip()
+                try:
+                    workers = int(workers_env) if workers_env else 32
+                except ValueError:
+                    workers = 32
+                _ADAPTER_CALL_POOL = ThreadPoolExecutor(
+                    max_workers=max(1, workers),
+                    thread_name_prefix="kora-adapter",
+                )
+    return _ADAPTER_CALL_POOL
+
+
+class _PooledCall:
+    """An adapter call running on the adapter pool, charged to the ledger exactly once.
+
+    A call that finishes is charged its real usage. A call the caller gives
+    up on first is charged like a cancelled async call
+    (``_abandoned_call_result``), and its late result is not charged again.
+    """
+
+    def __init__(self, call: _AdapterCall, budget: BudgetManager) -> None:
+        self.call = call
+        self.budget = budget
+        self._charged = False
+        self._lock = threading.Lock()
+        self.future: Future = _adapter_call_pool().submit(_call_adapter, call, budget, self)
+
+    def claim(self) -> bool:
+        with self._lock:
+            if self._charged:
+                return False
+            self._charged = True
+            return True
+
+    def abandon(self) -> None:
+        if self.future.cancel() or self.future.done():
+            return
+        if self.claim():
+            model = getattr(_AdapterRegistry.get(self.call.adapter_name), "model", None)
+            self.budget.ledger.charge(_abandoned_call_result(self.call, model))
+
+
+def _hedge_delay_ms(call: _AdapterCall) -> float | None:
+    if call.hedge is None:
+        return None
+    return ADAPTER_LATENCY.percentile(
+        call.adapter_name,
+        call.hedge.percentile,
+        min_samples=call.hedge.min_samples,
+    )
+
+
+def _mark_hedged(result: dict[str, Any], winner: str) -> None:
+    meta = result.get("meta")
+    if isinstance(meta, dict):
+        meta["hedged"] = True
+        meta["hedge_winner"] = winner
+
+
+def _call_adapter_hedged(
+    call: _AdapterCall, budget: BudgetManager, hedge_after_ms: float
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Fire a duplicate call if the first outlives ``hedge_after_ms``; first success wins.
+
+    Both calls are charged to the budget ledger; the loser when it is abandoned.
+    """
+    primary = _PooledCall(call, budget)
+    attempts: dict[Future, tuple[str, _PooledCall]] = {primary.future: ("primary", primary)}
+    remaining_ms = budget.remaining_ms(call.deadline)
+    first_wait_ms = hedge_after_ms if remaining_ms is None else min(hedge_after_ms, max(0, remaining_ms))
+    done, _ = wait(attempts, timeout=first_wait_ms / 1000.0)
+    if not done and not budget.expired(call.deadline) and budget.ledger.exhausted() is None:
+        duplicate = _PooledCall(call, budget)
+        attempts[duplicate.future] = ("duplicate", duplicate)
+
+    pending = set(attempts)
+    first_error: Exception | None = None
+    try:
+        while pending:
+            remaining_ms = budget.remaining_ms(call.deadline)
+            timeout = None if remaining_ms is None else max(0, remaining_ms) / 1000.0
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                raise budget.breach(
+                    task_id=call.task.id,
+                    details=f"deadline exceeded; abandoned in-flight {call.adapter_name} call",
+                )
+            for future in done:
+                try:
+                    output, result = future.result()
+                except Exception as exc:
+                    first_error = first_error or exc
+                    continue
+                if len(attempts) > 1:
+                    _mark_hedged(result, attempts[future][0])
+                return output, result
+    finally:
+        for future in pending:
+            attempts[future][1].abandon()
+    assert first_error is not None
+    raise first_error
+
+
+def _call_adapter_bounded(
+    call: _AdapterCall,
+    budget: BudgetManager,
+    started: _PooledCall | None = None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Run an adapter call (or await an already started one), abandoning it at the deadline."""
+    if started is None:
+        budget.check_spend(task_id=call.task.id, action=f"{call.adapter_name} call")
+        hedge_after_ms = _hedge_delay_ms(call)
+        if hedge_after_ms is not None:
+            return _call_adapter_hedged(call, budget, hedge_after_ms)
+        remaining_ms = budget.remaining_ms(call.deadline)
+        if remaining_ms is None:
+            return _call_adapter(call, budget)
+        if remaining_ms <= 0:
+            raise budget.breach(task_id=call.task.id, details=f"deadline exceeded before calling {call.adapter_name}")
+        started = _PooledCall(call, budget)
+    remaining_ms = budget.remaining_ms(call.deadline)
+    try:
+        return started.future.result(timeout=None if remaining_ms is None else max(0, remaining_ms) / 1000.0)
+    except FuturesTimeoutError as exc:
+        started.abandon()
+        raise budget.breach(
+            task_id=call.task.id,
+            details=f"deadline exceeded; abandoned in-flight {call.adapter_name} call",
+        ) from exc
+
+
+async def _call_adapter_async(call: _AdapterCall, budget: BudgetManager) -> tuple[dict[str, Any], dict[str, Any]]:
+    hedge_after_ms = _hedge_delay_ms(call)
+    if hedge_after_ms is None:
+        return await _call_adapter_async_once(call, budget)
+
+    attempts = {asyncio.ensure_future(_call_adapter_async_once(call, budget)): "primary"}
+    done, _ = await asyncio.wait(attempts, timeout=hedge_after_ms / 1000.0)
+    if not done and not budget.expired(call.deadline) and budget.ledger.exhausted() is None:
+        attempts[asyncio.ensure_future(_call_adapter_async_once(call, budget))] = "duplicate"
+
+    pending = set(attempts)
+    first_error: Exception | None = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                try:
+                    output, result = task.result()
+                except Exception as exc:
+                    first_error = first_error or exc
+                    continue
+                if len(attempts) > 1:
+                    _mark_hedged(result, attempts[task])
+                return output, result
+    finally:
+        for task in pending:
+            task.cancel()
+    assert first_error is not None
+    raise first_error
+
+
+def _abandoned_call_result(call: _AdapterCall, model: Any) -> dict[str, Any]:
+    """Ledger entry for a request cancelled in flight.
+
+    The provider may still bill it and its real usage is never seen, so the
+    call's full ``max_tokens`` is charged as output.
+    """
+    return {
+        "usage": {"tokens_in": 0, "tokens_out": int(call.budget.get("max_tokens") or 0)},
+        "meta": {"model": model},
+    }
+
+
+async def _call_adapter_async_once(
+    call: _AdapterCall, budget: BudgetManager
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    adapter = _AdapterRegistry.get(call.adapter_name)
+    budget.check_spend(task_id=call.task.id, action=f"{call.adapter_name} call")
+    remaining_ms = budget.remaining_ms(call.deadline)
+    if remaining_ms is not None and remaining_ms <= 0:
+        raise budget.breach(task_id=call.task.id, details=f"deadline exceeded before calling {call.adapter_name}")
+    call_start = time.monotonic()
+    model = getattr(adapter, "model", None)
+    batched: Future | None = None
+    if adapter.supports_batch:
+        batched = MICRO_BATCHER.submit(adapter, _adapter_request(call))
+        pending = asyncio.wrap_future(batched)
+    else:
+        if not isinstance(adapter, AsyncBaseAdapter):
+            adapter = SyncAdapterShim(adapter)
+        pending = adapter.arun(**_adapter_request(call))
+    try:
+        if remaining_ms is None:
+            result = await pending
+        else:
+            result = await asyncio.wait_for(pending, timeout=remaining_ms / 1000.0)
+    except asyncio.TimeoutError as exc:
+        budget.ledger.charge(_abandoned_call_result(call, model))
+        raise budget.breach(
+            task_id=call.task.id,
+            details=f"deadline exceeded; cancelled in-flight {call.adapter_name} call",
+        ) from exc
+    except asyncio.CancelledError:
+        if batched is None or not batched.cancelled():
+            budget.ledger.charge(_abandoned_call_result(call, model))
+        raise
+    ADAPTER_LATENCY.record(call.adapter_name, (time.monotonic() - call_start) * 1000.0)
+    budget.ledger.charge(result)
+    return _finish_llm_call(result)
+
+
+def _speculative_next_call(
+    task: Task,
+    adaptive: AdaptiveRoutingPolicy | None,
+    ctx: "_RunContext",
+    *,
+    escalation_step: int,
+    current_stage_token: str,
+    next_stage_token: str | None,
+    base_adapter_name: str,
+    base_budget: dict[str, Any],
+    deadline: float | None,
+) -> _AdapterCall | None:
+    """Prepare the next stage's call when escalation is predicted likely enough to start it early."""
+    if adaptive is None or adaptive.speculative_escalation_threshold is None:
+        return None
+    if next_stage_token is None or escalation_step >= adaptive.max_escalations:
+        return None
+    probability = ESCALATION_STATS.probability(task.type, current_stage_token)
+    if probability is None or probability < adaptive.speculative_escalation_threshold:
+        return None
+    next_adapter = _resolve_escalation_adapter(base_adapter_name, next_stage_token)
+    if next_adapter is None or ctx.budget.ledger.exhausted() is not None:
+        return None
+    if not ctx.budget.can_fit(deadline, ADAPTER_LATENCY.percentile(next_adapter, 0.5)):
+        return None
+    return _prepare_llm_call(task, base_budget=base_budget, deadline=deadline, adapter_override=next_adapter)
+
+
+def _call_sample_batch(
+    batch: _SampleBatch, budget: BudgetManager
+) -> list[tuple[dict[str, Any], dict[str, Any]]]:
+    if not batch.calls:
+        return []
+    first = batch.calls[0]
+    budget.check_spend(task_id=first.task.id, action=f"{first.adapter_name} samples")
+    remaining_ms = budget.remaining_ms(first.deadline)
+    if remaining_ms is not None and remaining_ms <= 0:
+        raise budget.breach(task_id=first.task.id, details=f"deadline exceeded before calling {first.adapter_name}")
+
+    pooled = [_PooledCall(call, budget) for call in batch.calls]
+    futures = {sample.future: index for index, sample in enumerate(pooled)}
+    pending = set(futures)
+    counts: dict[str, int] = {}
+    for digest in batch.seed_hashes:
+        counts[digest] = counts.get(digest, 0) + 1
+    consumed: list[tuple[dict[str, Any], dict[str, Any]]] = []
+    try:
+        while pending:
+            remaining_ms = budget.remaining_ms(first.deadline)
+            timeout = None if remaining_ms is None else max(0.0, remaining_ms / 1000.0)
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                raise budget.breach(
+                    task_id=first.task.id,
+                    details=f"deadline exceeded; abandoned in-flight {first.adapter_name} samples",
+                )
+            for future in sorted(done, key=futures.__getitem__):
+                output, result = future.result()
+                consumed.append((output, result))
+                digest = _output_hash(output)
+                counts[digest] = counts.get(digest, 0) + 1
+            if _majority_decided(counts, len(pending)):
+                break
+    finally:
+        for future in pending:
+            pooled[futures[future]].abandon()
+    return consumed
+
+
+async def _call_sample_batch_async(
+    batch: _SampleBatch, budget: BudgetManager
+) -> list[tuple[dict[str, Any], dict[str, Any]]]:
+    if not batch.calls:
+        return []
+    tasks = {
+        asyncio.ensure_future(_call_adapter_async(call, budget)): index
+        for index, call in enumerate(batch.calls)
+    }
+    pending = set(tasks)
+    counts: dict[str, int] = {}
+    for digest in batch.seed_hashes:
+        counts[digest] = counts.get(digest, 0) + 1
+    consumed: list[tuple[dict[str, Any], dict[str, Any]]] = []
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=tasks.__getitem__):
+                output, result = task.result()
+                consumed.append((output, result))
+                digest = _output_hash(output)
+                counts[digest] = counts.get(digest, 0) + 1
+            if _majority_decided(counts, len(pending)):
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    return consumed
+
+
+def _det_cache_key(task: Task, outputs: dict[str, dict[str, Any]]) -> str:
+    payload = {
+        "handler": task.run.spec.handler,
+        "task_id": task.id,
+        "type": task.type,
+        "in": task.in_,
+        "args": task.run.spec.args,
+        "verify": task.verify.model_dump(mode="json") if task.verify is not None else None,
+        "deps": {dep: outputs.get(dep) for dep in task.deps},
+    }
+    serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _det_process_state(task: Task, outputs: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    return {"outputs": {dep: outputs[dep] for dep in task.deps if dep in outputs}}
+
+
+def _call_det_process(call: _DetCall, budget: BudgetManager, *, retry_broken: bool = True) -> dict[str, Any]:
+    """Run a CPU-bound handler in the det process pool.
+
+    A worker that dies (segfault, OOM kill) breaks the whole pool; the pool
+    is then replaced and the call retried once before the task fails.
+    """
+    pool = _det_process_pool()
+    try:
+        future = pool.submit(call.handler, call.task, call.state)
+        remaining_ms = budget.remaining_ms(call.deadline)
+        return future.result(timeout=None if remaining_ms is None else max(0, remaining_ms) / 1000.0)
+    except FuturesTimeoutError as exc:
+        future.cancel()
+        raise budget.breach(
+            task_id=call.task.id,
+            details=f"deadline exceeded; abandoned {call.task.run.spec.handler} in det process pool",
+        ) from exc
+    except BrokenProcessPool:
+        _discard_det_process_pool(pool)
+        if not retry_broken:
+            raise
+    return _call_det_process(call, budget, retry_broken=False)
+
+
+async def _call_det_process_async(
+    call: _DetCall, budget: BudgetManager, *, retry_broken: bool = True
+) -> dict[str, Any]:
+    pool = _det_process_pool()
+    try:
+        future = asyncio.wrap_future(pool.submit(call.handler, call.task, call.state))
+        remaining_ms = budget.remaining_ms(call.deadline)
+        return await asyncio.wait_for(future, None if remaining_ms is None else max(0, remaining_ms) / 1000.0)
+    except asyncio.TimeoutError as exc:
+        raise budget.breach(
+            task_id=call.task.id,
+            details=f"deadline exceeded; abandoned {call.task.run.spec.handler} in det process pool",
+        ) from exc
+    except BrokenProcessPool:
+        _discard_det_process_pool(pool)
+        if not retry_broken:
+            raise
+    return await _call_det_process_async(call, budget, retry_broken=False)
+
+
 def _task_retrieval_key(task: Task) -> str:
     if task.run.kind != "llm":
         return ""
@@ -360,6 +975,64 @@ def _task_retrieval_key(task: Task) -> str:
     return build_retrieval_key(task.type, adapter_input, task.tags or None)
 
 
+def _task_retrieval_namespace(task: Task) -> str:
+    return build_retrieval_key(task.type, {}, task.tags or None)
+
+
+def _task_retrieval_text(task: Task) -> str:
+    adapter_input = dict(task.run.spec.input) if task.run.kind == "llm" else {}
+    adapter_input.pop("skip_if", None)
+    parts = []
+    for key in sorted(adapter_input):
+        value = adapter_input[key]
+        parts.append(value if isinstance(value, str) else json.dumps(value, sort_keys=True))
+    return "\n".join(parts)
+
+
+def _gate_retrieval_lookup(task: Task, adaptive: AdaptiveRoutingPolicy, meta: dict[str, Any]) -> Any | None:
+    """Return a verified stored output for ``task``, recording lookup details in ``meta``."""
+    retrieval_key = _task_retrieval_key(task)
+    GATE_RETRIEVAL_STORE.configure(max_entries=adaptive.retrieval_max_entries)
+    meta["gate_retrieval_key"] = retrieval_key[:12]
+    meta["gate_retrieval_strategy"] = adaptive.retrieval_strategy
+    retrieved_output = GATE_RETRIEVAL_STORE.get(retrieval_key)
+    if isinstance(retrieved_output, (dict, str)) and _gate_output_verifier_ok(task, retrieved_output):
+        return retrieved_output
+    if adaptive.retrieval_strategy != "semantic":
+        return None
+
+    GATE_SEMANTIC_INDEX.configure(max_entries=adaptive.retrieval_max_entries)
+    match = GATE_SEMANTIC_INDEX.search(
+        _task_retrieval_namespace(task),
+        _task_retrieval_text(task),
+        threshold=adaptive.retrieval_similarity_threshold,
+    )
+    if match is None:
+        return None
+    retrieved_output, similarity = match
+    meta["gate_retrieval_similarity"] = round(similarity, 4)
+    if isinstance(retrieved_output, (dict, str)) and _gate_output_verifier_ok(task, retrieved_output):
+        return retrieved_output
+    return None
+
+
+def _gate_retrieval_store(task: Task, adaptive: AdaptiveRoutingPolicy, output: Any) -> None:
+    GATE_RETRIEVAL_STORE.configure(max_entries=adaptive.retrieval_max_entries)
+    GATE_RETRIEVAL_STORE.put(
+        _task_retrieval_key(task),
+        output,
+        ttl_seconds=adaptive.retrieval_ttl_seconds,
+    )
+    if adaptive.retrieval_strategy == "semantic":
+        GATE_SEMANTIC_INDEX.configure(max_entries=adaptive.retrieval_max_entries)
+        GATE_SEMANTIC_INDEX.add(
+            _task_retrieval_namespace(task),
+            _task_retrieval_text(task),
+            output,
+            ttl_seconds=adaptive.retrieval_ttl_seconds,
+        )
+
+
 def _resolve_escalation_adapter(base_adapter_name: str, stage_token: str) -> str | None:
     if stage_token in _AdapterRegistry.providers:
         return stage_token
@@ -486,75 +1159,121 @@ def _apply_adaptive_confidence_policy(
     meta["stop_reason"] = "escalate_confidence"
 
 
-def run_graph(graph: TaskGraph) -> dict[str, Any]:
-    """Execute a normalized task graph with structured success/failure contracts."""
-    run_start = time.monotonic()
-    outputs: dict[str, dict[str, Any]] = {}
+@dataclass
+class _TaskOutcome:
+    task_id: str
+    output: dict[str, Any] | None
+    events: list[dict[str, Any]]
+    error: KoraRuntimeError | None = None
+
+
+@dataclass
+class _RunContext:
+    """Mutable per-run state shared by every task of one graph execution."""
+
+    outputs: dict[str, dict[str, Any]] = field(default_factory=dict)
+    state: dict[str, Any] = field(default_factory=dict)
+    stage_timings: dict[str, float] = field(default_factory=dict)
+    stage_cost_estimates: dict[str, float] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    plan: ExecutionPlan | None = None
+    budget: BudgetManager = field(default_factory=BudgetManager)
+    fingerprints: dict[str, str] | None = None
+    previous: Mapping[str, Any] | None = None
+    checkpoint: CheckpointSink | None = None
+    graph_id: str = ""
+    retained: frozenset[str] | None = None
+    remaining_uses: list[int] | None = None
+    event_sink: EventSink | None = None
+    keep_events: bool = True
+
+    def __post_init__(self) -> None:
+        self.state["outputs"] = self.outputs
+        self.state["stage_timings"] = self.stage_timings
+        self.state["stage_cost_estimates"] = self.stage_cost_estimates
+
+    def emit(self, event: dict[str, Any]) -> None:
+        """Stream one task event to the event sink, tagged with the graph id."""
+        if self.event_sink is not None:
+            self.event_sink.emit({**event, "graph_id": self.graph_id})
+
+    def record(self, events: list[dict[str, Any]], outcome: _TaskOutcome) -> None:
+        """Add the events of a finished task to the run result unless only the sink wants them."""
+        if self.keep_events:
+            events.extend(outcome.events)
+
+    def publish(self, outcome: _TaskOutcome) -> None:
+        """Stream the events of an outcome that did not run through ``_task_steps``."""
+        for event in outcome.events:
+            self.emit(event)
+
+    def commit(self, outcome: _TaskOutcome) -> None:
+        """Publish a successful task output and persist it to the checkpoint sink."""
+        self.outputs[outcome.task_id] = outcome.output
+        if self.checkpoint is not None and self.fingerprints is not None:
+            self.checkpoint.record(
+                self.graph_id,
+                outcome.task_id,
+                fingerprint=self.fingerprints[outcome.task_id],
+                output=outcome.output,
+                events=outcome.events,
+            )
+        if self.retained is not None:
+            self._release(outcome.task_id)
+
+    def _release(self, task_id: str) -> None:
+        """Drop outputs that no pending dependent needs and that are not retained."""
+        plan = self.plan
+        if self.remaining_uses is None:
+            self.remaining_uses = [len(items) for items in plan.dependents]
+        pos = plan.position[task_id]
+        if self.remaining_uses[pos] == 0 and task_id not in self.retained:
+            self.outputs.pop(task_id, None)
+        for dep_pos in plan.dependencies[pos]:
+            self.remaining_uses[dep_pos] -= 1
+            dep_id = plan.order[dep_pos]
+            if self.remaining_uses[dep_pos] == 0 and dep_id not in self.retained:
+                self.outputs.pop(dep_id, None)
+
+    def add_timing(self, key: str, delta: float) -> None:
+        with self.lock:
+            self.stage_timings[key] = self.stage_timings.get(key, 0.0) + delta
+
+
+_TaskSteps = Generator[_AdapterCall | _SampleBatch | _DetCall, Any, _TaskOutcome]
+
+
+def _task_steps(task: Task, ctx: _RunContext) -> _TaskSteps:
+    """Run one task through its retry loop without committing its output.
+
+    The body is a generator: every adapter invocation is yielded as an
+    ``_AdapterCall`` and the driver sends back ``(output, adapter_result)`` or
+    throws the adapter error in, so the same logic serves sync and async runs.
+    CPU-bound det handlers are yielded as ``_DetCall`` and answered with the
+    handler output.
+    """
     events: list[dict[str, Any]] = []
-    state: dict[str, Any] = {}
-    state["outputs"] = outputs
-    stage_timings: dict[str, float] = {}
-    state["stage_timings"] = stage_timings
-    stage_cost_estimates: dict[str, float] = {}
-    state["stage_cost_estimates"] = stage_cost_estimates
-    order: list[str] = []
-
-    scheduler_start = time.monotonic()
-    try:
-        order = topo_sort(graph)
-        task_map = get_task_map(graph)
-    except Exception as exc:
-        scheduler_delta = time.monotonic() - scheduler_start
-        stage_timings["scheduler_total_s"] = stage_timings.get("scheduler_total_s", 0.0) + scheduler_delta
-        err = KoraRuntimeError(
-            error_type=ErrorType.DAG_INVALID,
-            stage=Stage.SCHEDULER,
-            details=str(exc),
-            retryable=False,
-            budget_breached=False,
-            cause=exc if isinstance(exc, Exception) else None,
-        )
-        result = {
-            "ok": False,
-            "graph_id": graph.graph_id,
-            "order": order,
-            "error": err.to_failure_contract(),
-            "events": events,
-            "outputs": outputs,
-            "final": None,
-        }
-        result["stage_timings"] = stage_timings
-        overall_delta = time.monotonic() - run_start
-        stage_timings["overall_total_s"] = stage_timings.get("overall_total_s", 0.0) + overall_delta
-        return result
-    scheduler_delta = time.monotonic() - scheduler_start
-    stage_timings["scheduler_total_s"] = stage_timings.get("scheduler_total_s", 0.0) + scheduler_delta
-
-    for task_id in order:
-        task = task_map[task_id]
-        retries = task.policy.budget.max_retries if task.policy.budget is not None else 0
-        max_attempts = 1 + max(0, retries)
-        attempt = 0
-
-        while True:
-            attempt += 1
-            start = time.monotonic()
-            stage = Stage.UNKNOWN
-            try:
-                if task.run.kind == "det":
-                    stage = Stage.DETERMINISTIC
-                    det_start = time.monotonic()
-                    output = _run_det_task(task, state)
-                    det_delta = time.monotonic() - det_start
-                    stage_timings["det_total_s"] = stage_timings.get("det_total_s", 0.0) + det_delta
-                    det_verify_schema = task.verify.schema if task.verify is not None else None
-                    if det_verify_schema:
-                        stage = Stage.VERIFY
-                        verify_start = time.monotonic()
-                        verify_output(task, output)
-                        verify_delta = time.monotonic() - verify_start
-                        stage_timings["verify_total_s"] = stage_timings.get("verify_total_s", 0.0) + verify_delta
-                    outputs[task.id] = output
+    task_plan = ctx.plan.tasks[task.id]
+    max_attempts = task_plan.max_attempts
+    deadline = ctx.budget.task_deadline(task_plan.budget.get("max_time_ms"))
+    attempt = 0
+
+    while True:
+        attempt += 1
+        start = time.monotonic()
+        stage = Stage.UNKNOWN
+        try:
+            if ctx.budget.expired(deadline):
+                stage = Stage.BUDGET
+                raise ctx.budget.breach(task_id=task.id, details="deadline exceeded before attempt")
+
+            if task.run.kind == "det":
+                stage = Stage.DETERMINISTIC
+                det_start = time.monotonic()
+                cache_key = _det_cache_key(task, ctx.outputs) if task.run.spec.cacheable else None
+                cached = DET_OUTPUT_CACHE.get(cache_key) if cache_key is not None else None
+                if cached is not None:
+                    ctx.add_timing("det_total_s", time.monotonic() - det_start)
                     events.append(
                         {
                             "task_id": task.id,
@@ -562,390 +1281,1185 @@ def run_graph(graph: TaskGraph) -> dict[str, Any]:
                             "status": "ok",
                             "stage": Stage.DETERMINISTIC.value,
                             "time_ms": int((time.monotonic() - start) * 1000),
+                            "cache_hit": True,
                         }
                     )
-                    break
-
-                if task.run.kind == "llm":
-                    stage = Stage.ADAPTER
-                    if _skip_if_matches(task, outputs):
-                        output = {
-                            "status": "ok",
+                    ctx.emit(events[-1])
+                    return _TaskOutcome(task_id=task.id, output=copy.deepcopy(cached), events=events)
+                handler = _resolve_det_handler(task)
+                if _is_cpu_bound(handler):
+                    output = yield _DetCall(
+                        task=task,
+                        handler=handler,
+                        state=_det_process_state(task, ctx.outputs),
+                        deadline=deadline,
+                    )
+                else:
+                    output = handler(task, ctx.state)
+                det_delta = time.monotonic() - det_start
+                ctx.add_timing("det_total_s", det_delta)
+                det_verify_schema = task.verify.schema if task.verify is not None else None
+                if det_verify_schema:
+                    stage = Stage.VERIFY
+                    verify_start = time.monotonic()
+                    verify_output(task, output)
+                    verify_delta = time.monotonic() - verify_start
+                    ctx.add_timing("verify_total_s", verify_delta)
+                if cache_key is not None:
+                    DET_OUTPUT_CACHE.put(cache_key, copy.deepcopy(output))
+                events.append(
+                    {
+                        "task_id": task.id,
+                        "attempt": attempt,
+                        "status": "ok",
+                        "stage": Stage.DETERMINISTIC.value,
+                        "time_ms": int((time.monotonic() - start) * 1000),
+                    }
+                )
+                ctx.emit(events[-1])
+                return _TaskOutcome(task_id=task.id, output=output, events=events)
+
+            if task.run.kind == "llm":
+                stage = Stage.ADAPTER
+                if _skip_if_matches(task, ctx.outputs):
+                    output = {
+                        "status": "ok",
+                        "task_id": task.id,
+                        "skipped": True,
+                        "message": "Skipped due to skip_if condition",
+                    }
+                    events.append(
+                        {
                             "task_id": task.id,
+                            "attempt": attempt,
+                            "status": "ok",
+                            "stage": Stage.ADAPTER.value,
+                            "time_ms": int((time.monotonic() - start) * 1000),
                             "skipped": True,
-                            "message": "Skipped due to skip_if condition",
                         }
-                        outputs[task.id] = output
-                        events.append(
-                            {
-                                "task_id": task.id,
-                                "attempt": attempt,
-                                "status": "ok",
-                                "stage": Stage.ADAPTER.value,
-                                "time_ms": int((time.monotonic() - start) * 1000),
-                                "skipped": True,
-                            }
+                    )
+                    ctx.emit(events[-1])
+                    return _TaskOutcome(task_id=task.id, output=output, events=events)
+
+                adaptive = task_plan.adaptive
+                escalation_order = list(adaptive.escalation_order) if adaptive is not None else []
+                escalation_step = 0
+                base_adapter_name = task_plan.adapter
+                assert base_adapter_name is not None
+                current_adapter = base_adapter_name
+                current_stage_token = _stage_token_from_adapter_name(current_adapter)
+                llm_events_for_attempt: list[dict[str, Any]] = []
+                speculative_call: _AdapterCall | None = None
+
+                while True:
+                    next_stage_token = (
+                        escalation_order[escalation_step]
+                        if escalation_step < len(escalation_order)
+                        else None
+                    )
+                    llm_start = time.monotonic()
+                    output: dict[str, Any]
+                    adapter_result: dict[str, Any]
+                    if (
+                        adaptive is not None
+                        and adaptive.self_consistency_enabled
+                        and escalation_step == 0
+                    ):
+                        sample_count = max(1, int(adaptive.self_consistency_samples))
+                        reduced_budget = {"max_tokens": int(adaptive.self_consistency_max_tokens)}
+                        output, adapter_result = yield _prepare_llm_call(
+                            task,
+                            base_budget=task_plan.budget,
+                            deadline=deadline,
+                            adapter_override=current_adapter,
+                            budget_override=reduced_budget,
+                            hedge=task_plan.hedge,
                         )
-                        break
-
-                    adaptive = task.policy.adaptive.resolved() if task.policy.adaptive is not None else None
-                    escalation_order = list(adaptive.escalation_order) if adaptive is not None else []
-                    escalation_step = 0
-                    current_adapter = task.run.spec.adapter
-                    current_stage_token = _stage_token_from_adapter_name(current_adapter)
-                    base_adapter_name = task.run.spec.adapter
-                    llm_events_for_attempt: list[dict[str, Any]] = []
-
-                    while True:
-                        next_stage_token = (
-                            escalation_order[escalation_step]
-                            if escalation_step < len(escalation_order)
+                        meta_for_conf = adapter_result.get("meta")
+                        confidence_for_conf = (
+                            meta_for_conf.get("confidence")
+                            if isinstance(meta_for_conf, dict)
                             else None
                         )
-                        llm_start = time.monotonic()
-                        output: dict[str, Any]
-                        adapter_result: dict[str, Any]
-                        if (
-                            adaptive is not None
-                            and adaptive.self_consistency_enabled
-                            and escalation_step == 0
-                        ):
-                            sample_count = max(1, int(adaptive.self_consistency_samples))
-                            reduced_budget = {"max_tokens": int(adaptive.self_consistency_max_tokens)}
-                            output, adapter_result = _run_llm_task(
-                                task,
-                                outputs,
-                                adapter_override=current_adapter,
-                                budget_override=reduced_budget,
-                            )
-                            meta_for_conf = adapter_result.get("meta")
-                            confidence_for_conf = (
-                                meta_for_conf.get("confidence")
-                                if isinstance(meta_for_conf, dict)
-                                else None
-                            )
-                            needs_self_consistency = isinstance(confidence_for_conf, bool) or not isinstance(
-                                confidence_for_conf, (int, float)
-                            )
-                            estimated_next_cost = 1.0
-                            if next_stage_token is not None:
-                                if next_stage_token in adaptive.stage_costs:
-                                    cost_raw = adaptive.stage_costs.get(next_stage_token, 1.0)
-                                else:
-                                    cost_raw = stage_cost_estimates.get(next_stage_token, 1.0)
-                                if (
-                                    isinstance(cost_raw, (int, float))
-                                    and not isinstance(cost_raw, bool)
-                                    and cost_raw > 0
-                                ):
-                                    estimated_next_cost = float(cost_raw)
-
-                            remaining_units: float | None = None
-                            budget = task.policy.budget
-                            if budget is not None:
-                                max_tokens = budget.max_tokens
-                                if isinstance(max_tokens, (int, float)) and not isinstance(max_tokens, bool):
-                                    remaining_units = float(max_tokens)
-                                else:
-                                    max_time_ms = budget.max_time_ms
-                                    if (
-                                        isinstance(max_time_ms, (int, float))
-                                        and not isinstance(max_time_ms, bool)
-                                    ):
-                                        remaining_units = float(max_time_ms)
-
-                            self_consistency_triggered = False
-                            self_consistency_triggered_reason = "high_next_cost"
-                            if not needs_self_consistency:
-                                self_consistency_triggered_reason = "confidence_present"
-                            elif next_stage_token is None:
-                                self_consistency_triggered_reason = "no_next_stage"
-                            elif estimated_next_cost < adaptive.self_consistency_min_next_cost:
-                                self_consistency_triggered_reason = "next_cost_low"
-                            elif (
-                                remaining_units is not None
-                                and remaining_units < adaptive.self_consistency_min_remaining_budget
+                        needs_self_consistency = isinstance(confidence_for_conf, bool) or not isinstance(
+                            confidence_for_conf, (int, float)
+                        )
+                        estimated_next_cost = 1.0
+                        if next_stage_token is not None:
+                            if next_stage_token in adaptive.stage_costs:
+                                cost_raw = adaptive.stage_costs.get(next_stage_token, 1.0)
+                            else:
+                                cost_raw = ctx.stage_cost_estimates.get(next_stage_token, 1.0)
+                            if (
+                                isinstance(cost_raw, (int, float))
+                                and not isinstance(cost_raw, bool)
+                                and cost_raw > 0
                             ):
-                                self_consistency_triggered_reason = "budget_too_low"
+                                estimated_next_cost = float(cost_raw)
+
+                        remaining_units: float | None = None
+                        budget = task.policy.budget
+                        if budget is not None:
+                            max_tokens = budget.max_tokens
+                            if isinstance(max_tokens, (int, float)) and not isinstance(max_tokens, bool):
+                                remaining_units = float(max_tokens)
                             else:
-                                self_consistency_triggered = True
-
-                            consistency_hashes: list[str] = []
-                            if self_consistency_triggered:
-                                serialized = json.dumps(
-                                    output, sort_keys=True, separators=(",", ":"), ensure_ascii=True
-                                )
-                                consistency_hashes.append(
-                                    hashlib.sha256(serialized.encode("utf-8")).hexdigest()
-                                )
-                                for _ in range(sample_count - 1):
-                                    sampled_output, sampled_result = _run_llm_task(
+                                max_time_ms = budget.max_time_ms
+                                if (
+                                    isinstance(max_time_ms, (int, float))
+                                    and not isinstance(max_time_ms, bool)
+                                ):
+                                    remaining_units = float(max_time_ms)
+
+                        self_consistency_triggered = False
+                        self_consistency_triggered_reason = "high_next_cost"
+                        if not needs_self_consistency:
+                            self_consistency_triggered_reason = "confidence_present"
+                        elif next_stage_token is None:
+                            self_consistency_triggered_reason = "no_next_stage"
+                        elif estimated_next_cost < adaptive.self_consistency_min_next_cost:
+                            self_consistency_triggered_reason = "next_cost_low"
+                        elif (
+                            remaining_units is not None
+                            and remaining_units < adaptive.self_consistency_min_remaining_budget
+                        ):
+                            self_consistency_triggered_reason = "budget_too_low"
+                        else:
+                            self_consistency_triggered = True
+
+                        consistency_hashes: list[str] = []
+                        if self_consistency_triggered:
+                            consistency_hashes.append(_output_hash(output))
+                            sampled = yield _SampleBatch(
+                                calls=[
+                                    _prepare_llm_call(
                                         task,
-                                        outputs,
+                                        base_budget=task_plan.budget,
+                                        deadline=deadline,
                                         adapter_override=current_adapter,
                                         budget_override=reduced_budget,
                                     )
+                                    for _ in range(sample_count - 1)
+                                ],
+                                seed_hashes=list(consistency_hashes),
+                            )
+                            counts: dict[str, int] = {consistency_hashes[0]: 1}
+                            for sampled_output, sampled_result in sampled:
+                                digest = _output_hash(sampled_output)
+                                consistency_hashes.append(digest)
+                                counts[digest] = counts.get(digest, 0) + 1
+                            most_common_count = max(counts.values())
+                            majority_hash = next(
+                                digest for digest in consistency_hashes if counts[digest] == most_common_count
+                            )
+                            for sampled_output, sampled_result in reversed(sampled):
+                                if _output_hash(sampled_output) == majority_hash:
                                     output = sampled_output
                                     adapter_result = sampled_result
-                                    sampled_serialized = json.dumps(
-                                        sampled_output, sort_keys=True, separators=(",", ":"), ensure_ascii=True
-                                    )
-                                    consistency_hashes.append(
-                                        hashlib.sha256(sampled_serialized.encode("utf-8")).hexdigest()
-                                    )
-                                counts: dict[str, int] = {}
-                                for digest in consistency_hashes:
-                                    counts[digest] = counts.get(digest, 0) + 1
-                                most_common_count = max(counts.values()) if counts else 1
-                                disagreement = 1.0 - (most_common_count / float(len(consistency_hashes)))
-
-                            final_meta = adapter_result.get("meta")
-                            if not isinstance(final_meta, dict):
-                                final_meta = {}
-                                adapter_result["meta"] = final_meta
-                            final_meta["self_consistency_triggered"] = self_consistency_triggered
-                            final_meta["self_consistency_triggered_reason"] = (
-                                self_consistency_triggered_reason
-                            )
-                            if self_consistency_triggered:
-                                final_meta["self_consistency_samples"] = len(consistency_hashes)
-                                final_meta["self_consistency_disagreement"] = disagreement
-                                existing_uncertainty = final_meta.get("uncertainty")
-                                if (
-                                    isinstance(existing_uncertainty, (int, float))
-                                    and not isinstance(existing_uncertainty, bool)
-                                ):
-                                    final_meta["uncertainty"] = max(float(existing_uncertainty), disagreement)
-                                else:
-                                    final_meta["uncertainty"] = disagreement
+                                    break
+                            disagreement = 1.0 - (most_common_count / float(len(consistency_hashes)))
+
+                        final_meta = adapter_result.get("meta")
+                        if not isinstance(final_meta, dict):
+                            final_meta = {}
+                            adapter_result["meta"] = final_meta
+                        final_meta["self_consistency_triggered"] = self_consistency_triggered
+                        final_meta["self_consistency_triggered_reason"] = (
+                            self_consistency_triggered_reason
+                        )
+                        if self_consistency_triggered:
+                            final_meta["self_consistency_samples"] = len(consistency_hashes)
+                            final_meta["self_consistency_samples_requested"] = sample_count
+                            final_meta["self_consistency_disagreement"] = disagreement
+                            existing_uncertainty = final_meta.get("uncertainty")
+                            if (
+                                isinstance(existing_uncertainty, (int, float))
+                                and not isinstance(existing_uncertainty, bool)
+                            ):
+                                final_meta["uncertainty"] = max(float(existing_uncertainty), disagreement)
+                            else:
+                                final_meta["uncertainty"] = disagreement
+                    else:
+                        if speculative_call is not None and speculative_call.adapter_name == current_adapter:
+                            call = speculative_call
                         else:
-                            output, adapter_result = _run_llm_task(
+                            call = _prepare_llm_call(
                                 task,
-                                outputs,
+                                base_budget=task_plan.budget,
+                                deadline=deadline,
                                 adapter_override=current_adapter,
+                                hedge=task_plan.hedge,
                             )
-                        llm_delta = time.monotonic() - llm_start
-                        stage_timings["llm_total_s"] = stage_timings.get("llm_total_s", 0.0) + llm_delta
-                        usage = adapter_result.get("usage")
-                        cost_units: float | None = None
-                        if isinstance(usage, dict):
-                            tokens_in = usage.get("tokens_in")
-                            tokens_out = usage.get("tokens_out")
-                            if (
-                                isinstance(tokens_in, (int, float))
-                                and not isinstance(tokens_in, bool)
-                                and isinstance(tokens_out, (int, float))
-                                and not isinstance(tokens_out, bool)
-                            ):
-                                cost_units = float(tokens_in) + float(tokens_out)
-                            else:
-                                time_ms = usage.get("time_ms")
-                                if isinstance(time_ms, (int, float)) and not isinstance(time_ms, bool):
-                                    cost_units = float(time_ms)
-
-                        meta = adapter_result.get("meta")
-                        if not isinstance(meta, dict):
-                            meta = {}
-                            adapter_result["meta"] = meta
-                        meta["cost_units"] = cost_units
-
-                        if cost_units is not None:
-                            stage_token_key = current_stage_token
-                            old_est = stage_cost_estimates.get(stage_token_key, 1.0)
-                            stage_cost_estimates[stage_token_key] = 0.3 * cost_units + (1.0 - 0.3) * old_est
-
-                        _apply_adaptive_confidence_policy(
-                            adaptive,
+                        used_speculation = call is speculative_call
+                        speculative_call = _speculative_next_call(
                             task,
-                            adapter_result,
-                            next_stage_token,
-                            stage_cost_estimates,
+                            adaptive,
+                            ctx,
+                            escalation_step=escalation_step,
+                            current_stage_token=current_stage_token,
+                            next_stage_token=next_stage_token,
+                            base_adapter_name=base_adapter_name,
+                            base_budget=task_plan.budget,
+                            deadline=deadline,
                         )
+                        call.speculative = speculative_call
+                        output, adapter_result = yield call
+                        if used_speculation:
+                            adapter_result.setdefault("meta", {})["speculative"] = True
+                        if speculative_call is not None:
+                            adapter_result.setdefault("meta", {})["speculated_next_stage"] = next_stage_token
+                    llm_delta = time.monotonic() - llm_start
+                    ctx.add_timing("llm_total_s", llm_delta)
+                    usage = adapter_result.get("usage")
+                    cost_units: float | None = None
+                    if isinstance(usage, dict):
+                        tokens_in = usage.get("tokens_in")
+                        tokens_out = usage.get("tokens_out")
+                        if (
+                            isinstance(tokens_in, (int, float))
+                            and not isinstance(tokens_in, bool)
+                            and isinstance(tokens_out, (int, float))
+                            and not isinstance(tokens_out, bool)
+                        ):
+                            cost_units = float(tokens_in) + float(tokens_out)
+                        else:
+                            time_ms = usage.get("time_ms")
+                            if isinstance(time_ms, (int, float)) and not isinstance(time_ms, bool):
+                                cost_units = float(time_ms)
+
+                    meta = adapter_result.get("meta")
+                    if not isinstance(meta, dict):
+                        meta = {}
+                        adapter_result["meta"] = meta
+                    meta["cost_units"] = cost_units
+
+                    if cost_units is not None:
+                        stage_token_key = current_stage_token
+                        with ctx.lock:
+                            old_est = ctx.stage_cost_estimates.get(stage_token_key, 1.0)
+                            ctx.stage_cost_estimates[stage_token_key] = 0.3 * cost_units + (1.0 - 0.3) * old_est
+
+                    _apply_adaptive_confidence_policy(
+                        adaptive,
+                        task,
+                        adapter_result,
+                        next_stage_token,
+                        ctx.stage_cost_estimates,
+                    )
 
-                        if current_stage_token == "gate":
-                            verifier_ok = _gate_output_verifier_ok(task, output)
-                            meta["gate_verifier_ok"] = verifier_ok
-                            if verifier_ok:
+                    if current_stage_token == "gate":
+                        verifier_ok = _gate_output_verifier_ok(task, output)
+                        meta["gate_verifier_ok"] = verifier_ok
+                        if verifier_ok:
+                            meta["escalate_recommended"] = False
+                            meta["stop_reason"] = "accepted_gate_verified"
+                        else:
+                            if next_stage_token is None:
                                 meta["escalate_recommended"] = False
-                                meta["stop_reason"] = "accepted_gate_verified"
-                            else:
-                                if next_stage_token is None:
+                                meta["stop_reason"] = "gate_verifier_failed_no_next_stage"
+                            elif adaptive is not None and adaptive.enable_gate_retrieval:
+                                retrieved_output = _gate_retrieval_lookup(task, adaptive, meta)
+                                if retrieved_output is not None:
+                                    output = retrieved_output
+                                    meta["gate_retrieval_hit"] = True
                                     meta["escalate_recommended"] = False
-                                    meta["stop_reason"] = "gate_verifier_failed_no_next_stage"
-                                elif adaptive is not None and adaptive.enable_gate_retrieval:
-                                    retrieval_key = _task_retrieval_key(task)
-                                    GATE_RETRIEVAL_STORE.configure(
-                                        max_entries=adaptive.retrieval_max_entries
-                                    )
-                                    meta["gate_retrieval_key"] = retrieval_key[:12]
-                                    meta["gate_retrieval_strategy"] = adaptive.retrieval_strategy
-                                    retrieved_output = GATE_RETRIEVAL_STORE.get(retrieval_key)
-                                    if isinstance(retrieved_output, (dict, str)) and _gate_output_verifier_ok(
-                                        task, retrieved_output
-                                    ):
-                                        output = retrieved_output
-                                        meta["gate_retrieval_hit"] = True
-                                        meta["escalate_recommended"] = False
-                                        meta["stop_reason"] = "accepted_gate_retrieval"
-                                    else:
-                                        meta["gate_retrieval_hit"] = False
-                                        meta["escalate_recommended"] = True
-                                        meta["stop_reason"] = "escalate_gate_retrieval_miss_or_invalid"
+                                    meta["stop_reason"] = "accepted_gate_retrieval"
                                 else:
+                                    meta["gate_retrieval_hit"] = False
                                     meta["escalate_recommended"] = True
-                                    meta["stop_reason"] = "escalate_gate_verifier_failed"
+                                    meta["stop_reason"] = "escalate_gate_retrieval_miss_or_invalid"
+                            else:
+                                meta["escalate_recommended"] = True
+                                meta["stop_reason"] = "escalate_gate_verifier_failed"
+
+                    if (
+                        adaptive is not None
+                        and adaptive.enable_gate_retrieval
+                        and current_stage_token == "full"
+                        and _gate_output_verifier_ok(task, output)
+                    ):
+                        _gate_retrieval_store(task, adaptive, output)
+
+                    llm_events_for_attempt.append(
+                        {
+                            "task_id": task.id,
+                            "attempt": attempt,
+                            "escalation_step": escalation_step,
+                            "status": "ok",
+                            "stage": Stage.ADAPTER.value,
+                            "time_ms": int(llm_delta * 1000),
+                            "usage": adapter_result.get("usage", {}),
+                            "meta": adapter_result.get("meta", {}),
+                        }
+                    )
+                    ctx.emit(llm_events_for_attempt[-1])
 
-                        if (
-                            adaptive is not None
-                            and adaptive.enable_gate_retrieval
-                            and current_stage_token == "full"
-                            and _gate_output_verifier_ok(task, output)
-                        ):
-                            retrieval_key = _task_retrieval_key(task)
-                            GATE_RETRIEVAL_STORE.configure(max_entries=adaptive.retrieval_max_entries)
-                            GATE_RETRIEVAL_STORE.put(
-                                retrieval_key,
-                                output,
-                                ttl_seconds=adaptive.retrieval_ttl_seconds,
-                            )
+                    meta = adapter_result.get("meta", {})
+                    should_escalate = bool(isinstance(meta, dict) and meta.get("escalate_recommended"))
+                    ESCALATION_STATS.record(task.type, current_stage_token, should_escalate)
+                    if not should_escalate:
+                        break
 
-                        llm_events_for_attempt.append(
-                            {
-                                "task_id": task.id,
-                                "attempt": attempt,
-                                "escalation_step": escalation_step,
-                                "status": "ok",
-                                "stage": Stage.ADAPTER.value,
-                                "time_ms": int(llm_delta * 1000),
-                                "usage": adapter_result.get("usage", {}),
-                                "meta": adapter_result.get("meta", {}),
-                            }
-                        )
+                    if adaptive is None:
+                        break
 
-                        meta = adapter_result.get("meta", {})
-                        should_escalate = bool(isinstance(meta, dict) and meta.get("escalate_recommended"))
-                        if not should_escalate:
-                            break
+                    if escalation_step >= adaptive.max_escalations:
+                        if isinstance(meta, dict):
+                            meta["stop_reason"] = "max_escalations"
+                            meta["escalate_recommended"] = False
+                        break
 
-                        if adaptive is None:
-                            break
+                    if escalation_step >= len(escalation_order):
+                        if isinstance(meta, dict):
+                            meta["stop_reason"] = "escalation_adapter_missing"
+                            meta["escalate_recommended"] = False
+                        break
 
-                        if escalation_step >= adaptive.max_escalations:
-                            if isinstance(meta, dict):
-                                meta["stop_reason"] = "max_escalations"
-                                meta["escalate_recommended"] = False
-                            break
+                    stage_token = escalation_order[escalation_step]
+                    next_adapter = _resolve_escalation_adapter(base_adapter_name, stage_token)
+                    if next_adapter is None:
+                        if isinstance(meta, dict):
+                            meta["stop_reason"] = "escalation_adapter_missing"
+                            meta["escalate_recommended"] = False
+                        break
 
-                        if escalation_step >= len(escalation_order):
-                            if isinstance(meta, dict):
-                                meta["stop_reason"] = "escalation_adapter_missing"
-                                meta["escalate_recommended"] = False
-                            break
+                    if not ctx.budget.can_fit(deadline, ADAPTER_LATENCY.percentile(next_adapter, 0.5)):
+                        if isinstance(meta, dict):
+                            meta["stop_reason"] = "deadline_insufficient"
+                            meta["escalate_recommended"] = False
+                        break
 
-                        stage_token = escalation_order[escalation_step]
-                        next_adapter = _resolve_escalation_adapter(base_adapter_name, stage_token)
-                        if next_adapter is None:
-                            if isinstance(meta, dict):
-                                meta["stop_reason"] = "escalation_adapter_missing"
-                                meta["escalate_recommended"] = False
-                            break
+                    if ctx.budget.ledger.exhausted() is not None:
+                        if isinstance(meta, dict):
+                            meta["stop_reason"] = "graph_budget_exhausted"
+                            meta["escalate_recommended"] = False
+                        break
 
-                        escalation_step += 1
-                        current_adapter = next_adapter
-                        current_stage_token = stage_token
+                    escalation_step += 1
+                    current_adapter = next_adapter
+                    current_stage_token = stage_token
+
+                stage = Stage.VERIFY
+                verify_start = time.monotonic()
+                verify_output(task, output)
+                verify_delta = time.monotonic() - verify_start
+                ctx.add_timing("verify_total_s", verify_delta)
+                events.extend(llm_events_for_attempt)
+                return _TaskOutcome(task_id=task.id, output=output, events=events)
+
+            raise KoraRuntimeError(
+                error_type=ErrorType.INVALID_TASK,
+                stage=Stage.IR,
+                details=f"run.kind '{task.run.kind}' not implemented in v0.1",
+                task_id=task.id,
+                retryable=False,
+                budget_breached=False,
+            )
+
+        except Exception as exc:
+            if isinstance(exc, KoraRuntimeError):
+                runtime_error = exc
+            else:
+                message = str(exc)
+                budget_breached = "budget" in message.lower()
+                if stage == Stage.VERIFY:
+                    error_type = ErrorType.OUTPUT_SCHEMA_INVALID
+                elif stage == Stage.DETERMINISTIC:
+                    error_type = ErrorType.DETERMINISTIC_EXEC_FAILED
+                elif stage == Stage.ADAPTER:
+                    error_type = ErrorType.BUDGET_BREACH if budget_breached else ErrorType.ADAPTER_FAILED
+                else:
+                    error_type = ErrorType.UNKNOWN
 
-                    stage = Stage.VERIFY
-                    verify_start = time.monotonic()
-                    verify_output(task, output)
-                    verify_delta = time.monotonic() - verify_start
-                    stage_timings["verify_total_s"] = stage_timings.get("verify_total_s", 0.0) + verify_delta
-                    outputs[task.id] = output
-                    events.extend(llm_events_for_attempt)
-                    break
+                runtime_error = KoraRuntimeError(
+                    error_type=error_type,
+                    stage=stage,
+                    details=message,
+                    task_id=task.id,
+                    retryable=(task.policy.on_fail == "retry" and attempt < max_attempts),
+                    budget_breached=budget_breached,
+                    cause=exc if isinstance(exc, Exception) else None,
+                )
 
-                raise KoraRuntimeError(
-                    error_type=ErrorType.INVALID_TASK,
-                    stage=Stage.IR,
-                    details=f"run.kind '{task.run.kind}' not implemented in v0.1",
+            events.append(
+                {
+                    "task_id": task.id,
+                    "attempt": attempt,
+                    "status": "fail",
+                    "stage": runtime_error.stage.value,
+                    "time_ms": int((time.monotonic() - start) * 1000),
+                    "error": runtime_error.to_failure_contract(),
+                }
+            )
+            ctx.emit(events[-1])
+
+            if task.policy.on_fail == "retry" and attempt < max_attempts and runtime_error.stage != Stage.BUDGET:
+                continue
+
+            if task.policy.on_fail == "escalate":
+                runtime_error = KoraRuntimeError(
+                    error_type=ErrorType.ESCALATE_REQUIRED,
+                    stage=runtime_error.stage,
+                    details=runtime_error.details,
                     task_id=task.id,
                     retryable=False,
-                    budget_breached=False,
+                    budget_breached=runtime_error.budget_breached,
+                    cause=runtime_error,
                 )
 
+            return _TaskOutcome(task_id=task.id, output=None, events=events, error=runtime_error)
+
+
+
+def _drive_task(task: Task, ctx: _RunContext) -> _TaskOutcome:
+    steps = _task_steps(task, ctx)
+    reply: Any = None
+    error: Exception | None = None
+    speculative: dict[_AdapterCall, _PooledCall] = {}
+    try:
+        while True:
+            try:
+                call = steps.throw(error) if error is not None else steps.send(reply)
+            except StopIteration as stop:
+                return stop.value
+            started = speculative.pop(call, None) if isinstance(call, _AdapterCall) else None
+            for stale in speculative.values():
+                stale.abandon()
+            speculative.clear()
+            try:
+                if isinstance(call, _SampleBatch):
+                    reply, error = _call_sample_batch(call, ctx.budget), None
+                    continue
+                if isinstance(call, _DetCall):
+                    reply, error = _call_det_process(call, ctx.budget), None
+                    continue
+                if call.speculative is not None:
+                    speculative[call.speculative] = _PooledCall(call.speculative, ctx.budget)
+                reply, error = _call_adapter_bounded(call, ctx.budget, started), None
             except Exception as exc:
-                if isinstance(exc, KoraRuntimeError):
-                    runtime_error = exc
-                else:
-                    message = str(exc)
-                    budget_breached = "budget" in message.lower()
-                    if stage == Stage.VERIFY:
-                        error_type = ErrorType.OUTPUT_SCHEMA_INVALID
-                    elif stage == Stage.DETERMINISTIC:
-                        error_type = ErrorType.DETERMINISTIC_EXEC_FAILED
-                    elif stage == Stage.ADAPTER:
-                        error_type = ErrorType.BUDGET_BREACH if budget_breached else ErrorType.ADAPTER_FAILED
-                    else:
-                        error_type = ErrorType.UNKNOWN
-
-                    runtime_error = KoraRuntimeError(
-                        error_type=error_type,
-                        stage=stage,
-                        details=message,
-                        task_id=task.id,
-                        retryable=(task.policy.on_fail == "retry" and attempt < max_attempts),
-                        budget_breached=budget_breached,
-                        cause=exc if isinstance(exc, Exception) else None,
-                    )
+                reply, error = None, exc
+    finally:
+        for stale in speculative.values():
+            stale.abandon()
 
-                events.append(
-                    {
-                        "task_id": task.id,
-                        "attempt": attempt,
-                        "status": "fail",
-                        "stage": runtime_error.stage.value,
-                        "time_ms": int((time.monotonic() - start) * 1000),
-                        "error": runtime_error.to_failure_contract(),
-                    }
-                )
 
-                if task.policy.on_fail == "retry" and attempt < max_attempts:
+async def _drive_task_async(task: Task, ctx: _RunContext) -> _TaskOutcome:
+    steps = _task_steps(task, ctx)
+    reply: Any = None
+    error: Exception | None = None
+    speculative: dict[_AdapterCall, asyncio.Task] = {}
+    try:
+        while True:
+            try:
+                call = steps.throw(error) if error is not None else steps.send(reply)
+            except StopIteration as stop:
+                return stop.value
+            started = speculative.pop(call, None) if isinstance(call, _AdapterCall) else None
+            await _cancel_speculative(speculative)
+            try:
+                if isinstance(call, _SampleBatch):
+                    reply, error = await _call_sample_batch_async(call, ctx.budget), None
                     continue
+                if isinstance(call, _DetCall):
+                    reply, error = await _call_det_process_async(call, ctx.budget), None
+                    continue
+                if call.speculative is not None:
+                    pending = asyncio.ensure_future(_call_adapter_async(call.speculative, ctx.budget))
+                    pending.add_done_callback(lambda done: done.cancelled() or done.exception())
+                    speculative[call.speculative] = pending
+                if started is not None:
+                    reply, error = await started, None
+                else:
+                    reply, error = await _call_adapter_async(call, ctx.budget), None
+            except Exception as exc:
+                reply, error = None, exc
+    finally:
+        await _cancel_speculative(speculative)
+
+
+async def _cancel_speculative(speculative: dict[_AdapterCall, asyncio.Task]) -> None:
+    """Cancel discarded speculative stages and wait until each has charged the ledger."""
+    stale = list(speculative.values())
+    speculative.clear()
+    for pending in stale:
+        pending.cancel()
+    if stale:
+        await asyncio.gather(*stale, return_exceptions=True)
+
+
+class _SingleFlight:
+    """In-flight LLM task executions that identical concurrent tasks can wait on."""
+
+    def __init__(self) -> None:
+        self._flights: dict[tuple[str, str, str, str], Future] = {}
+        self._lock = threading.Lock()
+
+    def join(self, key: tuple[str, str, str, str]) -> tuple[Future, bool]:
+        """Return the flight for ``key`` and whether the caller leads it."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                return flight, False
+            flight = Future()
+            self._flights[key] = flight
+            return flight, True
+
+    def finish(self, key: tuple[str, str, str, str], flight: Future, outcome: _TaskOutcome | None) -> None:
+        """Publish the leader's outcome; followers of a failed leader run on their own."""
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        flight.set_result(outcome if outcome is not None and outcome.error is None else None)
+
+
+SINGLE_FLIGHT = _SingleFlight()
+
+
+def _coalesce_key(task: Task, ctx: _RunContext) -> tuple[str, str, str, str] | None:
+    """Single-flight key for opted-in llm tasks.
+
+    Tasks share one execution only when their ids, inputs, adapter, output
+    and verify specs and effective policy all match, so a follower never
+    receives an output produced under a different schema or budget.
+    """
+    if task.run.kind != "llm" or not task.policy.coalesce or "skip_if" in task.run.spec.input:
+        return None
+    payload = {
+        "type": task.type,
+        "output_schema": task.run.spec.output_schema,
+        "verify": task.verify.model_dump(mode="json") if task.verify is not None else None,
+        "policy": task.policy.model_dump(mode="json", exclude={"budget", "coalesce"}),
+        "budget": ctx.plan.tasks[task.id].budget,
+    }
+    serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True, default=str)
+    spec_hash = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+    return (_task_retrieval_key(task), task.id, task.run.spec.adapter, spec_hash)
 
-                if task.policy.on_fail == "escalate":
-                    runtime_error = KoraRuntimeError(
-                        error_type=ErrorType.ESCALATE_REQUIRED,
-                        stage=runtime_error.stage,
-                        details=runtime_error.details,
-                        task_id=task.id,
-                        retryable=False,
-                        budget_breached=runtime_error.budget_breached,
-                        cause=runtime_error,
-                    )
 
-                result = {
-                    "ok": False,
-                    "graph_id": graph.graph_id,
-                    "order": order,
-                    "error": runtime_error.to_failure_contract(),
-                    "events": events,
-                    "outputs": outputs,
-                    "final": None,
-                }
-                result["stage_timings"] = stage_timings
-                overall_delta = time.monotonic() - run_start
-                stage_timings["overall_total_s"] = stage_timings.get("overall_total_s", 0.0) + overall_delta
-                return result
-
-    final_output = outputs.get(graph.root)
-    result = {
-        "ok": True,
-        "graph_id": graph.graph_id,
-        "order": order,
-        "events": events,
-        "outputs": outputs,
-        "final": final_output,
+def _coalesced_outcome(task: Task, shared: _TaskOutcome, waited_s: float) -> _TaskOutcome:
+    events: list[dict[str, Any]] = []
+    if shared.events:
+        event = dict(shared.events[-1])
+        event.update({"attempt": 1, "time_ms": int(waited_s * 1000), "usage": {}, "coalesced": True})
+        events.append(event)
+    return _TaskOutcome(task_id=task.id, output=copy.deepcopy(shared.output), events=events)
+
+
+def _flight_timeout_s(task: Task, ctx: _RunContext) -> float | None:
+    deadline = ctx.budget.task_deadline(ctx.plan.tasks[task.id].budget.get("max_time_ms"))
+    remaining_ms = ctx.budget.remaining_ms(deadline)
+    return None if remaining_ms is None else max(0, remaining_ms) / 1000.0
+
+
+def _task_fingerprint(task: Task, outputs: dict[str, dict[str, Any]]) -> str:
+    """Hash a task's own definition together with the outputs of its dependencies."""
+    payload = {
+        "task": task.model_dump(mode="json", by_alias=True),
+        "deps": {dep: _output_hash(outputs.get(dep)) for dep in task.deps},
     }
-    result["stage_timings"] = stage_timings
-    overall_delta = time.monotonic() - run_start
-    stage_timings["overall_total_s"] = stage_timings.get("overall_total_s", 0.0) + overall_delta
+    serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _reused_outcome(task: Task, ctx: _RunContext) -> _TaskOutcome | None:
+    """Record the task fingerprint and reuse the previous output when it is unchanged."""
+    if ctx.fingerprints is None:
+        return None
+    fingerprint = _task_fingerprint(task, ctx.outputs)
+    with ctx.lock:
+        ctx.fingerprints[task.id] = fingerprint
+    previous = ctx.previous
+    if previous is None or (previous.get("fingerprints") or {}).get(task.id) != fingerprint:
+        return None
+    previous_outputs = previous.get("outputs") or {}
+    if task.id not in previous_outputs:
+        return None
+    event: dict[str, Any] = {"task_id": task.id, "status": "ok"}
+    for previous_event in reversed(previous.get("events") or []):
+        if previous_event.get("task_id") == task.id:
+            event = dict(previous_event)
+            break
+    event.update({"attempt": 1, "time_ms": 0, "usage": {}, "reused": True})
+    return _TaskOutcome(task_id=task.id, output=previous_outputs[task.id], events=[event])
+
+
+def _execute_task(task: Task, ctx: _RunContext) -> _TaskOutcome:
+    reused = _reused_outcome(task, ctx)
+    if reused is not None:
+        ctx.publish(reused)
+        return reused
+    key = _coalesce_key(task, ctx)
+    if key is None:
+        return _drive_task(task, ctx)
+    flight, leader = SINGLE_FLIGHT.join(key)
+    if not leader:
+        start = time.monotonic()
+        try:
+            shared = flight.result(timeout=_flight_timeout_s(task, ctx))
+        except FuturesTimeoutError:
+            shared = None
+        if shared is not None:
+            coalesced = _coalesced_outcome(task, shared, time.monotonic() - start)
+            ctx.publish(coalesced)
+            return coalesced
+        return _drive_task(task, ctx)
+
+    outcome: _TaskOutcome | None = None
+    try:
+        outcome = _drive_task(task, ctx)
+        return outcome
+    finally:
+        SINGLE_FLIGHT.finish(key, flight, outcome)
+
+
+async def _execute_task_async(task: Task, ctx: _RunContext) -> _TaskOutcome:
+    reused = _reused_outcome(task, ctx)
+    if reused is not None:
+        ctx.publish(reused)
+        return reused
+    key = _coalesce_key(task, ctx)
+    if key is None:
+        return await _drive_task_async(task, ctx)
+    flight, leader = SINGLE_FLIGHT.join(key)
+    if not leader:
+        start = time.monotonic()
+        try:
+            shared = await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(flight)),
+                timeout=_flight_timeout_s(task, ctx),
+            )
+        except asyncio.TimeoutError:
+            shared = None
+        if shared is not None:
+            coalesced = _coalesced_outcome(task, shared, time.monotonic() - start)
+            ctx.publish(coalesced)
+            return coalesced
+        return await _drive_task_async(task, ctx)
+
+    outcome: _TaskOutcome | None = None
+    try:
+        outcome = await _drive_task_async(task, ctx)
+        return outcome
+    finally:
+        SINGLE_FLIGHT.finish(key, flight, outcome)
+
+
+class _DagFrontier:
+    """Dependency bookkeeping shared by the concurrent schedulers.
+
+    Outputs are committed as soon as a task completes so its dependents can be
+    released. Once a task fails nothing new becomes ready; in-flight tasks are
+    drained and their outputs kept. With ``event_order="topo"`` events are
+    emitted in topological order and the reported error is the failure that
+    comes first in that order, which makes results independent of timing for
+    graphs that succeed.
+    """
+
+    def __init__(
+        self,
+        plan: ExecutionPlan,
+        ctx: _RunContext,
+        events: list[dict[str, Any]],
+        event_order: str,
+    ) -> None:
+        self.order = plan.order
+        self.position = plan.position
+        self.dependents = plan.dependents
+        self.ctx = ctx
+        self.events = events
+        self.event_order = event_order
+        self.remaining_deps = list(plan.dep_counts)
+        self.ready: list[str] = [task_id for pos, task_id in enumerate(self.order) if self.remaining_deps[pos] == 0]
+        self.outcomes: dict[str, _TaskOutcome] = {}
+        self.failures: list[_TaskOutcome] = []
+
+    def take_ready(self) -> list[str]:
+        ready, self.ready = self.ready, []
+        return [] if self.failures else ready
+
+    def commit(self, outcome: _TaskOutcome) -> None:
+        self.outcomes[outcome.task_id] = outcome
+        if self.event_order == "completion":
+            self.ctx.record(self.events, outcome)
+        if outcome.error is not None:
+            self.failures.append(outcome)
+            return
+        self.ctx.commit(outcome)
+        for nxt in self.dependents[self.position[outcome.task_id]]:
+            self.remaining_deps[nxt] -= 1
+            if self.remaining_deps[nxt] == 0:
+                self.ready.append(self.order[nxt])
+        self.ready.sort(key=self.position.__getitem__)
+
+    def finish(self) -> KoraRuntimeError | None:
+        if self.event_order != "completion":
+            for task_id in self.order:
+                if task_id in self.outcomes:
+                    self.ctx.record(self.events, self.outcomes[task_id])
+            self.failures.sort(key=lambda item: self.position[item.task_id])
+        return self.failures[0].error if self.failures else None
+
+
+def _run_tasks_sequential(
+    order: list[str],
+    task_map: dict[str, Task],
+    ctx: _RunContext,
+    events: list[dict[str, Any]],
+) -> KoraRuntimeError | None:
+    for task_id in order:
+        outcome = _execute_task(task_map[task_id], ctx)
+        ctx.record(events, outcome)
+        if outcome.error is not None:
+            return outcome.error
+        ctx.commit(outcome)
+    return None
+
+
+def _run_tasks_parallel(
+    task_map: dict[str, Task],
+    ctx: _RunContext,
+    events: list[dict[str, Any]],
+    *,
+    max_workers: int,
+    event_order: str,
+) -> KoraRuntimeError | None:
+    """Dispatch every dependency-satisfied task to a bounded thread pool."""
+    frontier = _DagFrontier(ctx.plan, ctx, events, event_order)
+    pending: dict[Future[_TaskOutcome], str] = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, int(max_workers)), thread_name_prefix="kora-task") as pool:
+        while True:
+            for task_id in frontier.take_ready():
+                pending[pool.submit(_execute_task, task_map[task_id], ctx)] = task_id
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda item: frontier.position[pending[item]]):
+                del pending[future]
+                frontier.commit(future.result())
+
+    return frontier.finish()
+
+
+async def _run_tasks_async(
+    task_map: dict[str, Task],
+    ctx: _RunContext,
+    events: list[dict[str, Any]],
+    *,
+    max_concurrency: int | None,
+    event_order: str,
+) -> KoraRuntimeError | None:
+    """Asyncio counterpart of ``_run_tasks_parallel`` with identical commit rules."""
+    frontier = _DagFrontier(ctx.plan, ctx, events, event_order)
+    pending: dict[asyncio.Future[_TaskOutcome], str] = {}
+    semaphore = asyncio.Semaphore(max(1, int(max_concurrency))) if max_concurrency else None
+
+    async def _bounded(task: Task) -> _TaskOutcome:
+        if semaphore is None:
+            return await _execute_task_async(task, ctx)
+        async with semaphore:
+            return await _execute_task_async(task, ctx)
+
+    while True:
+        for task_id in frontier.take_ready():
+            pending[asyncio.ensure_future(_bounded(task_map[task_id]))] = task_id
+        if not pending:
+            break
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for future in sorted(done, key=lambda item: frontier.position[pending[item]]):
+            del pending[future]
+            frontier.commit(future.result())
+
+    return frontier.finish()
+
+
+def _schedule(graph: TaskGraph, ctx: _RunContext) -> tuple[list[str], dict[str, Task]]:
+    scheduler_start = time.monotonic()
+    try:
+        plan = compile_plan(graph)
+    except Exception as exc:
+        ctx.add_timing("scheduler_total_s", time.monotonic() - scheduler_start)
+        raise KoraRuntimeError(
+            error_type=ErrorType.DAG_INVALID,
+            stage=Stage.SCHEDULER,
+            details=str(exc),
+            retryable=False,
+            budget_breached=False,
+            cause=exc if isinstance(exc, Exception) else None,
+        ) from exc
+    ctx.plan = plan
+    task_map = {task_id: graph.tasks[task_plan.index] for task_id, task_plan in plan.tasks.items()}
+    ctx.add_timing("scheduler_total_s", time.monotonic() - scheduler_start)
+    return list(plan.order), task_map
+
+
+def _retained_ids(graph: TaskGraph, retain: Literal["root", "all"] | Iterable[str]) -> frozenset[str] | None:
+    if retain == "all":
+        return None
+    if retain == "root":
+        return frozenset([graph.root])
+    if isinstance(retain, str):
+        raise ValueError(f"unknown retain mode: {retain}")
+    return frozenset([graph.root, *retain])
+
+
+def _graph_result(
+    graph: TaskGraph,
+    order: list[str],
+    ctx: _RunContext,
+    events: list[dict[str, Any]],
+    runtime_error: KoraRuntimeError | None,
+    run_start: float,
+) -> dict[str, Any]:
+    if runtime_error is not None:
+        result = {
+            "ok": False,
+            "graph_id": graph.graph_id,
+            "order": order,
+            "error": runtime_error.to_failure_contract(),
+            "events": events,
+            "outputs": ctx.outputs,
+            "final": None,
+        }
+    else:
+        result = {
+            "ok": True,
+            "graph_id": graph.graph_id,
+            "order": order,
+            "events": events,
+            "outputs": ctx.outputs,
+            "final": ctx.outputs.get(graph.root),
+        }
+    result["stage_timings"] = ctx.stage_timings
+    result["budget"] = ctx.budget.snapshot()
+    if ctx.fingerprints is not None:
+        result["fingerprints"] = ctx.fingerprints
+    ctx.add_timing("overall_total_s", time.monotonic() - run_start)
     return result
+
+
+def run_graph(
+    graph: TaskGraph,
+    *,
+    parallel: bool = False,
+    max_workers: int = 4,
+    event_order: Literal["topo", "completion"] = "topo",
+    incremental: bool = False,
+    previous: Mapping[str, Any] | None = None,
+    checkpoint: CheckpointSink | None = None,
+    retain: Literal["root", "all"] | Iterable[str] = "all",
+    event_sink: EventSink | None = None,
+    keep_events: bool = True,
+) -> dict[str, Any]:
+    """Execute a normalized task graph with structured success/failure contracts.
+
+    With ``parallel=True`` independent tasks run concurrently on a pool of
+    ``max_workers`` threads; ``event_order`` selects whether events are reported
+    in topological order (deterministic) or in completion order.
+
+    With ``incremental=True`` the result also carries ``fingerprints``: one hash
+    per task of its definition and its dependency outputs. Passing such a
+    result back as ``previous`` (which implies ``incremental``) reuses every
+    previous output whose fingerprint is unchanged instead of re-running the
+    task; reused outputs are shared with ``previous`` and their events are
+    marked ``reused``.
+
+    With a ``checkpoint`` sink every completed task is persisted as soon as
+    it finishes; see ``resume_graph``.
+
+    ``retain`` selects which outputs the result keeps: ``"all"`` (default),
+    ``"root"`` or an iterable of task ids (the root is always kept). Outputs
+    outside it are released as soon as their last dependent completes, which
+    caps peak memory; handlers must then only read outputs of declared deps.
+
+    An ``event_sink`` receives every task event (tagged with ``graph_id``)
+    as soon as it is recorded, including escalation stages and failed
+    attempts of tasks that are still running. ``keep_events=False``
+    leaves ``events`` in the result empty for runs that only need the sink.
+    """
+    if event_order not in {"topo", "completion"}:
+        raise ValueError(f"unknown event_order: {event_order}")
+
+    run_start = time.monotonic()
+    ctx = _RunContext(
+        budget=BudgetManager.for_graph(graph),
+        graph_id=graph.graph_id,
+        retained=_retained_ids(graph, retain),
+        event_sink=event_sink,
+        keep_events=keep_events,
+    )
+    if incremental or previous is not None or checkpoint is not None:
+        ctx.fingerprints, ctx.previous, ctx.checkpoint = {}, previous, checkpoint
+    events: list[dict[str, Any]] = []
+    try:
+        order, task_map = _schedule(graph, ctx)
+    except KoraRuntimeError as err:
+        return _graph_result(graph, [], ctx, events, err, run_start)
+
+    if parallel:
+        runtime_error = _run_tasks_parallel(
+            task_map,
+            ctx,
+            events,
+            max_workers=max_workers,
+            event_order=event_order,
+        )
+    else:
+        runtime_error = _run_tasks_sequential(order, task_map, ctx, events)
+    return _graph_result(graph, order, ctx, events, runtime_error, run_start)
+
+
+async def run_graph_async(
+    graph: TaskGraph,
+    *,
+    max_concurrency: int | None = None,
+    event_order: Literal["topo", "completion"] = "topo",
+    incremental: bool = False,
+    previous: Mapping[str, Any] | None = None,
+    checkpoint: CheckpointSink | None = None,
+    retain: Literal["root", "all"] | Iterable[str] = "all",
+    event_sink: EventSink | None = None,
+    keep_events: bool = True,
+) -> dict[str, Any]:
+    """Execute a normalized task graph on the running event loop.
+
+    Every dependency-satisfied task is started as an asyncio task, bounded by
+    ``max_concurrency`` when given. Adapters implementing ``AsyncBaseAdapter``
+    are awaited natively; synchronous adapters run through ``SyncAdapterShim``.
+    The result contract matches ``run_graph(parallel=True)``, including
+    ``incremental``, ``previous``, ``checkpoint``, ``retain``, ``event_sink``
+    and ``keep_events``.
+    """
+    if event_order not in {"topo", "completion"}:
+        raise ValueError(f"unknown event_order: {event_order}")
+
+    run_start = time.monotonic()
+    ctx = _RunContext(
+        budget=BudgetManager.for_graph(graph),
+        graph_id=graph.graph_id,
+        retained=_retained_ids(graph, retain),
+        event_sink=event_sink,
+        keep_events=keep_events,
+    )
+    if incremental or previous is not None or checkpoint is not None:
+        ctx.fingerprints, ctx.previous, ctx.checkpoint = {}, previous, checkpoint
+    events: list[dict[str, Any]] = []
+    try:
+        order, task_map = _schedule(graph, ctx)
+    except KoraRuntimeError as err:
+        return _graph_result(graph, [], ctx, events, err, run_start)
+
+    runtime_error = await _run_tasks_async(
+        task_map,
+        ctx,
+        events,
+        max_concurrency=max_concurrency,
+        event_order=event_order,
+    )
+    return _graph_result(graph, order, ctx, events, runtime_error, run_start)
+
+
+def resume_graph(graph: TaskGraph, checkpoint: CheckpointSink, **options: Any) -> dict[str, Any]:
+    """Run ``graph`` again, skipping tasks an earlier run already checkpointed.
+
+    Checkpointed outputs are reused only while the task definition and its
+    dependency outputs still match what was recorded, so editing a graph
+    between runs re-executes the affected tasks. Newly completed tasks keep
+    being written to ``checkpoint``. ``options`` are passed to ``run_graph``
+    except ``previous``, which the checkpoint supplies.
+    """
+    if "previous" in options:
+        raise TypeError("resume_graph() loads previous results from the checkpoint; do not pass previous=")
+    return run_graph(graph, previous=checkpoint.load(graph.graph_id), checkpoint=checkpoint, **options)
+
+
+GraphInput = TaskGraph | tuple[GraphTemplate, Mapping[str, Any]]
+
+
+def _percentile_ms(values: list[float], pct: float) -> int:
+    if not values:
+        return 0
+    ordered = sorted(values)
+    return int(ordered[max(0, min(len(ordered) - 1, int(round((len(ordered) - 1) * pct))))])
+
+
+def _bind_failure_result(item: GraphInput, exc: Exception) -> dict[str, Any]:
+    template = item[0] if isinstance(item, tuple) else item
+    graph = getattr(template, "graph", template)
+    runtime_error = KoraRuntimeError(
+        error_type=ErrorType.INVALID_TASK,
+        stage=Stage.IR,
+        details=str(exc),
+        retryable=False,
+        budget_breached=False,
+        cause=exc,
+    )
+    return {
+        "ok": False,
+        "graph_id": getattr(graph, "graph_id", None),
+        "order": [],
+        "error": runtime_error.to_failure_contract(),
+        "events": [],
+        "outputs": {},
+        "final": None,
+        "stage_timings": {},
+        "budget": BudgetManager().snapshot(),
+    }
+
+
+class GraphBatchRun:
+    """Iterator over ``run_graph`` results for many graphs, with aggregate throughput stats.
+
+    Graphs are pulled lazily from the input, so arbitrarily long iterables are
+    fine; at most ``2 * concurrency`` graphs are bound, in flight or waiting
+    in the reorder buffer at once.
+    Every yielded result carries ``batch_index``, its position in the input.
+    An item that fails to bind yields an ``ok=False`` result instead of
+    stopping the batch.
+    """
+
+    def __init__(
+        self,
+        graphs: Iterable[GraphInput],
+        *,
+        concurrency: int,
+        ordered: bool,
+        parallel: bool,
+        max_workers: int,
+        retain: Literal["root", "all"] | Iterable[str] = "all",
+        event_sink: EventSink | None = None,
+        keep_events: bool = True,
+    ) -> None:
+        self._graphs = graphs
+        self._concurrency = max(1, int(concurrency))
+        self._ordered = ordered
+        self._run_options = {
+            "parallel": parallel,
+            "max_workers": max_workers,
+            "retain": retain,
+            "event_sink": event_sink,
+            "keep_events": keep_events,
+        }
+        self._lock = threading.Lock()
+        self._started_at: float | None = None
+        self._finished_at: float | None = None
+        self._completed = 0
+        self._ok = 0
+        self._latencies_ms: list[float] = []
+        self._results = self._run()
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return self
+
+    def __next__(self) -> dict[str, Any]:
+        return next(self._results)
+
+    def close(self) -> None:
+        """Stop submitting graphs and wait for the in-flight ones to finish."""
+        self._results.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Aggregate counts, throughput and latency percentiles so far."""
+        with self._lock:
+            if self._started_at is None:
+                elapsed_s = 0.0
+            else:
+                elapsed_s = (self._finished_at or time.monotonic()) - self._started_at
+            return {
+                "completed": self._completed,
+                "ok": self._ok,
+                "failed": self._completed - self._ok,
+                "elapsed_s": round(elapsed_s, 6),
+                "throughput_per_s": round(self._completed / elapsed_s, 3) if elapsed_s > 0 else 0.0,
+                "latency_ms": {
+                    "p50": _percentile_ms(self._latencies_ms, 0.50),
+                    "p95": _percentile_ms(self._latencies_ms, 0.95),
+                    "p99": _percentile_ms(self._latencies_ms, 0.99),
+                },
+            }
+
+    def _run_one(self, index: int, item: GraphInput) -> dict[str, Any]:
+        try:
+            if isinstance(item, tuple):
+                template, params = item
+                graph = template.bind(params)
+            else:
+                graph = item
+        except Exception as exc:
+            result = _bind_failure_result(item, exc)
+        else:
+            result = run_graph(graph, **self._run_options)
+        result["batch_index"] = index
+        with self._lock:
+            self._completed += 1
+            self._ok += 1 if result.get("ok") else 0
+            self._latencies_ms.append(float(result["stage_timings"].get("overall_total_s", 0.0)) * 1000.0)
+        return result
+
+    def _run(self) -> Generator[dict[str, Any], None, None]:
+        self._started_at = time.monotonic()
+        items = enumerate(self._graphs)
+        pool = ThreadPoolExecutor(max_workers=self._concurrency, thread_name_prefix="kora-graphs")
+        pending: dict[Future, int] = {}
+        buffered: dict[int, dict[str, Any]] = {}
+        next_index = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) + len(buffered) < 2 * self._concurrency:
+                    try:
+                        index, item = next(items)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending[pool.submit(self._run_one, index, item)] = index
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=pending.__getitem__):
+                    del pending[future]
+                    result = future.result()
+                    if self._ordered:
+                        buffered[result["batch_index"]] = result
+                    else:
+                        yield result
+                while next_index in buffered:
+                    yield buffered.pop(next_index)
+                    next_index += 1
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            with self._lock:
+                self._finished_at = time.monotonic()
+
+
+def run_graphs(
+    graphs: Iterable[GraphInput],
+    *,
+    concurrency: int = 8,
+    ordered: bool = True,
+    parallel: bool = False,
+    max_workers: int = 4,
+    retain: Literal["root", "all"] | Iterable[str] = "all",
+    event_sink: EventSink | None = None,
+    keep_events: bool = True,
+) -> GraphBatchRun:
+    """Run many graphs concurrently and stream their results.
+
+    Items are normalized ``TaskGraph`` objects or ``(GraphTemplate, params)``
+    bindings, which are bound on the worker. All runs share the process-wide
+    plan cache, adapter pool and schema validator cache. With ``ordered=True``
+    results are yielded in input order; otherwise as they complete. Call
+    ``stats()`` on the returned iterator for aggregate throughput.
+    ``retain``, ``event_sink`` and ``keep_events`` are passed to every
+    ``run_graph`` call; one sink sees the events of every graph.
+    """
+    return GraphBatchRun(
+        graphs,
+        concurrency=concurrency,
+        ordered=ordered,
+        parallel=parallel,
+        max_workers=max_workers,
+        retain=retain,
+        event_sink=event_sink,
+        keep_events=keep_events,
+    )
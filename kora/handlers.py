@@ -0,0 +1,173 @@
+"""Deterministic handler registry with lazy, entry-point based discovery."""
+
+from __future__ import annotations
+
+import importlib
+import threading
+from collections.abc import Iterator, MutableMapping
+from importlib.metadata import EntryPoint, entry_points
+from typing import Any, Callable
+
+from kora.task_ir import Task
+
+Handler = Callable[[Task, dict[str, Any]], dict[str, Any]]
+
+ENTRY_POINT_GROUP = "kora.det_handlers"
+
+
+def cpu_bound(handler: Handler) -> Handler:
+    """Mark a deterministic handler to run in the det process pool.
+
+    CPU-bound handlers must be module-level functions (so they pickle by
+    reference) and pure functions of the task and ``state["outputs"]``, which
+    only carries the task's dependency outputs; other state is not shipped.
+    """
+    handler.cpu_bound = True  # type: ignore[attr-defined]
+    return handler
+
+
+def _import_target(target: str) -> Handler:
+    module_name, _, attr = target.partition(":")
+    if not module_name or not attr:
+        raise ValueError(f"handler target must look like 'package.module:function', got {target!r}")
+    value: Any = importlib.import_module(module_name)
+    for part in attr.split("."):
+        value = getattr(value, part)
+    return value
+
+
+class HandlerRegistry(MutableMapping[str, Handler]):
+    """Name -> handler mapping that imports handlers on first use.
+
+    Handlers come from three places, checked in order: callables registered
+    directly (``register`` or item assignment), ``"module:function"`` targets
+    registered as strings, and installed packages advertising the
+    ``kora.det_handlers`` entry-point group. String targets and entry points
+    are imported only when their name is first resolved and the callable is
+    then cached, so unused handlers cost nothing at import time.
+    """
+
+    def __init__(self, *, group: str | None = ENTRY_POINT_GROUP) -> None:
+        self._group = group
+        self._resolved: dict[str, Handler] = {}
+        self._targets: dict[str, str] = {}
+        self._cpu_bound: set[str] = set()
+        self._entry_points: dict[str, EntryPoint] | None = None
+        # re-entrant: importing a target module may register handlers itself
+        self._lock = threading.RLock()
+
+    def register(
+        self,
+        name: str,
+        handler: Handler | str | None = None,
+        *,
+        cpu_bound: bool = False,
+    ) -> Any:
+        """Register ``handler`` (a callable or ``"module:function"``) under ``name``.
+
+        Called without ``handler`` it returns a decorator::
+
+            @HANDLER_REGISTRY.register("summarize_deck", cpu_bound=True)
+            def summarize_deck(task, state): ...
+        """
+        if handler is None:
+
+            def decorator(func: Handler) -> Handler:
+                self.register(name, func, cpu_bound=cpu_bound)
+                return func
+
+            return decorator
+
+        with self._lock:
+            self._resolved.pop(name, None)
+            self._targets.pop(name, None)
+            self._cpu_bound.discard(name)
+            if cpu_bound:
+                self._cpu_bound.add(name)
+            if isinstance(handler, str):
+                self._targets[name] = handler
+            else:
+                self._resolved[name] = self._mark(name, handler)
+        return handler
+
+    def refresh(self) -> None:
+        """Rescan installed entry points, e.g. after installing a handler package."""
+        with self._lock:
+            self._entry_points = None
+
+    def __getitem__(self, name: str) -> Handler:
+        handler = self._resolved.get(name)
+        if handler is not None:
+            return handler
+        with self._lock:
+            handler = self._resolved.get(name)
+            if handler is not None:
+                return handler
+            target = self._targets.get(name)
+            if target is not None:
+                handler = _import_target(target)
+            else:
+                entry_point = self._discovered().get(name)
+                if entry_point is None:
+                    raise KeyError(name)
+                handler = entry_point.load()
+            handler = self._mark(name, handler)
+            self._resolved[name] = handler
+            self._targets.pop(name, None)
+            return handler
+
+    def __setitem__(self, name: str, handler: Handler) -> None:
+        self.register(name, handler)
+
+    def __delitem__(self, name: str) -> None:
+        with self._lock:
+            found = self._resolved.pop(name, None) is not None
+            found = self._targets.pop(name, None) is not None or found
+            self._cpu_bound.discard(name)
+        if not found:
+            raise KeyError(name)
+
+    def __contains__(self, name: object) -> bool:
+        if name in self._resolved or name in self._targets:
+            return True
+        with self._lock:
+            return name in self._discovered()
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            names = dict.fromkeys([*self._resolved, *self._targets, *self._discovered()])
+        return iter(names)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def _mark(self, name: str, handler: Handler) -> Handler:
+        if not callable(handler):
+            raise TypeError(f"deterministic handler {name!r} is not callable")
+        if name in self._cpu_bound:
+            cpu_bound(handler)
+        return handler
+
+    def _discovered(self) -> dict[str, EntryPoint]:
+        if self._entry_points is None:
+            found = entry_points(group=self._group) if self._group else ()
+            self._entry_points = {entry_point.name: entry_point for entry_point in found}
+        return self._entry_points
+
+
+HANDLER_REGISTRY = HandlerRegistry()
+
+
+def register_handler(name: str, handler: Handler | str | None = None, *, cpu_bound: bool = False) -> Any:
+    """Register a deterministic handler on the default registry; see ``HandlerRegistry.register``."""
+    return HANDLER_REGISTRY.register(name, handler, cpu_bound=cpu_bound)
+
+
+__all__ = [
+    "ENTRY_POINT_GROUP",
+    "HANDLER_REGISTRY",
+    "Handler",
+    "HandlerRegistry",
+    "cpu_bound",
+    "register_handler",
+]
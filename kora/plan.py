@@ -0,0 +1,210 @@
+"""Precompiled execution plans for repeated runs of the same graph shape."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from kora.scheduler import topo_sort
+from kora.task_ir import AdaptiveRoutingPolicy, HedgePolicy, TaskGraph
+
+
+@dataclass(frozen=True)
+class TaskPlan:
+    """Run-invariant facts about one task, derived from its policy and run spec."""
+
+    task_id: str
+    index: int
+    budget: dict[str, Any]
+    max_attempts: int
+    adaptive: AdaptiveRoutingPolicy | None
+    adapter: str | None
+    hedge: HedgePolicy | None = None
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """Topological order, dependency indexes and pre-resolved task policies.
+
+    ``dep_counts[i]``, ``dependents[i]`` and ``dependencies[i]`` refer to
+    positions in ``order``.
+    Plans are shared between graphs of the same shape and must be treated as
+    read-only; executors copy ``TaskPlan.budget`` before overriding it.
+    """
+
+    key: str
+    order: tuple[str, ...]
+    position: dict[str, int]
+    dep_counts: tuple[int, ...]
+    dependents: tuple[tuple[int, ...], ...]
+    dependencies: tuple[tuple[int, ...], ...]
+    tasks: dict[str, TaskPlan]
+
+
+def plan_key(graph: TaskGraph) -> str:
+    """Hash the parts of a graph that determine its execution plan.
+
+    Task inputs are excluded, so graphs bound from one template share a key.
+    """
+    shape = {
+        "root": graph.root,
+        "tasks": [
+            {
+                "id": task.id,
+                "deps": task.deps,
+                "kind": task.run.kind,
+                "target": task.run.spec.adapter if task.run.kind == "llm" else task.run.spec.handler,
+                "policy": task.policy.model_dump(mode="json", exclude_unset=True),
+                "budget": task.policy.budget.model_dump(mode="json") if task.policy.budget is not None else None,
+            }
+            for task in graph.tasks
+        ],
+    }
+    serialized = json.dumps(shape, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def build_plan(graph: TaskGraph, key: str | None = None) -> ExecutionPlan:
+    """Compile a plan for ``graph``; raises ``ValueError`` for invalid DAGs."""
+    order = tuple(topo_sort(graph))
+    position = {task_id: pos for pos, task_id in enumerate(order)}
+    dep_counts = [0] * len(order)
+    dependents: list[list[int]] = [[] for _ in order]
+    dependencies: list[tuple[int, ...]] = [() for _ in order]
+    tasks: dict[str, TaskPlan] = {}
+
+    for index, task in enumerate(graph.tasks):
+        pos = position[task.id]
+        deps = set(task.deps)
+        dep_counts[pos] = len(deps)
+        dependencies[pos] = tuple(sorted(position[dep] for dep in deps))
+        for dep in deps:
+            dependents[position[dep]].append(pos)
+
+        budget = task.policy.budget.model_dump() if task.policy.budget is not None else {}
+        retries = task.policy.budget.max_retries if task.policy.budget is not None else 0
+        tasks[task.id] = TaskPlan(
+            task_id=task.id,
+            index=index,
+            budget=budget,
+            max_attempts=1 + max(0, retries),
+            adaptive=task.policy.adaptive.resolved() if task.policy.adaptive is not None else None,
+            adapter=task.run.spec.adapter if task.run.kind == "llm" else None,
+            hedge=task.policy.hedge,
+        )
+
+    return ExecutionPlan(
+        key=key or plan_key(graph),
+        order=order,
+        position=position,
+        dep_counts=tuple(dep_counts),
+        dependents=tuple(tuple(sorted(items)) for items in dependents),
+        dependencies=tuple(dependencies),
+        tasks=tasks,
+    )
+
+
+class PlanCache:
+    """Bounded LRU of execution plans keyed by ``plan_key``."""
+
+    def __init__(self, *, max_entries: int = 512) -> None:
+        self._plans: OrderedDict[str, ExecutionPlan] = OrderedDict()
+        self._max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, graph: TaskGraph) -> ExecutionPlan:
+        key = plan_key(graph)
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                self.hits += 1
+                return plan
+            self.misses += 1
+
+        plan = build_plan(graph, key)
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self._max_entries:
+                self._plans.popitem(last=False)
+        return plan
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._plans)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+PLAN_CACHE = PlanCache()
+
+
+def _graph_signature(graph: TaskGraph) -> tuple[Any, ...]:
+    return (
+        graph.root,
+        tuple(
+            (
+                task.id,
+                tuple(task.deps),
+                task.run.kind,
+                task.run.spec.adapter if task.run.kind == "llm" else task.run.spec.handler,
+            )
+            for task in graph.tasks
+        ),
+    )
+
+
+def _graph_policies(graph: TaskGraph) -> tuple[Any, ...]:
+    return tuple(
+        item
+        for task in graph.tasks
+        for item in (task.policy, task.policy.budget, task.policy.adaptive, task.policy.hedge)
+    )
+
+
+def compile_plan(graph: TaskGraph) -> ExecutionPlan:
+    """Return the execution plan for ``graph``, reusing cached work when possible.
+
+    The plan is memoized on the graph object together with the policy
+    objects it was built from. A rerun whose tasks still hold those same
+    objects (compared with ``is``) skips hashing entirely; this includes a
+    ``GraphTemplate`` binding, which shares task policies. The memo keeps the
+    policies alive, so a recycled ``id`` can never match a stale plan. Graphs
+    whose policies are edited in place after a run must be copied to pick up
+    the change.
+    """
+    signature = _graph_signature(graph)
+    policies = _graph_policies(graph)
+    memo = graph._plan_memo
+    if (
+        memo is not None
+        and memo[0] == signature
+        and len(memo[1]) == len(policies)
+        and all(kept is current for kept, current in zip(memo[1], policies))
+    ):
+        return memo[2]
+    plan = PLAN_CACHE.get_or_build(graph)
+    graph._plan_memo = (signature, policies, plan)
+    return plan
+
+
+__all__ = [
+    "ExecutionPlan",
+    "PLAN_CACHE",
+    "PlanCache",
+    "TaskPlan",
+    "build_plan",
+    "compile_plan",
+    "plan_key",
+]
@@ -1,67 +1,305 @@
-"""Minimal deterministic in-process retrieval store."""
+"""Deterministic retrieval stores: in-process LRU and a shared SQLite backend."""
 
 from __future__ import annotations
 
 import hashlib
+import itertools
 import json
+import os
+import sqlite3
+import threading
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Callable
 
+from kora.sqlite_connections import ThreadLocalConnections
+
 
 @dataclass
 class _Entry:
     value: Any
     expire_at: float | None
+    tick: int = 0
+
+
+class RetrievalStore:
+    """Retrieval backend interface: key-value lookups with TTL and bounded LRU eviction."""
+
+    def configure(self, *, max_entries: int | None = None) -> None:
+        raise NotImplementedError
+
+    def put(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
+        raise NotImplementedError
+
+    def get(self, key: str) -> Any | None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release backend resources such as database connections."""
+
+
+class _Shard:
+    """One independently locked partition of an in-memory store, kept in access order."""
+
+    __slots__ = ("items", "lock")
+
+    def __init__(self) -> None:
+        self.items: OrderedDict[str, _Entry] = OrderedDict()
+        self.lock = threading.Lock()
 
 
-class InMemoryRetrievalStore:
-    """Simple key-value retrieval store with TTL and bounded LRU eviction."""
+class InMemoryRetrievalStore(RetrievalStore):
+    """Thread-safe key-value retrieval store with TTL and bounded LRU eviction.
+
+    Keys are partitioned by hash across ``shards`` independently locked
+    shards, so concurrent lookups only contend when they land on the same
+    shard. ``max_entries`` bounds the store as a whole: every access stamps
+    the entry with a global tick, each shard keeps its entries in access
+    order, and eviction removes the oldest shard head, which is the globally
+    least recently used entry.
+    """
 
     def __init__(
         self,
         *,
         max_entries: int = 1000,
         clock: Callable[[], float] | None = None,
+        shards: int = 16,
     ) -> None:
-        self._items: OrderedDict[str, _Entry] = OrderedDict()
+        self._clock = clock or time.time
+        self._max_entries = max(1, int(max_entries))
+        self._shards = tuple(_Shard() for _ in range(max(1, int(shards))))
+        self._ticks = itertools.count()
+        self._size = 0
+        self._size_lock = threading.Lock()
+        self._evict_lock = threading.Lock()
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def _resize(self, delta: int) -> None:
+        with self._size_lock:
+            self._size += delta
+
+    def configure(self, *, max_entries: int | None = None) -> None:
+        if max_entries is None or max(1, int(max_entries)) == self._max_entries:
+            return
+        self._max_entries = max(1, int(max_entries))
+        self._evict_over_limit()
+
+    def put(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
+        shard = self._shard(key)
+        expire_at: float | None = None
+        if ttl_seconds is not None:
+            ttl = int(ttl_seconds)
+            if ttl <= 0:
+                with shard.lock:
+                    removed = shard.items.pop(key, None) is not None
+                if removed:
+                    self._resize(-1)
+                return
+            expire_at = float(self._clock()) + float(ttl)
+        with shard.lock:
+            added = key not in shard.items
+            shard.items[key] = _Entry(value=value, expire_at=expire_at, tick=next(self._ticks))
+            shard.items.move_to_end(key)
+        if added:
+            self._resize(1)
+            self._evict_over_limit()
+
+    def get(self, key: str) -> Any | None:
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.items.get(key)
+            if entry is None:
+                return None
+            if entry.expire_at is None or float(self._clock()) < entry.expire_at:
+                entry.tick = next(self._ticks)
+                shard.items.move_to_end(key)
+                return entry.value
+            del shard.items[key]
+        self._resize(-1)
+        return None
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                removed = len(shard.items)
+                shard.items.clear()
+            self._resize(-removed)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _evict_over_limit(self) -> None:
+        with self._evict_lock:
+            self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        while self._size > self._max_entries:
+            victim: tuple[int, _Shard, str] | None = None
+            for shard in self._shards:
+                with shard.lock:
+                    if shard.items:
+                        key, entry = next(iter(shard.items.items()))
+                        if victim is None or entry.tick < victim[0]:
+                            victim = (entry.tick, shard, key)
+            if victim is None:
+                return
+            tick, shard, key = victim
+            with shard.lock:
+                entry = shard.items.get(key)
+                if entry is None or entry.tick != tick:
+                    continue  # touched or removed meanwhile; pick again
+                del shard.items[key]
+            self._resize(-1)
+
+
+class SQLiteRetrievalStore(RetrievalStore):
+    """Disk-backed retrieval store shared by worker processes on one host.
+
+    Entries live in a SQLite database in WAL mode, so readers in other
+    processes are not blocked by writers and warm entries survive restarts.
+    Values must be JSON-serializable. LRU order is a global sequence number;
+    a hit only bumps it once the entry has fallen more than a quarter of
+    ``max_entries`` behind the newest one, so warm hits stay read-only.
+    A row count kept next to the entries lets ``put`` skip eviction until
+    the cap is exceeded, and eviction then deletes below a sequence threshold.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_entries: int = 1000,
+        clock: Callable[[], float] | None = None,
+        timeout_s: float = 30.0,
+    ) -> None:
+        self.path = os.fspath(path)
         self._max_entries = max(1, int(max_entries))
         self._clock = clock or time.time
+        self._connections = ThreadLocalConnections(path, timeout_s=timeout_s)
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS retrieval_entries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expire_at REAL, seq INTEGER NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS retrieval_entries_seq ON retrieval_entries (seq)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS retrieval_meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO retrieval_meta (name, value) "
+                "VALUES ('count', (SELECT COUNT(*) FROM retrieval_entries))"
+            )
+
+    def _conn(self) -> sqlite3.Connection:
+        return self._connections.get()
 
     def configure(self, *, max_entries: int | None = None) -> None:
-        if max_entries is not None:
+        if max_entries is not None and max(1, int(max_entries)) != self._max_entries:
             self._max_entries = max(1, int(max_entries))
-            self._evict_over_limit()
+            conn = self._conn()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                self._evict_over_limit(conn)
 
     def put(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
+        conn = self._conn()
         expire_at: float | None = None
         if ttl_seconds is not None:
             ttl = int(ttl_seconds)
             if ttl <= 0:
-                self._items.pop(key, None)
+                with conn:
+                    conn.execute("BEGIN IMMEDIATE")
+                    self._delete(conn, key)
                 return
             expire_at = float(self._clock()) + float(ttl)
-        self._items[key] = _Entry(value=value, expire_at=expire_at)
-        self._items.move_to_end(key)
-        self._evict_over_limit()
+        serialized = json.dumps(value, sort_keys=True, separators=(",", ":"))
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            updated = conn.execute(
+                "UPDATE retrieval_entries SET value = ?, expire_at = ?, "
+                "seq = (SELECT MAX(seq) + 1 FROM retrieval_entries) WHERE key = ?",
+                (serialized, expire_at, key),
+            ).rowcount
+            if updated:
+                return
+            conn.execute(
+                "INSERT INTO retrieval_entries (key, value, expire_at, seq) "
+                "VALUES (?, ?, ?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM retrieval_entries))",
+                (key, serialized, expire_at),
+            )
+            self._add_count(conn, 1)
+            self._evict_over_limit(conn)
 
     def get(self, key: str) -> Any | None:
-        entry = self._items.get(key)
-        if entry is None:
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT value, expire_at, seq, (SELECT MAX(seq) FROM retrieval_entries) "
+            "FROM retrieval_entries WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
             return None
-        if entry.expire_at is not None and float(self._clock()) >= entry.expire_at:
-            self._items.pop(key, None)
+        value, expire_at, seq, newest = row
+        if expire_at is not None and float(self._clock()) >= expire_at:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                self._delete(conn, key)
             return None
-        self._items.move_to_end(key)
-        return entry.value
+        if newest - seq > self._max_entries // 4:
+            with conn:
+                conn.execute(
+                    "UPDATE retrieval_entries SET seq = (SELECT MAX(seq) + 1 FROM retrieval_entries) WHERE key = ?",
+                    (key,),
+                )
+        return json.loads(value)
 
     def clear(self) -> None:
-        self._items.clear()
+        conn = self._conn()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM retrieval_entries")
+            conn.execute("UPDATE retrieval_meta SET value = 0 WHERE name = 'count'")
 
-    def _evict_over_limit(self) -> None:
-        while len(self._items) > self._max_entries:
-            self._items.popitem(last=False)
+    def close(self) -> None:
+        self._connections.close()
+
+    def _add_count(self, conn: sqlite3.Connection, delta: int) -> None:
+        conn.execute("UPDATE retrieval_meta SET value = value + ? WHERE name = 'count'", (delta,))
+
+    def _delete(self, conn: sqlite3.Connection, key: str) -> None:
+        removed = conn.execute("DELETE FROM retrieval_entries WHERE key = ?", (key,)).rowcount
+        if removed:
+            self._add_count(conn, -removed)
+
+    def _evict_over_limit(self, conn: sqlite3.Connection) -> None:
+        (count,) = conn.execute("SELECT value FROM retrieval_meta WHERE name = 'count'").fetchone()
+        excess = count - self._max_entries
+        if excess <= 0:
+            return
+        threshold = conn.execute(
+            "SELECT seq FROM retrieval_entries ORDER BY seq LIMIT 1 OFFSET ?",
+            (excess - 1,),
+        ).fetchone()
+        if threshold is None:
+            return
+        removed = conn.execute("DELETE FROM retrieval_entries WHERE seq <= ?", threshold).rowcount
+        self._add_count(conn, -removed)
+
+
+def retrieval_store_from_env() -> RetrievalStore:
+    """Build the gate retrieval store; ``KORA_RETRIEVAL_DB`` selects the SQLite backend."""
+    path = os.getenv("KORA_RETRIEVAL_DB", "").strip()
+    if path:
+        return SQLiteRetrievalStore(path)
+    return InMemoryRetrievalStore()
 
 
 def build_retrieval_key(
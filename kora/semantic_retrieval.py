@@ -0,0 +1,284 @@
+"""Similarity-based retrieval for near-duplicate gate lookups.
+
+NumPy is optional: with it, searches are vectorized and large namespaces use a
+random-hyperplane LSH pre-filter; without it, a pure-Python brute-force scan
+is used.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+try:  # optional dependency: pip install "kora[semantic]"
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy installed
+    np = None
+
+EmbeddingFn = Callable[[str], Sequence[float]]
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def hashed_ngram_embedding(text: str, *, dim: int = 256) -> list[float]:
+    """Deterministic local embedding from hashed word unigrams and character trigrams.
+
+    It has no model dependency and is stable across processes. Reworded text
+    that shares most words still lands close in cosine space; swap in a real
+    embedding model through ``SemanticRetrievalIndex(embed=...)`` for paraphrases.
+    """
+    vector = [0.0] * dim
+    words = _WORD.findall(text.lower())
+    grams = list(words)
+    for word in words:
+        padded = f" {word} "
+        grams.extend(padded[i : i + 3] for i in range(len(padded) - 2))
+    for gram in grams:
+        digest = zlib.crc32(gram.encode("utf-8"))
+        vector[digest % dim] += 1.0 if (digest >> 16) & 1 else -1.0
+    return vector
+
+
+def _normalize(vector: Sequence[float]) -> list[float]:
+    norm = math.sqrt(sum(value * value for value in vector))
+    if norm == 0.0:
+        return [0.0 for _ in vector]
+    return [value / norm for value in vector]
+
+
+@dataclass
+class _VectorEntry:
+    vector: list[float]
+    value: Any
+    expire_at: float | None
+    row: int
+    signature: tuple[int, ...] | None = None
+
+
+class _Namespace:
+    """Entries sharing one namespace, plus an incrementally maintained search matrix.
+
+    Each entry owns one row of ``matrix``. Removed rows are marked dead
+    (``texts[row] is None``) and reused by later adds, so writes never
+    rebuild the matrix or the LSH tables.
+    """
+
+    def __init__(self) -> None:
+        self.entries: dict[str, _VectorEntry] = {}
+        self.texts: list[str | None] = []
+        self.free: list[int] = []
+        self.matrix: Any = None
+        self.buckets: list[dict[int, set[int]]] | None = None
+
+
+class SemanticRetrievalIndex:
+    """Bounded vector index with TTL, LRU eviction and a cosine similarity threshold.
+
+    Entries are grouped by namespace (e.g. task type and tags) and only match
+    queries in the same namespace. Namespaces larger than ``approximate_above``
+    are searched through ``lsh_tables`` random-hyperplane hash tables when NumPy
+    is available, trading a little recall for sub-linear candidate sets.
+    """
+
+    def __init__(
+        self,
+        *,
+        embed: EmbeddingFn | None = None,
+        max_entries: int = 1000,
+        clock: Callable[[], float] | None = None,
+        approximate_above: int = 2048,
+        lsh_tables: int = 4,
+        lsh_bits: int = 12,
+        seed: int = 0,
+    ) -> None:
+        self._embed = embed or hashed_ngram_embedding
+        self._max_entries = max(1, int(max_entries))
+        self._clock = clock or time.time
+        self._approximate_above = max(1, int(approximate_above))
+        self._lsh_tables = max(1, int(lsh_tables))
+        self._lsh_bits = max(1, int(lsh_bits))
+        self._seed = seed
+        self._planes: Any = None
+        self._namespaces: dict[str, _Namespace] = {}
+        self._lru: OrderedDict[tuple[str, str], None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def configure(self, *, max_entries: int | None = None) -> None:
+        if max_entries is not None:
+            with self._lock:
+                self._max_entries = max(1, int(max_entries))
+                self._evict_over_limit()
+
+    def add(self, namespace: str, text: str, value: Any, ttl_seconds: int | None = None) -> None:
+        expire_at: float | None = None
+        if ttl_seconds is not None:
+            ttl = int(ttl_seconds)
+            if ttl <= 0:
+                with self._lock:
+                    self._remove(namespace, text)
+                return
+            expire_at = float(self._clock()) + float(ttl)
+        vector = _normalize(self._embed(text))
+        with self._lock:
+            bucket = self._namespaces.setdefault(namespace, _Namespace())
+            self._insert(bucket, text, vector, value, expire_at)
+            self._lru[(namespace, text)] = None
+            self._lru.move_to_end((namespace, text))
+            self._evict_over_limit()
+
+    def search(self, namespace: str, text: str, *, threshold: float) -> tuple[Any, float] | None:
+        """Return ``(value, similarity)`` for the closest live entry at or above ``threshold``.
+
+        Expired entries met along the way are dropped and the next closest
+        candidate above the threshold is tried.
+        """
+        query = _normalize(self._embed(text))
+        with self._lock:
+            bucket = self._namespaces.get(namespace)
+            if bucket is None or not bucket.entries:
+                return None
+            now = float(self._clock())
+            for row, similarity in self._ranked(bucket, query, threshold):
+                match = bucket.texts[row]
+                if match is None:
+                    continue
+                entry = bucket.entries[match]
+                if entry.expire_at is not None and now >= entry.expire_at:
+                    self._remove(namespace, match)
+                    continue
+                self._lru.move_to_end((namespace, match))
+                return entry.value, similarity
+            return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._namespaces.clear()
+            self._lru.clear()
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    def _insert(
+        self, bucket: _Namespace, text: str, vector: list[float], value: Any, expire_at: float | None
+    ) -> None:
+        previous = bucket.entries.get(text)
+        if previous is not None:
+            row = previous.row
+            self._unindex(bucket, previous)
+        elif bucket.free:
+            row = bucket.free.pop()
+        else:
+            row = len(bucket.texts)
+            bucket.texts.append(None)
+        entry = _VectorEntry(vector=vector, value=value, expire_at=expire_at, row=row)
+        bucket.texts[row] = text
+        bucket.entries[text] = entry
+        if np is None:
+            if bucket.matrix is None:
+                bucket.matrix = []
+            if row == len(bucket.matrix):
+                bucket.matrix.append(vector)
+            else:
+                bucket.matrix[row] = vector
+            return
+        if bucket.matrix is None:
+            bucket.matrix = np.zeros((16, len(vector)), dtype=np.float32)
+        elif row >= len(bucket.matrix):
+            grown = np.zeros((2 * len(bucket.matrix), bucket.matrix.shape[1]), dtype=np.float32)
+            grown[: len(bucket.matrix)] = bucket.matrix
+            bucket.matrix = grown
+        bucket.matrix[row] = vector
+        if bucket.buckets is not None:
+            self._index(bucket, entry, tuple(self._signatures(bucket.matrix[row : row + 1])[0].tolist()))
+        elif len(bucket.entries) > self._approximate_above:
+            self._build_tables(bucket)
+
+    def _build_tables(self, bucket: _Namespace) -> None:
+        bucket.buckets = [{} for _ in range(self._lsh_tables)]
+        entries = list(bucket.entries.values())
+        rows = np.fromiter((entry.row for entry in entries), dtype=np.int64, count=len(entries))
+        for entry, signature in zip(entries, self._signatures(bucket.matrix[rows]).tolist()):
+            self._index(bucket, entry, tuple(signature))
+
+    def _index(self, bucket: _Namespace, entry: _VectorEntry, signature: tuple[int, ...]) -> None:
+        entry.signature = signature
+        for table, key in zip(bucket.buckets, signature):
+            table.setdefault(key, set()).add(entry.row)
+
+    def _unindex(self, bucket: _Namespace, entry: _VectorEntry) -> None:
+        if bucket.buckets is None or entry.signature is None:
+            return
+        for table, key in zip(bucket.buckets, entry.signature):
+            rows = table.get(key)
+            if rows is not None:
+                rows.discard(entry.row)
+                if not rows:
+                    del table[key]
+        entry.signature = None
+
+    def _signatures(self, matrix: Any) -> Any:
+        if self._planes is None or self._planes.shape[0] != matrix.shape[1]:
+            rng = np.random.default_rng(self._seed)
+            self._planes = rng.standard_normal(
+                (matrix.shape[1], self._lsh_tables * self._lsh_bits)
+            ).astype(np.float32)
+        bits = (matrix @ self._planes > 0).reshape(len(matrix), self._lsh_tables, self._lsh_bits)
+        weights = 1 << np.arange(self._lsh_bits, dtype=np.int64)
+        return (bits * weights).sum(axis=2)
+
+    def _ranked(self, bucket: _Namespace, query: list[float], threshold: float) -> list[tuple[int, float]]:
+        """Rows scoring at or above ``threshold``, best first; dead rows may be included."""
+        if np is None:
+            scored = [
+                (row, sum(a * b for a, b in zip(vector, query)))
+                for row, vector in enumerate(bucket.matrix)
+                if bucket.texts[row] is not None
+            ]
+            scored = [item for item in scored if item[1] >= threshold]
+            scored.sort(key=lambda item: item[1], reverse=True)
+            return scored
+
+        query_vector = np.asarray(query, dtype=np.float32)
+        if bucket.buckets is None:
+            rows = np.arange(len(bucket.texts), dtype=np.int64)
+        else:
+            signatures = self._signatures(query_vector[None, :])[0].tolist()
+            candidates: set[int] = set()
+            for table, signature in zip(bucket.buckets, signatures):
+                candidates.update(table.get(signature, ()))
+            if not candidates:
+                return []
+            rows = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+        scores = bucket.matrix[rows] @ query_vector
+        keep = np.flatnonzero(scores >= threshold)
+        order = keep[np.argsort(-scores[keep], kind="stable")]
+        return [(int(rows[index]), float(scores[index])) for index in order]
+
+    def _remove(self, namespace: str, text: str) -> None:
+        self._lru.pop((namespace, text), None)
+        bucket = self._namespaces.get(namespace)
+        if bucket is None:
+            return
+        entry = bucket.entries.pop(text, None)
+        if entry is None:
+            return
+        if not bucket.entries:
+            del self._namespaces[namespace]
+            return
+        self._unindex(bucket, entry)
+        bucket.texts[entry.row] = None
+        bucket.free.append(entry.row)
+
+    def _evict_over_limit(self) -> None:
+        while len(self._lru) > self._max_entries:
+            namespace, text = next(iter(self._lru))
+            self._remove(namespace, text)
+
+
+__all__ = ["EmbeddingFn", "SemanticRetrievalIndex", "hashed_ngram_embedding"]
@@ -0,0 +1,43 @@
+"""Per-thread SQLite connections shared by the disk-backed stores."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+
+
+class ThreadLocalConnections:
+    """One SQLite connection per thread to a database in WAL mode.
+
+    Connections are opened lazily on first use in each thread and tracked so
+    ``close`` can release all of them, including those of finished threads.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, timeout_s: float = 30.0) -> None:
+        self.path = os.fspath(path)
+        self._timeout_s = float(timeout_s)
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self.get().execute("PRAGMA journal_mode=WAL")
+
+    def get(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self._timeout_s, check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+
+__all__ = ["ThreadLocalConnections"]
@@ -6,7 +6,7 @@ import json
 from pathlib import Path
 from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field, ValidationError, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, ValidationError, model_validator
 
 
 class Budget(BaseModel):
@@ -17,6 +17,15 @@ class Budget(BaseModel):
     max_retries: int = 1
 
 
+class GraphBudget(BaseModel):
+    """Graph-wide execution limits enforced by the budget manager."""
+
+    max_time_ms: int | None = None
+    enforce_task_deadlines: bool = True
+    max_tokens: int | None = None
+    max_cost_usd: float | None = None
+
+
 class VerifyRuleRequired(BaseModel):
     """Requires paths to be present in output."""
 
@@ -44,10 +53,15 @@ class VerifySpec(BaseModel):
 
 
 class RunDetSpec(BaseModel):
-    """Spec for deterministic handlers."""
+    """Spec for deterministic handlers.
+
+    ``cacheable`` declares the handler a pure function of the task inputs, args
+    and dependency outputs, so verified outputs may be memoized across runs.
+    """
 
     handler: str
     args: dict[str, Any] = Field(default_factory=dict)
+    cacheable: bool = False
 
 
 class RunLlmSpec(BaseModel):
@@ -71,12 +85,21 @@ class RunLlm(BaseModel):
 RunSpec = Annotated[RunDet | RunLlm, Field(discriminator="kind")]
 
 
+class HedgePolicy(BaseModel):
+    """Duplicate slow adapter calls once they outlive a latency percentile."""
+
+    percentile: float = Field(default=0.95, gt=0.0, le=1.0)
+    min_samples: int = Field(default=20, ge=1)
+
+
 class Policy(BaseModel):
     """Task execution policy."""
 
     budget: Budget | None = None
     on_fail: Literal["retry", "fail", "escalate"] = "fail"
     adaptive: "AdaptiveRoutingPolicy | None" = None
+    hedge: HedgePolicy | None = None
+    coalesce: bool = False
 
 
 class AdaptiveRoutingPolicy(BaseModel):
@@ -97,9 +120,11 @@ class AdaptiveRoutingPolicy(BaseModel):
     self_consistency_min_next_cost: float = 200.0
     self_consistency_min_remaining_budget: float = 500.0
     enable_gate_retrieval: bool = False
-    retrieval_strategy: Literal["exact"] = "exact"
+    retrieval_strategy: Literal["exact", "semantic"] = "exact"
     retrieval_ttl_seconds: int = 3600
     retrieval_max_entries: int = 1000
+    retrieval_similarity_threshold: float = Field(default=0.9, ge=0.0, le=1.0)
+    speculative_escalation_threshold: float | None = Field(default=None, ge=0.0, le=1.0)
 
     def resolved(self) -> "AdaptiveRoutingPolicy":
         profile_defaults: dict[str, dict[str, Any]] = {
@@ -169,6 +194,8 @@ class TaskGraph(BaseModel):
     root: str
     defaults: GraphDefaults
     tasks: list[Task]
+    budget: GraphBudget | None = None
+    _plan_memo: Any = PrivateAttr(default=None)
 
     @model_validator(mode="after")
     def _ensure_non_empty_tasks(self) -> "TaskGraph":
@@ -241,6 +268,8 @@ def validate_graph(graph: TaskGraph) -> None:
 __all__ = [
     "AdaptiveRoutingPolicy",
     "Budget",
+    "GraphBudget",
+    "HedgePolicy",
     "Policy",
     "RunDetSpec",
     "RunLlmSpec",
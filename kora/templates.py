@@ -0,0 +1,102 @@
+"""Reusable graph templates with named parameter placeholders."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from typing import Any
+
+from kora.plan import compile_plan
+from kora.task_ir import Task, TaskGraph, normalize_graph, validate_graph
+
+_PLACEHOLDER = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+
+
+def _collect_params(value: Any, found: set[str]) -> None:
+    if isinstance(value, str):
+        found.update(_PLACEHOLDER.findall(value))
+    elif isinstance(value, dict):
+        for item in value.values():
+            _collect_params(item, found)
+    elif isinstance(value, list):
+        for item in value:
+            _collect_params(item, found)
+
+
+def _substitute(value: Any, params: Mapping[str, Any]) -> Any:
+    if isinstance(value, str):
+        whole = _PLACEHOLDER.fullmatch(value)
+        if whole is not None:
+            return params[whole.group(1)]
+        if "{{" not in value:
+            return value
+        return _PLACEHOLDER.sub(lambda match: str(params[match.group(1)]), value)
+    if isinstance(value, dict):
+        return {key: _substitute(item, params) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_substitute(item, params) for item in value]
+    return value
+
+
+class GraphTemplate:
+    """A task graph validated, normalized and ordered once, then bound per request.
+
+    Placeholders are written as ``"{{name}}"`` inside task ``in`` payloads, det
+    handler ``args`` and llm ``input`` payloads. A string that is exactly one
+    placeholder is replaced by the bound value as-is (any JSON type); embedded
+    placeholders are replaced by ``str(value)``. Binding only copies the tasks
+    that reference parameters; every other task object (and the compiled
+    execution plan) is shared.
+    """
+
+    def __init__(self, graph: TaskGraph | Mapping[str, Any]) -> None:
+        if not isinstance(graph, TaskGraph):
+            graph = TaskGraph.model_validate(dict(graph))
+        normalized = normalize_graph(graph)
+        validate_graph(normalized)
+        self.graph = normalized
+        self.plan = compile_plan(normalized)
+        self.order = list(self.plan.order)
+
+        self._bindable: dict[int, set[str]] = {}
+        params: set[str] = set()
+        for index, task in enumerate(normalized.tasks):
+            found: set[str] = set()
+            _collect_params(task.in_, found)
+            if task.run.kind == "det":
+                _collect_params(task.run.spec.args, found)
+            else:
+                _collect_params(task.run.spec.input, found)
+            if found:
+                self._bindable[index] = found
+                params.update(found)
+        self.params: frozenset[str] = frozenset(params)
+
+    def bind(self, params: Mapping[str, Any] | None = None, *, graph_id: str | None = None) -> TaskGraph:
+        """Return a runnable graph with ``params`` substituted into the template."""
+        values: Mapping[str, Any] = params or {}
+        missing = sorted(self.params.difference(values))
+        if missing:
+            raise ValueError(f"missing template parameters: {missing}")
+
+        tasks = list(self.graph.tasks)
+        for index in self._bindable:
+            tasks[index] = self._bind_task(tasks[index], values)
+
+        update: dict[str, Any] = {"tasks": tasks}
+        if graph_id is not None:
+            update["graph_id"] = graph_id
+        return self.graph.model_copy(update=update)
+
+    @staticmethod
+    def _bind_task(task: Task, params: Mapping[str, Any]) -> Task:
+        spec = task.run.spec
+        if task.run.kind == "det":
+            bound_spec = spec.model_copy(update={"args": _substitute(spec.args, params)})
+        else:
+            bound_spec = spec.model_copy(update={"input": _substitute(spec.input, params)})
+        bound_run = task.run.model_copy(update={"spec": bound_spec})
+        return task.model_copy(update={"in_": _substitute(task.in_, params), "run": bound_run})
+
+
+__all__ = ["GraphTemplate"]
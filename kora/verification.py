@@ -2,20 +2,84 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import threading
+from collections import OrderedDict
 from typing import Any
 
-from jsonschema import ValidationError as JSONSchemaValidationError
-from jsonschema import validate as jsonschema_validate
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 from kora.task_ir import Task
 
 
+def schema_hash(schema: dict[str, Any]) -> str:
+    """Return a stable content hash for a JSON schema."""
+    serialized = json.dumps(schema, sort_keys=True, separators=(",", ":"), ensure_ascii=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class ValidatorCache:
+    """Bounded LRU of compiled JSON schema validators keyed by schema hash."""
+
+    def __init__(self, *, max_entries: int = 256) -> None:
+        self._validators: OrderedDict[str, Any] = OrderedDict()
+        self._max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def configure(self, *, max_entries: int | None = None) -> None:
+        if max_entries is not None:
+            with self._lock:
+                self._max_entries = max(1, int(max_entries))
+                self._evict_over_limit()
+
+    def get(self, schema: dict[str, Any]) -> Any:
+        """Return a validator for ``schema``, checking and compiling it on first use."""
+        key = schema_hash(schema)
+        with self._lock:
+            validator = self._validators.get(key)
+            if validator is not None:
+                self._validators.move_to_end(key)
+                self.hits += 1
+                return validator
+            self.misses += 1
+
+        validator_cls = validator_for(schema)
+        validator_cls.check_schema(schema)
+        validator = validator_cls(schema)
+        with self._lock:
+            self._validators[key] = validator
+            self._validators.move_to_end(key)
+            self._evict_over_limit()
+        return validator
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._validators)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._validators.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _evict_over_limit(self) -> None:
+        while len(self._validators) > self._max_entries:
+            self._validators.popitem(last=False)
+
+
+SCHEMA_VALIDATOR_CACHE = ValidatorCache()
+
+
 def validate_schema(output: dict[str, Any], schema: dict[str, Any]) -> None:
     """Validate output payload against a JSON schema."""
-    try:
-        jsonschema_validate(instance=output, schema=schema)
-    except JSONSchemaValidationError as exc:
-        raise ValueError(f"schema validation failed: {exc.message}") from exc
+    validator = SCHEMA_VALIDATOR_CACHE.get(schema)
+    error = best_match(validator.iter_errors(output))
+    if error is not None:
+        raise ValueError(f"schema validation failed: {error.message}") from error
 
 
 def apply_rules(output: dict[str, Any], rules: list[Any]) -> None:
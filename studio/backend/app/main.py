@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import sys
 from collections.abc import AsyncGenerator
@@ -19,13 +20,17 @@ if str(REPO_ROOT) not in sys.path:
 
 from kora import executor as executor_module
 from kora.adapters.base import BaseAdapter
-from kora.executor import run_graph
+from kora.events import CallbackEventSink
+from kora.executor import run_graph, run_graph_async
 from kora.retrieval import build_retrieval_key
 from kora.task_ir import TaskGraph, normalize_graph, validate_graph
 from kora.telemetry import summarize_run
+from kora.templates import GraphTemplate
 
 app = FastAPI(title="KORA Studio Backend", version="0.1.0")
 RUNS: dict[str, dict[str, Any]] = {}
+BACKGROUND_RUNS: set[asyncio.Task] = set()
+SSE_POLL_S = 1.0
 EVENT_META_WHITELIST = (
     "stop_reason",
     "gate_retrieval_hit",
@@ -91,6 +96,7 @@ class RunRequest(BaseModel):
     prompt: str
     mode: str = "kora"
     adapter: str = "mock"
+    previous_run_id: str | None = None
 
 
 class _WarmDemoMiniAdapter(BaseAdapter):
@@ -185,24 +191,123 @@ def _normalize_events(raw_events: Any) -> list[dict[str, Any]]:
     return events
 
 
-def _store_run(*, prompt: str, mode: str, result: dict[str, Any]) -> str:
+class _RunChannel:
+    """Append-only event log of one run, read by any number of SSE subscribers.
+
+    Each subscriber keeps its own cursor and pulls events at the pace its
+    client consumes them, so a slow client never blocks the run or other
+    subscribers and no per-subscriber buffers build up. Must be used from the
+    event loop thread.
+    """
+
+    def __init__(self, events: list[dict[str, Any]] | None = None, *, done: bool = False) -> None:
+        self.events: list[dict[str, Any]] = list(events or [])
+        self.done = done
+        self._changed: asyncio.Event | None = None
+
+    def publish(self, event: dict[str, Any]) -> None:
+        self.events.append(event)
+        self._signal()
+
+    def finish(self) -> None:
+        self.done = True
+        self._signal()
+
+    async def wait(self, cursor: int, timeout: float) -> None:
+        """Return once events past ``cursor`` exist, the run is done, or ``timeout`` passes."""
+        if cursor < len(self.events) or self.done:
+            return
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _signal(self) -> None:
+        if self._changed is not None:
+            self._changed.set()
+            self._changed = None
+
+
+def _finished_fields(result: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "summary": summarize_run(result),
+        "ok": bool(result.get("ok", True)),
+        "done": True,
+        "incremental": {
+            "outputs": result.get("outputs", {}),
+            "fingerprints": result.get("fingerprints", {}),
+            "events": result.get("events", []),
+        },
+    }
+
+
+def _store_run(*, prompt: str, mode: str, result: dict[str, Any], adapter: str | None = None) -> str:
     run_id = uuid4().hex
-    summary = summarize_run(result)
+    channel = _RunChannel(_normalize_events(result.get("events", [])), done=True)
     RUNS[run_id] = {
-        "events": _normalize_events(result.get("events", [])),
-        "summary": summary,
+        "events": channel.events,
+        "channel": channel,
         "prompt": prompt,
         "mode": mode,
-        "ok": bool(result.get("ok", True)),
-        "done": True,
+        "adapter": adapter,
+        **_finished_fields(result),
     }
     return run_id
 
 
-def _build_graph(prompt: str, adapter: str, mode: str) -> TaskGraph:
+def _start_run(
+    *,
+    prompt: str,
+    mode: str,
+    adapter: str,
+    graph: TaskGraph,
+    previous: dict[str, Any] | None,
+) -> str:
+    """Register a run and execute it in the background, publishing events as tasks finish."""
+    run_id = uuid4().hex
+    channel = _RunChannel()
+    run: dict[str, Any] = {
+        "events": channel.events,
+        "channel": channel,
+        "summary": {},
+        "prompt": prompt,
+        "mode": mode,
+        "adapter": adapter,
+        "ok": True,
+        "done": False,
+    }
+    RUNS[run_id] = run
+
+    def _on_event(event: dict[str, Any]) -> None:
+        channel.publish(*_normalize_events([event]))
+
+    async def _execute() -> None:
+        try:
+            result = await run_graph_async(
+                graph,
+                incremental=True,
+                previous=previous,
+                event_sink=CallbackEventSink(_on_event),
+            )
+            run.update(_finished_fields(result))
+        except Exception as exc:  # surface unexpected executor failures to subscribers
+            run.update({"summary": {"ok": False, "error": str(exc)}, "ok": False, "done": True})
+        finally:
+            channel.finish()
+
+    background = asyncio.ensure_future(_execute())
+    BACKGROUND_RUNS.add(background)
+    background.add_done_callback(BACKGROUND_RUNS.discard)
+    return run_id
+
+
+@functools.lru_cache(maxsize=None)
+def _graph_template(adapter: str, mode: str) -> GraphTemplate:
     if mode == "direct":
         payload = {
-            "graph_id": f"studio-{uuid4().hex[:8]}",
+            "graph_id": "studio",
             "version": "0.1",
             "root": "task_llm",
             "defaults": {"budget": {"max_time_ms": 3000, "max_tokens": 400, "max_retries": 1}},
@@ -216,7 +321,7 @@ def _build_graph(prompt: str, adapter: str, mode: str) -> TaskGraph:
                         "kind": "llm",
                         "spec": {
                             "adapter": adapter,
-                            "input": {"question": prompt},
+                            "input": {"question": "{{prompt}}"},
                             "output_schema": {
                                 "type": "object",
                                 "properties": {
@@ -240,13 +345,10 @@ def _build_graph(prompt: str, adapter: str, mode: str) -> TaskGraph:
                 }
             ],
         }
-        graph = TaskGraph.model_validate(payload)
-        normalized = normalize_graph(graph)
-        validate_graph(normalized)
-        return normalized
+        return GraphTemplate(payload)
 
     payload = {
-        "graph_id": f"studio-{uuid4().hex[:8]}",
+        "graph_id": "studio",
         "version": "0.1",
         "root": "task_llm",
         "defaults": {"budget": {"max_time_ms": 3000, "max_tokens": 400, "max_retries": 1}},
@@ -255,8 +357,8 @@ def _build_graph(prompt: str, adapter: str, mode: str) -> TaskGraph:
                 "id": "task_pre",
                 "type": "det.classify_simple",
                 "deps": [],
-                "in": {"text": prompt},
-                "run": {"kind": "det", "spec": {"handler": "classify_simple", "args": {"text": prompt}}},
+                "in": {"text": "{{prompt}}"},
+                "run": {"kind": "det", "spec": {"handler": "classify_simple", "args": {"text": "{{prompt}}"}}},
                 "verify": {
                     "schema": {"type": "object", "required": ["status", "task_id", "is_simple"]},
                     "rules": [{"kind": "required", "paths": ["status", "task_id", "is_simple"]}],
@@ -273,7 +375,7 @@ def _build_graph(prompt: str, adapter: str, mode: str) -> TaskGraph:
                     "kind": "llm",
                     "spec": {
                         "adapter": adapter,
-                        "input": {"question": prompt, "skip_if": {"path": "$.is_simple", "equals": True}},
+                        "input": {"question": "{{prompt}}", "skip_if": {"path": "$.is_simple", "equals": True}},
                         "output_schema": {
                             "type": "object",
                             "properties": {
@@ -294,10 +396,11 @@ def _build_graph(prompt: str, adapter: str, mode: str) -> TaskGraph:
             },
         ],
     }
-    graph = TaskGraph.model_validate(payload)
-    normalized = normalize_graph(graph)
-    validate_graph(normalized)
-    return normalized
+    return GraphTemplate(payload)
+
+
+def _build_graph(prompt: str, adapter: str, mode: str) -> TaskGraph:
+    return _graph_template(adapter, mode).bind({"prompt": prompt}, graph_id=f"studio-{uuid4().hex[:8]}")
 
 
 def _build_retrieval_warm_demo_graph(enable_gate_retrieval: bool) -> TaskGraph:
@@ -376,12 +479,20 @@ def demo_trace() -> list[dict[str, Any]]:
 
 
 @app.post("/api/run")
-def run_demo(payload: RunRequest) -> dict[str, str]:
+async def run_demo(payload: RunRequest) -> dict[str, str]:
     adapter = payload.adapter if payload.adapter in {"openai", "mock"} else "mock"
     mode = payload.mode if payload.mode in {"kora", "direct"} else "kora"
     graph = _build_graph(payload.prompt, adapter=adapter, mode=mode)
-    result = run_graph(graph)
-    run_id = _store_run(prompt=payload.prompt, mode=mode, result=result)
+    previous_run = RUNS.get(payload.previous_run_id or "")
+    previous = None
+    if (
+        previous_run is not None
+        and previous_run.get("done")
+        and previous_run.get("mode") == mode
+        and previous_run.get("adapter") == adapter
+    ):
+        previous = previous_run.get("incremental")
+    run_id = _start_run(prompt=payload.prompt, mode=mode, adapter=adapter, graph=graph, previous=previous)
     return {"run_id": run_id}
 
 
@@ -436,6 +547,25 @@ def run_history() -> list[dict[str, Any]]:
     ]
 
 
+def _station_payload(event: dict[str, Any]) -> str:
+    payload_obj: dict[str, Any] = {
+        "stage": str(event.get("stage", "UNKNOWN")),
+        "status": str(event.get("status", "ok")),
+        "time_ms": int(event.get("time_ms") or 0),
+    }
+    if "skipped" in event:
+        payload_obj["skipped"] = bool(event.get("skipped"))
+    usage = event.get("usage")
+    if isinstance(usage, dict):
+        if "tokens_in" in usage:
+            payload_obj["tokens_in"] = int(usage.get("tokens_in", 0))
+        if "tokens_out" in usage:
+            payload_obj["tokens_out"] = int(usage.get("tokens_out", 0))
+    meta = event.get("meta")
+    payload_obj["meta"] = meta if isinstance(meta, dict) else {}
+    return json.dumps(payload_obj, separators=(",", ":"))
+
+
 @app.get("/api/sse_run")
 async def sse_run(request: Request, run_id: str | None = None) -> StreamingResponse:
     run = RUNS.get(run_id or "")
@@ -445,38 +575,19 @@ async def sse_run(request: Request, run_id: str | None = None) -> StreamingRespo
 
     async def _run_stream() -> AsyncGenerator[str, None]:
         assert isinstance(run, dict)
-        events = run.get("events", [])
-        if not isinstance(events, list):
-            events = []
-
-        for event in events:
+        channel = run["channel"]
+        cursor = 0
+        while True:
             if await request.is_disconnected():
                 return
-            if not isinstance(event, dict):
-                continue
-            stage = str(event.get("stage", "UNKNOWN"))
-            status = str(event.get("status", "ok"))
-            payload_obj: dict[str, Any] = {
-                "stage": stage,
-                "status": status,
-                "time_ms": int(event.get("time_ms", 0)),
-            }
-            if "skipped" in event:
-                payload_obj["skipped"] = bool(event.get("skipped"))
-            usage = event.get("usage")
-            if isinstance(usage, dict):
-                if "tokens_in" in usage:
-                    payload_obj["tokens_in"] = int(usage.get("tokens_in", 0))
-                if "tokens_out" in usage:
-                    payload_obj["tokens_out"] = int(usage.get("tokens_out", 0))
-            meta = event.get("meta")
-            if isinstance(meta, dict):
-                payload_obj["meta"] = meta
-            else:
-                payload_obj["meta"] = {}
-            payload = json.dumps(payload_obj, separators=(",", ":"))
-            yield f"event: station\ndata: {payload}\n\n"
-            await asyncio.sleep(0.3)
+            await channel.wait(cursor, SSE_POLL_S)
+            while cursor < len(channel.events):
+                event = channel.events[cursor]
+                cursor += 1
+                if isinstance(event, dict):
+                    yield f"event: station\ndata: {_station_payload(event)}\n\n"
+            if channel.done and cursor >= len(channel.events):
+                break
 
         if await request.is_disconnected():
             return
@@ -0,0 +1,101 @@
+from typing import Any
+
+from kora.adapters.base import BaseAdapter
+from kora.adapters.openai_adapter import OpenAIAdapter
+from kora.executor import _AdapterRegistry
+
+
+class CountingAdapter(BaseAdapter):
+    created = 0
+    closed = 0
+
+    def __init__(self, label: str = "default") -> None:
+        CountingAdapter.created += 1
+        self.label = label
+
+    def run(
+        self,
+        *,
+        task_id: str,
+        input: dict[str, Any],
+        budget: dict[str, Any],
+        output_schema: dict[str, Any],
+    ) -> dict[str, Any]:
+        del input, budget, output_schema
+        return {"ok": True, "output": {"status": "ok", "task_id": task_id}, "usage": {}, "meta": {}}
+
+    def close(self) -> None:
+        CountingAdapter.closed += 1
+
+
+def test_registry_reuses_adapter_instances_until_closed() -> None:
+    CountingAdapter.created = 0
+    CountingAdapter.closed = 0
+    _AdapterRegistry.providers["counting"] = CountingAdapter
+    try:
+        first = _AdapterRegistry.get("counting")
+        assert _AdapterRegistry.get("counting") is first
+        assert CountingAdapter.created == 1
+
+        _AdapterRegistry.configure("counting", label="tuned")
+        tuned = _AdapterRegistry.get("counting")
+        assert tuned is not first
+        assert tuned.label == "tuned"
+        assert CountingAdapter.closed == 1
+
+        _AdapterRegistry.close("counting")
+        assert CountingAdapter.closed == 2
+        assert _AdapterRegistry.get("counting") is not tuned
+    finally:
+        _AdapterRegistry.close("counting")
+        _AdapterRegistry.options.pop("counting", None)
+        del _AdapterRegistry.providers["counting"]
+
+
+def test_registry_replaced_provider_class_gets_fresh_instance() -> None:
+    class OtherAdapter(CountingAdapter):
+        pass
+
+    CountingAdapter.closed = 0
+    _AdapterRegistry.providers["counting"] = CountingAdapter
+    try:
+        first = _AdapterRegistry.get("counting")
+        _AdapterRegistry.providers["counting"] = OtherAdapter
+        assert isinstance(_AdapterRegistry.get("counting"), OtherAdapter)
+        assert _AdapterRegistry.get("counting") is not first
+        assert CountingAdapter.closed == 1
+    finally:
+        _AdapterRegistry.close("counting")
+        del _AdapterRegistry.providers["counting"]
+
+
+def test_openai_adapter_reuses_session_for_requests(monkeypatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    adapter = OpenAIAdapter(pool_size=4)
+    sessions: list[Any] = []
+
+    class _Response:
+        status_code = 200
+
+        @staticmethod
+        def json() -> dict[str, Any]:
+            return {
+                "output_text": '{"status": "ok", "task_id": "t", "answer": "a"}',
+                "usage": {"input_tokens": 3, "output_tokens": 5},
+            }
+
+    def _post(url: str, **kwargs: Any) -> _Response:
+        del url, kwargs
+        sessions.append(adapter._session)
+        return _Response()
+
+    monkeypatch.setattr(adapter._session, "post", _post)
+    for _ in range(2):
+        result = adapter.run(task_id="t", input={"question": "q"}, budget={}, output_schema={"type": "object"})
+        assert result["ok"] is True
+        assert result["usage"]["tokens_out"] == 5
+
+    assert len(sessions) == 2
+    assert sessions[0] is sessions[1]
+    assert adapter._session.get_adapter("https://api.openai.com")._pool_maxsize == 4
+    adapter.close()
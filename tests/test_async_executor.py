@@ -0,0 +1,111 @@
+import asyncio
+import time
+from typing import Any
+
+from kora import executor as executor_module
+from kora.adapters.base import AsyncBaseAdapter
+from kora.executor import run_graph, run_graph_async
+from kora.task_ir import TaskGraph, normalize_graph, validate_graph
+
+
+class AsyncSleepAdapter(AsyncBaseAdapter):
+    delay_s = 0.2
+
+    async def arun(
+        self,
+        *,
+        task_id: str,
+        input: dict[str, Any],
+        budget: dict[str, Any],
+        output_schema: dict[str, Any],
+    ) -> dict[str, Any]:
+        del budget, output_schema
+        await asyncio.sleep(AsyncSleepAdapter.delay_s)
+        return {
+            "ok": True,
+            "output": {"status": "ok", "task_id": task_id, "answer": str(input.get("question", ""))},
+            "usage": {"time_ms": int(AsyncSleepAdapter.delay_s * 1000), "tokens_in": 1, "tokens_out": 1},
+            "meta": {"adapter": "async_sleep", "model": "async-v0"},
+        }
+
+
+def _fan_out_graph(adapter: str, branches: int) -> TaskGraph:
+    graph = TaskGraph.model_validate(
+        {
+            "graph_id": "async-fan-out",
+            "version": "0.1",
+            "root": "task_join",
+            "defaults": {"budget": {"max_time_ms": 1500, "max_tokens": 300, "max_retries": 0}},
+            "tasks": [
+                *[
+                    {
+                        "id": f"task_llm_{index}",
+                        "type": "llm.answer",
+                        "deps": [],
+                        "in": {},
+                        "run": {
+                            "kind": "llm",
+                            "spec": {
+                                "adapter": adapter,
+                                "input": {"question": f"q{index}"},
+                                "output_schema": {"type": "object", "required": ["status", "task_id", "answer"]},
+                            },
+                        },
+                        "policy": {"on_fail": "fail"},
+                        "tags": [],
+                    }
+                    for index in range(branches)
+                ],
+                {
+                    "id": "task_join",
+                    "type": "det.echo",
+                    "deps": [f"task_llm_{index}" for index in range(branches)],
+                    "in": {"message": "joined"},
+                    "run": {"kind": "det", "spec": {"handler": "echo", "args": {}}},
+                    "policy": {"on_fail": "fail"},
+                    "tags": [],
+                },
+            ],
+        }
+    )
+    normalized = normalize_graph(graph)
+    validate_graph(normalized)
+    return normalized
+
+
+def test_run_graph_async_overlaps_async_adapter_calls() -> None:
+    executor_module._AdapterRegistry.providers["async_sleep"] = AsyncSleepAdapter
+    try:
+        graph = _fan_out_graph("async_sleep", 5)
+        start = time.monotonic()
+        result = asyncio.run(run_graph_async(graph))
+        elapsed = time.monotonic() - start
+    finally:
+        del executor_module._AdapterRegistry.providers["async_sleep"]
+
+    assert result["ok"] is True
+    assert result["final"]["message"] == "joined"
+    assert elapsed < 3 * AsyncSleepAdapter.delay_s
+    assert [event["task_id"] for event in result["events"]] == result["order"]
+
+
+def test_run_graph_async_shims_sync_adapters() -> None:
+    graph = _fan_out_graph("mock", 2)
+
+    async_result = asyncio.run(run_graph_async(graph, max_concurrency=1))
+    sync_result = run_graph(graph)
+
+    assert async_result["ok"] is True
+    assert async_result["outputs"] == sync_result["outputs"]
+    assert [e["task_id"] for e in async_result["events"]] == [e["task_id"] for e in sync_result["events"]]
+
+
+def test_async_adapter_runs_under_sync_executor() -> None:
+    executor_module._AdapterRegistry.providers["async_sleep"] = AsyncSleepAdapter
+    try:
+        result = run_graph(_fan_out_graph("async_sleep", 1))
+    finally:
+        del executor_module._AdapterRegistry.providers["async_sleep"]
+
+    assert result["ok"] is True
+    assert result["outputs"]["task_llm_0"]["answer"] == "q0"
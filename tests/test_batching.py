@@ -0,0 +1,139 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from kora import executor as executor_module
+from kora.adapters.base import BaseAdapter
+from kora.batching import MICRO_BATCHER, MicroBatcher
+from kora.executor import run_graph, run_graph_async
+from kora.task_ir import TaskGraph, normalize_graph, validate_graph
+
+
+class _RecordingBatchAdapter(BaseAdapter):
+    supports_batch = True
+
+    def __init__(self, *, fail: bool = False) -> None:
+        self.fail = fail
+        self.batch_sizes: list[int] = []
+
+    def run_batch(self, requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        self.batch_sizes.append(len(requests))
+        if self.fail:
+            raise RuntimeError("batch endpoint down")
+        return [{"ok": True, "output": {"task_id": request["task_id"]}} for request in requests]
+
+
+def _request(task_id: str, schema: dict[str, Any] | None = None) -> dict[str, Any]:
+    return {"task_id": task_id, "input": {}, "budget": {}, "output_schema": schema or {"type": "object"}}
+
+
+def test_micro_batcher_groups_requests_within_window() -> None:
+    batcher = MicroBatcher(window_ms=50, max_batch_size=8)
+    adapter = _RecordingBatchAdapter()
+
+    futures = [batcher.submit(adapter, _request(f"t{index}")) for index in range(4)]
+    other = batcher.submit(adapter, _request("s0", {"type": "object", "required": ["x"]}))
+
+    assert [future.result(timeout=1)["output"]["task_id"] for future in futures] == ["t0", "t1", "t2", "t3"]
+    assert other.result(timeout=1)["output"]["task_id"] == "s0"
+    assert sorted(adapter.batch_sizes) == [1, 4]
+
+
+def test_micro_batcher_flushes_full_batches_and_propagates_errors() -> None:
+    batcher = MicroBatcher(window_ms=1000, max_batch_size=2)
+    adapter = _RecordingBatchAdapter(fail=True)
+
+    futures = [batcher.submit(adapter, _request(f"t{index}")) for index in range(2)]
+
+    for future in futures:
+        with pytest.raises(RuntimeError, match="batch endpoint down"):
+            future.result(timeout=0.5)
+    assert adapter.batch_sizes == [2]
+
+
+def test_micro_batcher_skips_cancelled_requests_and_resolves_the_rest() -> None:
+    batcher = MicroBatcher(window_ms=50, max_batch_size=8)
+    adapter = _RecordingBatchAdapter()
+
+    futures = [batcher.submit(adapter, _request(f"t{index}")) for index in range(3)]
+    assert futures[1].cancel()
+
+    assert futures[0].result(timeout=1)["output"]["task_id"] == "t0"
+    assert futures[2].result(timeout=1)["output"]["task_id"] == "t2"
+    assert adapter.batch_sizes == [2]
+
+
+def _graph(index: int, max_time_ms: int = 1500) -> TaskGraph:
+    graph = TaskGraph.model_validate(
+        {
+            "graph_id": f"batch-{index}",
+            "version": "0.1",
+            "root": "task_llm",
+            "defaults": {"budget": {"max_time_ms": max_time_ms, "max_tokens": 300, "max_retries": 0}},
+            "budget": {"max_time_ms": 5000},
+            "tasks": [
+                {
+                    "id": "task_llm",
+                    "type": "llm.answer",
+                    "deps": [],
+                    "in": {},
+                    "run": {
+                        "kind": "llm",
+                        "spec": {
+                            "adapter": "mock_batch",
+                            "input": {"question": f"q{index}"},
+                            "output_schema": {"type": "object", "required": ["status", "task_id", "answer"]},
+                        },
+                    },
+                    "policy": {"on_fail": "fail"},
+                    "tags": [],
+                }
+            ],
+        }
+    )
+    normalized = normalize_graph(graph)
+    validate_graph(normalized)
+    return normalized
+
+
+def test_concurrent_graphs_share_batched_adapter_calls() -> None:
+    window_ms = MICRO_BATCHER.window_ms
+    MICRO_BATCHER.configure(window_ms=50)
+    executor_module._AdapterRegistry.close("mock_batch")
+    try:
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(pool.map(run_graph, [_graph(index) for index in range(6)]))
+        adapter = executor_module._AdapterRegistry.get("mock_batch")
+        batch_sizes = list(adapter.batch_sizes)
+    finally:
+        MICRO_BATCHER.configure(window_ms=window_ms)
+        executor_module._AdapterRegistry.close("mock_batch")
+
+    assert all(result["ok"] for result in results)
+    assert [result["final"]["answer"] for result in results] == [f"Mock answer for: q{i}" for i in range(6)]
+    assert sum(batch_sizes) == 6
+    assert max(batch_sizes) > 1
+    assert {result["events"][0]["meta"]["batch_size"] for result in results} <= set(batch_sizes)
+
+
+def test_deadline_cancelled_async_call_does_not_strand_its_batch() -> None:
+    window_ms = MICRO_BATCHER.window_ms
+    MICRO_BATCHER.configure(window_ms=30)
+    executor_module._AdapterRegistry.close("mock_batch")
+
+    async def _main() -> list[dict[str, Any]]:
+        runs = [run_graph_async(_graph(0, max_time_ms=12)), run_graph_async(_graph(1))]
+        return await asyncio.wait_for(asyncio.gather(*runs), timeout=5)
+
+    try:
+        breached, finished = asyncio.run(_main())
+    finally:
+        MICRO_BATCHER.configure(window_ms=window_ms)
+        executor_module._AdapterRegistry.close("mock_batch")
+
+    assert breached["ok"] is False
+    assert breached["error"]["error_type"] == "BUDGET_BREACH"
+    assert finished["ok"] is True
+    assert finished["final"]["answer"] == "Mock answer for: q1"
@@ -1,2 +1,187 @@
+import time
+from typing import Any
+
+from kora import executor as executor_module
+from kora.adapters.base import BaseAdapter
+from kora.budget import BudgetLedger, BudgetManager, LatencyTracker
+from kora.executor import ADAPTER_LATENCY, run_graph
+from kora.task_ir import TaskGraph, normalize_graph, validate_graph
+
+
 def test_budget_placeholder() -> None:
     assert True
+
+
+class _SleepyAdapter(BaseAdapter):
+    delay_s = 0.5
+    calls = 0
+
+    def run(
+        self,
+        *,
+        task_id: str,
+        input: dict[str, Any],
+        budget: dict[str, Any],
+        output_schema: dict[str, Any],
+    ) -> dict[str, Any]:
+        del input, budget, output_schema
+        _SleepyAdapter.calls += 1
+        time.sleep(_SleepyAdapter.delay_s)
+        return {
+            "ok": True,
+            "output": {"status": "ok", "task_id": task_id, "answer": "slow"},
+            "usage": {"time_ms": 500, "tokens_in": 1, "tokens_out": 1},
+            "meta": {"adapter": "sleepy", "model": "sleepy", "confidence": 0.1},
+        }
+
+
+def _llm_graph(*, max_time_ms: int, graph_budget: dict | None, adaptive: dict | None = None) -> TaskGraph:
+    policy: dict[str, Any] = {
+        "budget": {"max_time_ms": max_time_ms, "max_tokens": 300, "max_retries": 2},
+        "on_fail": "retry",
+    }
+    if adaptive is not None:
+        policy["adaptive"] = adaptive
+    payload: dict[str, Any] = {
+        "graph_id": "deadline-demo",
+        "version": "0.1",
+        "root": "task_llm",
+        "defaults": {"budget": {"max_time_ms": 1500, "max_tokens": 300, "max_retries": 1}},
+        "tasks": [
+            {
+                "id": "task_llm",
+                "type": "llm.answer",
+                "deps": [],
+                "in": {},
+                "run": {
+                    "kind": "llm",
+                    "spec": {
+                        "adapter": "sleepy",
+                        "input": {"question": "q"},
+                        "output_schema": {"type": "object", "required": ["status", "task_id", "answer"]},
+                    },
+                },
+                "policy": policy,
+                "tags": [],
+            }
+        ],
+    }
+    if graph_budget is not None:
+        payload["budget"] = graph_budget
+    normalized = normalize_graph(TaskGraph.model_validate(payload))
+    validate_graph(normalized)
+    return normalized
+
+
+def test_budget_manager_task_deadline_is_capped_by_graph_deadline() -> None:
+    now = [100.0]
+    manager = BudgetManager(graph_max_time_ms=500, enforce_task_deadlines=True, clock=lambda: now[0])
+
+    assert manager.task_deadline(2000) == 100.5
+    assert manager.task_deadline(100) == 100.1
+    assert manager.can_fit(100.5, 400.0) is True
+    assert manager.can_fit(100.5, 600.0) is False
+    now[0] = 100.6
+    assert manager.expired(100.5) is True
+
+
+def test_budget_manager_without_limits_is_disabled() -> None:
+    manager = BudgetManager()
+
+    assert manager.task_deadline(10) is None
+    assert manager.expired(None) is False
+    assert manager.can_fit(None, 10_000.0) is True
+
+
+def test_latency_tracker_percentiles() -> None:
+    tracker = LatencyTracker(window=4)
+    for value in (10.0, 20.0, 30.0, 40.0, 50.0):
+        tracker.record("a", value)
+
+    assert tracker.count("a") == 4
+    assert tracker.percentile("a", 0.5) == 30.0
+    assert tracker.percentile("a", 0.99) == 50.0
+    assert tracker.percentile("missing", 0.5) is None
+
+
+def test_task_deadline_abandons_slow_adapter_call_with_budget_breach() -> None:
+    executor_module._AdapterRegistry.providers["sleepy"] = _SleepyAdapter
+    _SleepyAdapter.calls = 0
+    try:
+        start = time.monotonic()
+        result = run_graph(_llm_graph(max_time_ms=100, graph_budget={}))
+        elapsed = time.monotonic() - start
+    finally:
+        del executor_module._AdapterRegistry.providers["sleepy"]
+
+    assert result["ok"] is False
+    assert result["error"]["error_type"] == "BUDGET_BREACH"
+    assert result["error"]["stage"] == "BUDGET"
+    assert result["error"]["budget_breached"] is True
+    assert elapsed < _SleepyAdapter.delay_s
+    assert _SleepyAdapter.calls == 1
+    assert result["budget"]["calls"] == 1
+    assert result["budget"]["tokens_out"] == 300
+
+
+def test_escalation_skipped_when_next_stage_cannot_finish_in_time() -> None:
+    class _FastAdapter(_SleepyAdapter):
+        delay_s = 0.0
+
+    executor_module._AdapterRegistry.providers["sleepy"] = _FastAdapter
+    executor_module._AdapterRegistry.providers["sleepy:full"] = _SleepyAdapter
+    ADAPTER_LATENCY.record("sleepy:full", 60_000.0)
+    try:
+        result = run_graph(
+            _llm_graph(
+                max_time_ms=5000,
+                graph_budget={"max_time_ms": 5000},
+                adaptive={"escalation_order": ["full"], "use_voi": False, "self_consistency_enabled": False},
+            )
+        )
+    finally:
+        del executor_module._AdapterRegistry.providers["sleepy"]
+        del executor_module._AdapterRegistry.providers["sleepy:full"]
+        ADAPTER_LATENCY.clear()
+
+    assert result["ok"] is True
+    llm_events = [event for event in result["events"] if event["task_id"] == "task_llm"]
+    assert len(llm_events) == 1
+    assert llm_events[0]["meta"]["stop_reason"] == "deadline_insufficient"
+
+
+def test_budget_ledger_accumulates_tokens_and_cost() -> None:
+    ledger = BudgetLedger(max_tokens=2000, max_cost_usd=1.0)
+    usage = {"tokens_in": 1000, "tokens_out": 500}
+    ledger.charge({"usage": usage, "meta": {"model": "gpt-4o-mini"}})
+    assert ledger.exhausted() is None
+
+    ledger.charge({"usage": usage, "meta": {"model": "gpt-4o-mini"}})
+    snapshot = ledger.snapshot()
+    assert snapshot["calls"] == 2
+    assert snapshot["tokens_in"] == 2000
+    assert snapshot["tokens_out"] == 1000
+    assert snapshot["cost_usd"] == 0.0009
+    assert "token budget exhausted" in str(ledger.exhausted())
+
+
+def test_graph_token_cap_refuses_further_adapter_calls() -> None:
+    class _FastAdapter(_SleepyAdapter):
+        delay_s = 0.0
+
+    graph = _llm_graph(max_time_ms=1000, graph_budget={"max_tokens": 2})
+    second = graph.tasks[0].model_copy(update={"id": "task_llm_2", "deps": ["task_llm"]})
+    graph = graph.model_copy(update={"tasks": [graph.tasks[0], second], "root": "task_llm_2"})
+
+    executor_module._AdapterRegistry.providers["sleepy"] = _FastAdapter
+    _SleepyAdapter.calls = 0
+    try:
+        result = run_graph(graph)
+    finally:
+        del executor_module._AdapterRegistry.providers["sleepy"]
+
+    assert result["ok"] is False
+    assert result["error"]["task_id"] == "task_llm_2"
+    assert result["error"]["error_type"] == "BUDGET_BREACH"
+    assert _SleepyAdapter.calls == 1
+    assert result["budget"]["tokens_in"] + result["budget"]["tokens_out"] == 2
@@ -0,0 +1,111 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from kora import executor as executor_module
+from kora.checkpoint import CheckpointSink, FileCheckpointSink, SQLiteCheckpointSink
+from kora.executor import resume_graph, run_graph
+from kora.task_ir import Task, TaskGraph, normalize_graph, validate_graph
+
+
+class _Worker:
+    calls: list[str] = []
+    crash_on: str | None = None
+
+
+def _step_handler(task: Task, state: dict[str, Any]) -> dict[str, Any]:
+    _Worker.calls.append(task.id)
+    if task.id == _Worker.crash_on:
+        raise RuntimeError("worker evicted")
+    total = sum(int(state["outputs"][dep]["total"]) for dep in task.deps)
+    return {"status": "ok", "task_id": task.id, "total": total + int(task.in_["value"])}
+
+
+def _graph() -> TaskGraph:
+    graph = TaskGraph.model_validate(
+        {
+            "graph_id": "checkpointed",
+            "version": "0.1",
+            "root": "task_c",
+            "defaults": {"budget": {"max_time_ms": 2000, "max_tokens": 0, "max_retries": 0}},
+            "tasks": [
+                {
+                    "id": task_id,
+                    "type": "det.step",
+                    "deps": deps,
+                    "in": {"value": value},
+                    "run": {"kind": "det", "spec": {"handler": "checkpoint_step", "args": {}}},
+                    "policy": {"on_fail": "fail"},
+                }
+                for task_id, deps, value in (("task_a", [], 1), ("task_b", ["task_a"], 10), ("task_c", ["task_b"], 100))
+            ],
+        }
+    )
+    normalized = normalize_graph(graph)
+    validate_graph(normalized)
+    return normalized
+
+
+def _file_sink(path: Path) -> CheckpointSink:
+    return FileCheckpointSink(path / "checkpoints.jsonl")
+
+
+def _sqlite_sink(path: Path) -> CheckpointSink:
+    return SQLiteCheckpointSink(path / "checkpoints.db")
+
+
+@pytest.mark.parametrize("make_sink", [_file_sink, _sqlite_sink])
+def test_resume_graph_skips_checkpointed_tasks(tmp_path: Path, make_sink) -> None:
+    executor_module.DETERMINISTIC_HANDLERS["checkpoint_step"] = _step_handler
+    sink = make_sink(tmp_path)
+    try:
+        _Worker.calls, _Worker.crash_on = [], "task_b"
+        crashed = run_graph(_graph(), checkpoint=sink)
+        assert crashed["ok"] is False
+        assert list(sink.load("checkpointed")["outputs"]) == ["task_a"]
+
+        reopened = make_sink(tmp_path)
+        _Worker.calls, _Worker.crash_on = [], None
+        resumed = resume_graph(_graph(), reopened)
+        reopened.close()
+    finally:
+        del executor_module.DETERMINISTIC_HANDLERS["checkpoint_step"]
+        sink.close()
+
+    assert resumed["ok"] is True
+    assert _Worker.calls == ["task_b", "task_c"]
+    assert resumed["final"]["total"] == 111
+    assert resumed["events"][0]["reused"] is True
+
+
+def test_resume_graph_rejects_explicit_previous(tmp_path: Path) -> None:
+    sink = SQLiteCheckpointSink(tmp_path / "checkpoints.db")
+    try:
+        with pytest.raises(TypeError, match="previous"):
+            resume_graph(_graph(), sink, previous={"outputs": {}})
+    finally:
+        sink.close()
+
+
+def test_file_checkpoint_ignores_torn_trailing_line(tmp_path: Path) -> None:
+    sink = FileCheckpointSink(tmp_path / "checkpoints.jsonl")
+    sink.record("g", "t1", fingerprint="f1", output={"x": 1}, events=[{"task_id": "t1"}])
+    sink.record("other", "t1", fingerprint="f9", output={"x": 9}, events=[])
+    sink.close()
+    with open(tmp_path / "checkpoints.jsonl", "a", encoding="utf-8") as handle:
+        handle.write('{"graph_id": "g", "task_id": "t2", "outp')
+
+    reopened = FileCheckpointSink(tmp_path / "checkpoints.jsonl")
+    reopened.record("g", "t3", fingerprint="f3", output={"x": 3}, events=[])
+    loaded = reopened.load("g")
+    reopened.clear("g")
+    remaining = reopened.load("other")
+    reopened.close()
+
+    assert loaded == {
+        "outputs": {"t1": {"x": 1}, "t3": {"x": 3}},
+        "fingerprints": {"t1": "f1", "t3": "f3"},
+        "events": [{"task_id": "t1"}],
+    }
+    assert remaining["outputs"] == {"t1": {"x": 9}}
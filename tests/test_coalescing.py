@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from kora import executor as executor_module
+from kora.adapters.base import BaseAdapter
+from kora.executor import run_graph, run_graph_async
+from kora.task_ir import TaskGraph, normalize_graph, validate_graph
+
+
+class _CountingSlowAdapter(BaseAdapter):
+    calls = 0
+    fail_first = False
+    _lock = threading.Lock()
+
+    def run(
+        self,
+        *,
+        task_id: str,
+        input: dict[str, Any],
+        budget: dict[str, Any],
+        output_schema: dict[str, Any],
+    ) -> dict[str, Any]:
+        del budget, output_schema
+        with _CountingSlowAdapter._lock:
+            index = _CountingSlowAdapter.calls
+            _CountingSlowAdapter.calls += 1
+        time.sleep(0.2)
+        if _CountingSlowAdapter.fail_first and index == 0:
+            return {"ok": False, "error": "upstream outage", "usage": {}, "meta": {}}
+        return {
+            "ok": True,
+            "output": {"status": "ok", "task_id": task_id, "answer": str(input.get("question", ""))},
+            "usage": {"time_ms": 200, "tokens_in": 1, "tokens_out": 1},
+            "meta": {"adapter": "herd", "model": "mock-herd"},
+        }
+
+
+def _graph(question: str, *, coalesce: bool = True, max_tokens: int = 300, required: tuple[str, ...] = ()) -> TaskGraph:
+    graph = TaskGraph.model_validate(
+        {
+            "graph_id": "coalesce-demo",
+            "version": "0.1",
+            "root": "task_llm",
+            "defaults": {"budget": {"max_time_ms": 1500, "max_tokens": max_tokens, "max_retries": 0}},
+            "tasks": [
+                {
+                    "id": "task_llm",
+                    "type": "llm.answer",
+                    "deps": [],
+                    "in": {},
+                    "run": {
+                        "kind": "llm",
+                        "spec": {
+                            "adapter": "herd",
+                            "input": {"question": question},
+                            "output_schema": {
+                                "type": "object",
+                                "required": ["status", "task_id", "answer", *required],
+                            },
+                        },
+                    },
+                    "policy": {"on_fail": "fail", "coalesce": coalesce},
+                    "tags": [],
+                }
+            ],
+        }
+    )
+    normalized = normalize_graph(graph)
+    validate_graph(normalized)
+    return normalized
+
+
+def _run_burst(graphs: list[TaskGraph], *, fail_first: bool = False) -> list[dict[str, Any]]:
+    executor_module._AdapterRegistry.providers["herd"] = _CountingSlowAdapter
+    _CountingSlowAdapter.calls = 0
+    _CountingSlowAdapter.fail_first = fail_first
+    try:
+        with ThreadPoolExecutor(max_workers=len(graphs)) as pool:
+            return list(pool.map(run_graph, graphs))
+    finally:
+        del executor_module._AdapterRegistry.providers["herd"]
+
+
+def test_identical_concurrent_tasks_share_one_adapter_call() -> None:
+    results = _run_burst([_graph("same faq") for _ in range(5)])
+
+    assert _CountingSlowAdapter.calls == 1
+    assert all(result["ok"] for result in results)
+    assert all(result["final"]["answer"] == "same faq" for result in results)
+    coalesced = [result for result in results if result["events"][0].get("coalesced")]
+    assert len(coalesced) == 4
+    assert all(result["events"][0]["usage"] == {} for result in coalesced)
+    assert results[0]["final"] is not results[1]["final"]
+
+
+def test_different_inputs_and_opted_out_tasks_are_not_coalesced() -> None:
+    _run_burst([_graph("faq a"), _graph("faq b")])
+    assert _CountingSlowAdapter.calls == 2
+
+    _run_burst([_graph("faq a", coalesce=False) for _ in range(3)])
+    assert _CountingSlowAdapter.calls == 3
+
+
+def test_tasks_with_different_schema_or_budget_are_not_coalesced() -> None:
+    _run_burst([_graph("faq"), _graph("faq", max_tokens=50), _graph("faq", required=("answer",))])
+    assert _CountingSlowAdapter.calls == 3
+
+
+def test_followers_run_independently_when_leader_fails() -> None:
+    results = _run_burst([_graph("flaky faq") for _ in range(3)], fail_first=True)
+
+    assert _CountingSlowAdapter.calls == 3
+    assert sum(1 for result in results if result["ok"]) == 2
+
+
+def test_async_executor_coalesces_identical_tasks() -> None:
+    async def _burst() -> list[dict[str, Any]]:
+        return list(await asyncio.gather(*(run_graph_async(_graph("async faq")) for _ in range(4))))
+
+    executor_module._AdapterRegistry.providers["herd"] = _CountingSlowAdapter
+    _CountingSlowAdapter.calls = 0
+    _CountingSlowAdapter.fail_first = False
+    try:
+        results = asyncio.run(_burst())
+    finally:
+        del executor_module._AdapterRegistry.providers["herd"]
+
+    assert _CountingSlowAdapter.calls == 1
+    assert all(result["final"]["answer"] == "async faq" for result in results)
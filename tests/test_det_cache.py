@@ -0,0 +1,70 @@
+from typing import Any
+
+from kora import executor as executor_module
+from kora.executor import run_graph
+from kora.task_ir import Task, TaskGraph, normalize_graph, validate_graph
+
+
+class _Counter:
+    calls = 0
+
+
+def _count_handler(task: Task, state: dict[str, Any]) -> dict[str, Any]:
+    del state
+    _Counter.calls += 1
+    return {"status": "ok", "task_id": task.id, "length": len(str(task.in_.get("text", "")))}
+
+
+def _graph(text: str, *, cacheable: bool = True) -> TaskGraph:
+    graph = TaskGraph.model_validate(
+        {
+            "graph_id": "det-cache",
+            "version": "0.1",
+            "root": "task_len",
+            "defaults": {"budget": {"max_time_ms": 2000, "max_tokens": 0, "max_retries": 0}},
+            "tasks": [
+                {
+                    "id": "task_len",
+                    "type": "det.length",
+                    "deps": [],
+                    "in": {"text": text},
+                    "run": {"kind": "det", "spec": {"handler": "count_len", "args": {}, "cacheable": cacheable}},
+                    "verify": {"schema": {"type": "object", "required": ["length"]}},
+                }
+            ],
+        }
+    )
+    normalized = normalize_graph(graph)
+    validate_graph(normalized)
+    return normalized
+
+
+def test_cacheable_det_outputs_are_memoized_and_skip_verification(monkeypatch) -> None:
+    verify_calls: list[str] = []
+    real_verify = executor_module.verify_output
+
+    def _counting_verify(task: Task, output: dict[str, Any]) -> None:
+        verify_calls.append(task.id)
+        real_verify(task, output)
+
+    monkeypatch.setattr(executor_module, "verify_output", _counting_verify)
+    executor_module.DETERMINISTIC_HANDLERS["count_len"] = _count_handler
+    executor_module.DET_OUTPUT_CACHE.clear()
+    _Counter.calls = 0
+    try:
+        first = run_graph(_graph("hello"))
+        first["final"]["length"] = -1
+        second = run_graph(_graph("hello"))
+        changed = run_graph(_graph("hello world"))
+        uncached = run_graph(_graph("hello", cacheable=False))
+    finally:
+        del executor_module.DETERMINISTIC_HANDLERS["count_len"]
+        executor_module.DET_OUTPUT_CACHE.clear()
+
+    assert second["final"]["length"] == 5
+    assert changed["final"]["length"] == 11
+    assert uncached["final"]["length"] == 5
+    assert _Counter.calls == 3
+    assert verify_calls == ["task_len", "task_len", "task_len"]
+    assert second["events"][-1].get("cache_hit") is True
+    assert "cache_hit" not in first["events"][-1]
@@ -0,0 +1,122 @@
+import asyncio
+import os
+from pathlib import Path
+from typing import Any
+
+from kora import executor as executor_module
+from kora.executor import run_graph, run_graph_async
+from kora.handlers import cpu_bound
+from kora.task_ir import Task, TaskGraph, normalize_graph, validate_graph
+
+
+@cpu_bound
+def _count_words(task: Task, state: dict[str, Any]) -> dict[str, Any]:
+    messages = [str(output.get("message", "")) for output in state["outputs"].values()]
+    return {
+        "status": "ok",
+        "task_id": task.id,
+        "words": sum(len(message.split()) for message in messages),
+        "pid": os.getpid(),
+        "shipped_keys": sorted(state),
+    }
+
+
+@cpu_bound
+def _crash_once(task: Task, state: dict[str, Any]) -> dict[str, Any]:
+    marker = Path(task.in_["marker"])
+    if task.in_["always"] or not marker.exists():
+        marker.touch()
+        os._exit(1)
+    return {"status": "ok", "task_id": task.id, "pid": os.getpid()}
+
+
+def _crash_graph(marker: Path, *, always: bool) -> TaskGraph:
+    graph = TaskGraph.model_validate(
+        {
+            "graph_id": "det-process-crash",
+            "version": "0.1",
+            "root": "task_crash",
+            "defaults": {"budget": {"max_time_ms": 20000, "max_tokens": 0, "max_retries": 0}},
+            "tasks": [
+                {
+                    "id": "task_crash",
+                    "type": "det.crash",
+                    "deps": [],
+                    "in": {"marker": str(marker), "always": always},
+                    "run": {"kind": "det", "spec": {"handler": "crash_once_cpu", "args": {}}},
+                    "policy": {"on_fail": "fail"},
+                }
+            ],
+        }
+    )
+    normalized = normalize_graph(graph)
+    validate_graph(normalized)
+    return normalized
+
+
+def _graph() -> TaskGraph:
+    graph = TaskGraph.model_validate(
+        {
+            "graph_id": "det-process-pool",
+            "version": "0.1",
+            "root": "task_count",
+            "defaults": {"budget": {"max_time_ms": 20000, "max_tokens": 0, "max_retries": 0}},
+            "tasks": [
+                {
+                    "id": "task_echo",
+                    "type": "det.echo",
+                    "deps": [],
+                    "in": {"message": "three little words"},
+                    "run": {"kind": "det", "spec": {"handler": "echo", "args": {}}},
+                },
+                {
+                    "id": "task_count",
+                    "type": "det.count",
+                    "deps": ["task_echo"],
+                    "in": {},
+                    "run": {"kind": "det", "spec": {"handler": "count_words_cpu", "args": {}}},
+                },
+            ],
+        }
+    )
+    normalized = normalize_graph(graph)
+    validate_graph(normalized)
+    return normalized
+
+
+def test_cpu_bound_det_handler_runs_in_worker_process_sync_and_async() -> None:
+    executor_module.DETERMINISTIC_HANDLERS["count_words_cpu"] = _count_words
+    try:
+        sync_result = run_graph(_graph())
+        async_result = asyncio.run(run_graph_async(_graph()))
+    finally:
+        executor_module.DETERMINISTIC_HANDLERS.pop("count_words_cpu", None)
+        executor_module.shutdown_det_process_pool()
+
+    for result in (sync_result, async_result):
+        assert result["ok"] is True
+        final = result["final"]
+        assert final["words"] == 3
+        assert final["pid"] != os.getpid()
+        assert final["shipped_keys"] == ["outputs"]
+
+
+def test_dead_worker_rebuilds_pool_and_retries_once(tmp_path: Path) -> None:
+    executor_module.DETERMINISTIC_HANDLERS["crash_once_cpu"] = _crash_once
+    executor_module.DETERMINISTIC_HANDLERS["count_words_cpu"] = _count_words
+    try:
+        recovered = run_graph(_crash_graph(tmp_path / "sync", always=False))
+        recovered_async = asyncio.run(run_graph_async(_crash_graph(tmp_path / "async", always=False)))
+        failed = run_graph(_crash_graph(tmp_path / "always", always=True))
+        after = run_graph(_graph())
+    finally:
+        executor_module.DETERMINISTIC_HANDLERS.pop("crash_once_cpu", None)
+        executor_module.DETERMINISTIC_HANDLERS.pop("count_words_cpu", None)
+        executor_module.shutdown_det_process_pool()
+
+    assert recovered["ok"] is True
+    assert recovered_async["ok"] is True
+    assert failed["ok"] is False
+    assert failed["error"]["error_type"] == "DETERMINISTIC_EXEC_FAILED"
+    assert after["ok"] is True
+    assert after["final"]["words"] == 3
@@ -0,0 +1,181 @@
+import asyncio
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+from kora import executor as executor_module
+from kora.adapters.base import BaseAdapter
+from kora.events import AsyncEventStream, CallbackEventSink, JsonlEventSink, RingBufferEventSink
+from kora.executor import run_graph, run_graph_async, run_graphs
+from kora.task_ir import Task, TaskGraph, normalize_graph, validate_graph
+
+
+def _graph(graph_id: str = "events", handler: str = "echo") -> TaskGraph:
+    graph = TaskGraph.model_validate(
+        {
+            "graph_id": graph_id,
+            "version": "0.1",
+            "root": "task_second",
+            "defaults": {"budget": {"max_time_ms": 2000, "max_tokens": 0, "max_retries": 0}},
+            "tasks": [
+                {
+                    "id": "task_first",
+                    "type": "det.echo",
+                    "deps": [],
+                    "in": {"message": "first"},
+                    "run": {"kind": "det", "spec": {"handler": "echo", "args": {}}},
+                },
+                {
+                    "id": "task_second",
+                    "type": "det.echo",
+                    "deps": ["task_first"],
+                    "in": {"message": "second"},
+                    "run": {"kind": "det", "spec": {"handler": handler, "args": {}}},
+                },
+            ],
+        }
+    )
+    normalized = normalize_graph(graph)
+    validate_graph(normalized)
+    return normalized
+
+
+def test_events_reach_sink_before_the_graph_finishes() -> None:
+    first_seen = threading.Event()
+    streamed: list[dict[str, Any]] = []
+
+    def _on_event(event: dict[str, Any]) -> None:
+        streamed.append(event)
+        if event["task_id"] == "task_first":
+            first_seen.set()
+
+    def _second(task: Task, state: dict[str, Any]) -> dict[str, Any]:
+        return {"status": "ok", "task_id": task.id, "saw_first_event": first_seen.is_set()}
+
+    executor_module.DETERMINISTIC_HANDLERS["events_second"] = _second
+    try:
+        result = run_graph(_graph(handler="events_second"), event_sink=CallbackEventSink(_on_event))
+    finally:
+        del executor_module.DETERMINISTIC_HANDLERS["events_second"]
+
+    assert result["final"]["saw_first_event"] is True
+    assert [event["task_id"] for event in streamed] == ["task_first", "task_second"]
+    assert {event["graph_id"] for event in streamed} == {"events"}
+    assert len(result["events"]) == 2
+
+
+class _StageAdapter(BaseAdapter):
+    confidence = 0.1
+    seen_before_run: list[list[str]] = []
+    streamed: list[dict[str, Any]] = []
+
+    def run(
+        self,
+        *,
+        task_id: str,
+        input: dict[str, Any],
+        budget: dict[str, Any],
+        output_schema: dict[str, Any],
+    ) -> dict[str, Any]:
+        del input, budget, output_schema
+        _StageAdapter.seen_before_run.append([event["meta"]["adapter"] for event in _StageAdapter.streamed])
+        name = type(self).__name__
+        return {
+            "ok": True,
+            "output": {"status": "ok", "task_id": task_id, "answer": name},
+            "usage": {"time_ms": 1, "tokens_in": 1, "tokens_out": 1},
+            "meta": {"adapter": name, "model": name, "confidence": self.confidence},
+        }
+
+
+class _FullStageAdapter(_StageAdapter):
+    confidence = 0.95
+
+
+def test_escalation_stage_events_stream_before_the_task_returns() -> None:
+    graph = TaskGraph.model_validate(
+        {
+            "graph_id": "events-escalation",
+            "version": "0.1",
+            "root": "task_llm",
+            "defaults": {"budget": {"max_time_ms": 2000, "max_tokens": 300, "max_retries": 0}},
+            "tasks": [
+                {
+                    "id": "task_llm",
+                    "type": "llm.answer",
+                    "deps": [],
+                    "in": {},
+                    "run": {
+                        "kind": "llm",
+                        "spec": {
+                            "adapter": "events_stage",
+                            "input": {"question": "q"},
+                            "output_schema": {"type": "object", "required": ["status", "task_id", "answer"]},
+                        },
+                    },
+                    "policy": {
+                        "on_fail": "fail",
+                        "adaptive": {
+                            "min_confidence_to_stop": 0.85,
+                            "max_escalations": 1,
+                            "escalation_order": ["full"],
+                            "use_voi": False,
+                        },
+                    },
+                }
+            ],
+        }
+    )
+    normalized = normalize_graph(graph)
+    validate_graph(normalized)
+    _StageAdapter.seen_before_run, _StageAdapter.streamed = [], []
+    executor_module._AdapterRegistry.providers["events_stage"] = _StageAdapter
+    executor_module._AdapterRegistry.providers["events_stage:full"] = _FullStageAdapter
+    try:
+        result = run_graph(normalized, event_sink=CallbackEventSink(_StageAdapter.streamed.append))
+    finally:
+        del executor_module._AdapterRegistry.providers["events_stage"]
+        del executor_module._AdapterRegistry.providers["events_stage:full"]
+
+    assert result["ok"] is True
+    assert result["final"]["answer"] == "_FullStageAdapter"
+    assert _StageAdapter.seen_before_run == [[], ["_StageAdapter"]]
+    assert [event["escalation_step"] for event in _StageAdapter.streamed] == [0, 1]
+    assert len(result["events"]) == 2
+
+
+def test_ring_buffer_and_jsonl_sinks_with_batch_runs(tmp_path: Path) -> None:
+    ring = RingBufferEventSink(capacity=3)
+    graphs = (_graph(f"g{index}") for index in range(4))
+    results = list(run_graphs(graphs, concurrency=2, event_sink=ring, keep_events=False))
+
+    assert all(result["ok"] and type(result["events"]) is list and not result["events"] for result in results)
+    assert len(ring) == 3
+    assert ring.dropped == 5
+
+    sink = JsonlEventSink(tmp_path / "events.jsonl")
+    run_graph(_graph("jsonl"), event_sink=sink)
+    sink.close()
+    lines = (tmp_path / "events.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["task_id"] for line in lines] == ["task_first", "task_second"]
+
+
+def test_async_event_stream_yields_events_while_running() -> None:
+    async def _main() -> tuple[list[str], dict[str, Any]]:
+        stream = AsyncEventStream()
+        collected: list[str] = []
+
+        async def _consume() -> None:
+            async for event in stream:
+                collected.append(event["task_id"])
+
+        consumer = asyncio.ensure_future(_consume())
+        result = await run_graph_async(_graph("async-events"), event_sink=stream)
+        stream.close()
+        await consumer
+        return collected, result
+
+    collected, result = asyncio.run(_main())
+    assert result["ok"] is True
+    assert collected == ["task_first", "task_second"]
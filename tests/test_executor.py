@@ -1,3 +1,4 @@
+import time
 from typing import Any
 
 from kora.adapters.base import BaseAdapter
@@ -1554,3 +1555,88 @@ def test_adaptive_self_consistency_not_triggered_when_budget_too_low() -> None:
     meta = llm_events[0]["meta"]
     assert meta["self_consistency_triggered"] is False
     assert meta["self_consistency_triggered_reason"] == "budget_too_low"
+
+
+def test_self_consistency_samples_run_concurrently_and_stop_at_majority() -> None:
+    from kora import executor as executor_module
+
+    class StaggeredMiniAdapter(BaseAdapter):
+        call_count = 0
+        delays = [0.0, 0.05, 0.6]
+
+        def run(
+            self,
+            *,
+            task_id: str,
+            input: dict[str, Any],
+            budget: dict[str, Any],
+            output_schema: dict[str, Any],
+        ) -> dict[str, Any]:
+            del input, budget, output_schema
+            index = StaggeredMiniAdapter.call_count
+            StaggeredMiniAdapter.call_count += 1
+            time.sleep(StaggeredMiniAdapter.delays[min(index, 2)])
+            return {
+                "ok": True,
+                "output": {"status": "ok", "task_id": task_id, "answer": "same"},
+                "usage": {"tokens_in": 1, "tokens_out": 1},
+                "meta": {"adapter": "mock_sc", "model": "mock-mini"},
+            }
+
+    graph = TaskGraph.model_validate(
+        {
+            "graph_id": "adaptive-self-consistency-parallel",
+            "version": "0.1",
+            "root": "task_llm",
+            "defaults": {"budget": {"max_time_ms": 1500, "max_tokens": 300, "max_retries": 0}},
+            "tasks": [
+                {
+                    "id": "task_llm",
+                    "type": "llm.answer",
+                    "deps": [],
+                    "in": {},
+                    "run": {
+                        "kind": "llm",
+                        "spec": {
+                            "adapter": "mock_sc",
+                            "input": {"question": "q"},
+                            "output_schema": {"type": "object", "required": ["status", "task_id", "answer"]},
+                        },
+                    },
+                    "policy": {
+                        "on_fail": "fail",
+                        "adaptive": {
+                            "max_escalations": 1,
+                            "escalation_order": ["gate"],
+                            "stage_costs": {"gate": 10.0},
+                            "self_consistency_enabled": True,
+                            "self_consistency_samples": 3,
+                            "self_consistency_min_next_cost": 1.0,
+                            "self_consistency_min_remaining_budget": 0.0,
+                        },
+                    },
+                    "tags": [],
+                }
+            ],
+        }
+    )
+
+    executor_module._AdapterRegistry.providers["mock_sc"] = StaggeredMiniAdapter
+    StaggeredMiniAdapter.call_count = 0
+    try:
+        normalized = normalize_graph(graph)
+        validate_graph(normalized)
+        start = time.monotonic()
+        result = run_graph(normalized)
+        elapsed = time.monotonic() - start
+    finally:
+        del executor_module._AdapterRegistry.providers["mock_sc"]
+
+    assert result["ok"] is True
+    meta = result["events"][0]["meta"]
+    assert meta["self_consistency_samples"] == 2
+    assert meta["self_consistency_samples_requested"] == 3
+    assert meta["self_consistency_disagreement"] == 0.0
+    assert elapsed < 0.5
+    assert result["budget"]["calls"] == 3
+    assert result["budget"]["tokens_out"] == 1 + 1 + 64
@@ -0,0 +1,88 @@
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from kora import executor as executor_module
+from kora.executor import run_graph
+from kora.handlers import HandlerRegistry
+from kora.task_ir import Task, TaskGraph, normalize_graph, validate_graph
+
+
+def _install_fake_plugin(root: Path, module: str) -> None:
+    (root / f"{module}.py").write_text(
+        "def shout(task, state):\n"
+        "    return {'status': 'ok', 'task_id': task.id, 'message': str(task.in_.get('text', '')).upper()}\n",
+        encoding="utf-8",
+    )
+    dist_info = root / f"{module}-0.1.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {module}\nVersion: 0.1\n", encoding="utf-8")
+    (dist_info / "entry_points.txt").write_text(f"[kora.det_handlers]\nshout = {module}:shout\n", encoding="utf-8")
+
+
+def test_entry_point_handlers_are_imported_lazily_and_cached(tmp_path: Path) -> None:
+    module = "kora_fake_handler_plugin"
+    _install_fake_plugin(tmp_path, module)
+    sys.path.insert(0, str(tmp_path))
+    try:
+        registry = HandlerRegistry()
+        assert "shout" in registry
+        assert module not in sys.modules
+
+        handler = registry["shout"]
+        assert module in sys.modules
+        assert registry["shout"] is handler
+        with pytest.raises(KeyError):
+            registry["missing"]
+    finally:
+        sys.path.remove(str(tmp_path))
+        sys.modules.pop(module, None)
+
+
+def test_string_targets_and_decorator_registration() -> None:
+    registry = HandlerRegistry(group=None)
+    registry.register("echo_lazy", "kora.executor:_handle_echo")
+    assert registry["echo_lazy"] is executor_module._handle_echo
+
+    @registry.register("heavy", cpu_bound=True)
+    def _heavy(task: Task, state: dict[str, Any]) -> dict[str, Any]:
+        return {"status": "ok", "task_id": task.id}
+
+    assert registry["heavy"] is _heavy
+    assert getattr(_heavy, "cpu_bound", False) is True
+    assert sorted(registry) == ["echo_lazy", "heavy"]
+
+    del registry["heavy"]
+    assert "heavy" not in registry
+
+
+def test_run_graph_resolves_handlers_registered_on_default_registry() -> None:
+    executor_module.DETERMINISTIC_HANDLERS.register("echo_alias", "kora.executor:_handle_echo")
+    graph = TaskGraph.model_validate(
+        {
+            "graph_id": "handler-registry",
+            "version": "0.1",
+            "root": "task_echo",
+            "defaults": {"budget": {"max_time_ms": 2000, "max_tokens": 0, "max_retries": 0}},
+            "tasks": [
+                {
+                    "id": "task_echo",
+                    "type": "det.echo",
+                    "deps": [],
+                    "in": {"message": "hi"},
+                    "run": {"kind": "det", "spec": {"handler": "echo_alias", "args": {}}},
+                }
+            ],
+        }
+    )
+    normalized = normalize_graph(graph)
+    validate_graph(normalized)
+    try:
+        result = run_graph(normalized)
+    finally:
+        del executor_module.DETERMINISTIC_HANDLERS["echo_alias"]
+
+    assert result["ok"] is True
+    assert result["final"]["message"] == "hi"
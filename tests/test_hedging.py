@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import time
+from typing import Any
+
+from kora import executor as executor_module
+from kora.adapters.base import BaseAdapter
+from kora.executor import ADAPTER_LATENCY, run_graph, run_graph_async
+from kora.task_ir import TaskGraph, normalize_graph, validate_graph
+
+
+class _OutlierAdapter(BaseAdapter):
+    """First call stalls; every later call returns quickly."""
+
+    calls = 0
+    _lock = threading.Lock()
+
+    def run(
+        self,
+        *,
+        task_id: str,
+        input: dict[str, Any],
+        budget: dict[str, Any],
+        output_schema: dict[str, Any],
+    ) -> dict[str, Any]:
+        del input, budget, output_schema
+        with _OutlierAdapter._lock:
+            index = _OutlierAdapter.calls
+            _OutlierAdapter.calls += 1
+        time.sleep(1.0 if index == 0 else 0.01)
+        return {
+            "ok": True,
+            "output": {"status": "ok", "task_id": task_id, "answer": f"call-{index}"},
+            "usage": {"time_ms": 10, "tokens_in": 1, "tokens_out": 1},
+            "meta": {"adapter": "outlier", "model": "mock-outlier"},
+        }
+
+
+def _graph(hedge: dict[str, Any] | None) -> TaskGraph:
+    policy: dict[str, Any] = {"on_fail": "fail"}
+    if hedge is not None:
+        policy["hedge"] = hedge
+    graph = TaskGraph.model_validate(
+        {
+            "graph_id": "hedge-demo",
+            "version": "0.1",
+            "root": "task_llm",
+            "defaults": {"budget": {"max_time_ms": 1500, "max_tokens": 300, "max_retries": 0}},
+            "tasks": [
+                {
+                    "id": "task_llm",
+                    "type": "llm.answer",
+                    "deps": [],
+                    "in": {},
+                    "run": {
+                        "kind": "llm",
+                        "spec": {
+                            "adapter": "outlier",
+                            "input": {"question": "q"},
+                            "output_schema": {"type": "object", "required": ["status", "task_id", "answer"]},
+                        },
+                    },
+                    "policy": policy,
+                    "tags": [],
+                }
+            ],
+        }
+    )
+    normalized = normalize_graph(graph)
+    validate_graph(normalized)
+    return normalized
+
+
+def _run(graph: TaskGraph, *, use_async: bool = False) -> tuple[dict[str, Any], float]:
+    executor_module._AdapterRegistry.providers["outlier"] = _OutlierAdapter
+    _OutlierAdapter.calls = 0
+    for _ in range(20):
+        ADAPTER_LATENCY.record("outlier", 10.0)
+    async def _timed_async() -> tuple[dict[str, Any], float]:
+        # Time inside the loop: asyncio.run also joins the abandoned worker thread on exit.
+        start = time.monotonic()
+        result = await run_graph_async(graph)
+        return result, time.monotonic() - start
+
+    try:
+        if use_async:
+            return asyncio.run(_timed_async())
+        start = time.monotonic()
+        result = run_graph(graph)
+        return result, time.monotonic() - start
+    finally:
+        del executor_module._AdapterRegistry.providers["outlier"]
+        ADAPTER_LATENCY.clear()
+
+
+def test_hedged_call_returns_duplicate_when_primary_stalls() -> None:
+    result, elapsed = _run(_graph({"percentile": 0.9, "min_samples": 10}))
+
+    assert result["ok"] is True
+    assert result["final"]["answer"] == "call-1"
+    meta = result["events"][0]["meta"]
+    assert meta["hedged"] is True
+    assert meta["hedge_winner"] == "duplicate"
+    assert _OutlierAdapter.calls == 2
+    assert elapsed < 0.5
+    assert result["budget"]["calls"] == 2
+    assert result["budget"]["tokens_in"] == 1
+    assert result["budget"]["tokens_out"] == 1 + 300
+
+
+def test_hedged_call_under_async_executor() -> None:
+    result, elapsed = _run(_graph({"percentile": 0.9}), use_async=True)
+
+    assert result["ok"] is True
+    assert result["events"][0]["meta"]["hedge_winner"] == "duplicate"
+    assert elapsed < 0.5
+    assert result["budget"]["calls"] == 2
+    assert result["budget"]["tokens_in"] == 1
+    assert result["budget"]["tokens_out"] == 1 + 300
+
+
+def test_no_hedge_without_policy_or_latency_history() -> None:
+    result, _ = _run(_graph(None))
+    assert "hedged" not in result["events"][0]["meta"]
+    assert _OutlierAdapter.calls == 1
+
+    executor_module._AdapterRegistry.providers["outlier"] = _OutlierAdapter
+    _OutlierAdapter.calls = 1
+    try:
+        result = run_graph(_graph({"percentile": 0.9}))
+    finally:
+        del executor_module._AdapterRegistry.providers["outlier"]
+        ADAPTER_LATENCY.clear()
+    assert "hedged" not in result["events"][0]["meta"]
+    assert _OutlierAdapter.calls == 2
@@ -0,0 +1,113 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+
+from kora import executor as executor_module
+from kora.checkpoint import FileCheckpointSink
+from kora.executor import run_graph, run_graph_async
+from kora.task_ir import Task, TaskGraph, normalize_graph, validate_graph
+
+
+class _Calls:
+    seen: list[str] = []
+
+
+def _upper_handler(task: Task, state: dict[str, Any]) -> dict[str, Any]:
+    _Calls.seen.append(task.id)
+    parts = [str(task.in_.get("text", ""))]
+    parts.extend(str(state["outputs"][dep].get("message", "")) for dep in task.deps)
+    return {"status": "ok", "task_id": task.id, "message": " ".join(parts).upper()}
+
+
+def _graph(source: str, side: str) -> TaskGraph:
+    def _task(task_id: str, text: str, deps: list[str]) -> dict[str, Any]:
+        return {
+            "id": task_id,
+            "type": "det.upper",
+            "deps": deps,
+            "in": {"text": text},
+            "run": {"kind": "det", "spec": {"handler": "upper_counted", "args": {}}},
+        }
+
+    graph = TaskGraph.model_validate(
+        {
+            "graph_id": "incremental",
+            "version": "0.1",
+            "root": "task_join",
+            "defaults": {"budget": {"max_time_ms": 2000, "max_tokens": 0, "max_retries": 0}},
+            "tasks": [
+                _task("task_source", source, []),
+                _task("task_derived", "derived", ["task_source"]),
+                _task("task_side", side, []),
+                _task("task_join", "join", ["task_derived", "task_side"]),
+            ],
+        }
+    )
+    normalized = normalize_graph(graph)
+    validate_graph(normalized)
+    return normalized
+
+
+def test_incremental_run_reexecutes_only_changed_tasks_and_their_dependents() -> None:
+    executor_module.DETERMINISTIC_HANDLERS["upper_counted"] = _upper_handler
+    try:
+        _Calls.seen = []
+        first = run_graph(_graph("a", "b"), incremental=True)
+        assert set(first["fingerprints"]) == {"task_source", "task_derived", "task_side", "task_join"}
+        assert len(_Calls.seen) == 4
+
+        _Calls.seen = []
+        unchanged = run_graph(_graph("a", "b"), previous=first)
+        assert _Calls.seen == []
+        assert unchanged["final"] == first["final"]
+        assert all(event.get("reused") for event in unchanged["events"])
+
+        _Calls.seen = []
+        side_edit = run_graph(_graph("a", "c"), previous=unchanged, parallel=True)
+        assert sorted(_Calls.seen) == ["task_join", "task_side"]
+        assert side_edit["final"]["message"] == "JOIN DERIVED A C"
+
+        _Calls.seen = []
+        source_edit = asyncio.run(run_graph_async(_graph("z", "c"), previous=side_edit))
+        assert sorted(_Calls.seen) == ["task_derived", "task_join", "task_source"]
+        assert source_edit["final"]["message"] == "JOIN DERIVED Z C"
+    finally:
+        del executor_module.DETERMINISTIC_HANDLERS["upper_counted"]
+
+
+def test_fingerprints_are_only_reported_when_requested() -> None:
+    executor_module.DETERMINISTIC_HANDLERS["upper_counted"] = _upper_handler
+    try:
+        result = run_graph(_graph("a", "b"))
+    finally:
+        del executor_module.DETERMINISTIC_HANDLERS["upper_counted"]
+
+    assert result["ok"] is True
+    assert "fingerprints" not in result
+
+
+def _tags_handler(task: Task, state: dict[str, Any]) -> dict[str, Any]:
+    _Calls.seen.append(task.id)
+    return {"status": "ok", "task_id": task.id, "message": task.id, "tags": {"set", "valued"}}
+
+
+def test_incremental_and_checkpoint_runs_accept_non_json_outputs(tmp_path: Path) -> None:
+    executor_module.DETERMINISTIC_HANDLERS["upper_counted"] = _tags_handler
+    sink = FileCheckpointSink(tmp_path / "checkpoints.jsonl")
+    try:
+        plain = run_graph(_graph("a", "b"))
+        incremental = run_graph(_graph("a", "b"), incremental=True)
+        _Calls.seen = []
+        reused = run_graph(_graph("a", "b"), previous=incremental)
+        reexecuted = list(_Calls.seen)
+        checkpointed = run_graph(_graph("a", "b"), checkpoint=sink)
+    finally:
+        del executor_module.DETERMINISTIC_HANDLERS["upper_counted"]
+        sink.close()
+
+    assert plain["ok"] is True
+    assert incremental["ok"] is True
+    assert len(incremental["fingerprints"]) == 4
+    assert reused["ok"] is True
+    assert reexecuted == []
+    assert checkpointed["ok"] is True
@@ -0,0 +1,137 @@
+import time
+from typing import Any
+
+from kora import executor as executor_module
+from kora.adapters.base import BaseAdapter
+from kora.executor import run_graph
+from kora.task_ir import TaskGraph, normalize_graph, validate_graph
+
+
+class SlowAdapter(BaseAdapter):
+    delay_s = 0.2
+
+    def run(
+        self,
+        *,
+        task_id: str,
+        input: dict[str, Any],
+        budget: dict[str, Any],
+        output_schema: dict[str, Any],
+    ) -> dict[str, Any]:
+        del budget, output_schema
+        time.sleep(SlowAdapter.delay_s)
+        if input.get("fail"):
+            return {"ok": False, "error": "slow adapter failure", "usage": {}, "meta": {}}
+        return {
+            "ok": True,
+            "output": {"status": "ok", "task_id": task_id, "answer": str(input.get("question", ""))},
+            "usage": {"time_ms": int(SlowAdapter.delay_s * 1000), "tokens_in": 1, "tokens_out": 1},
+            "meta": {"adapter": "slow", "model": "slow-v0"},
+        }
+
+
+def _fan_out_graph(branches: int, *, failing_branch: int | None = None) -> TaskGraph:
+    llm_tasks = []
+    for index in range(branches):
+        question: dict[str, Any] = {"question": f"q{index}"}
+        if failing_branch == index:
+            question["fail"] = True
+        llm_tasks.append(
+            {
+                "id": f"task_llm_{index}",
+                "type": "llm.answer",
+                "deps": ["task_pre"],
+                "in": {},
+                "run": {
+                    "kind": "llm",
+                    "spec": {
+                        "adapter": "slow",
+                        "input": question,
+                        "output_schema": {"type": "object", "required": ["status", "task_id", "answer"]},
+                    },
+                },
+                "policy": {"on_fail": "fail"},
+                "tags": [],
+            }
+        )
+    graph = TaskGraph.model_validate(
+        {
+            "graph_id": "fan-out",
+            "version": "0.1",
+            "root": "task_join",
+            "defaults": {"budget": {"max_time_ms": 1500, "max_tokens": 300, "max_retries": 0}},
+            "tasks": [
+                {
+                    "id": "task_pre",
+                    "type": "det.echo",
+                    "deps": [],
+                    "in": {"message": "pre"},
+                    "run": {"kind": "det", "spec": {"handler": "echo", "args": {}}},
+                    "policy": {"on_fail": "fail"},
+                    "tags": [],
+                },
+                *llm_tasks,
+                {
+                    "id": "task_join",
+                    "type": "det.echo",
+                    "deps": [task["id"] for task in llm_tasks],
+                    "in": {"message": "joined"},
+                    "run": {"kind": "det", "spec": {"handler": "echo", "args": {}}},
+                    "policy": {"on_fail": "fail"},
+                    "tags": [],
+                },
+            ],
+        }
+    )
+    normalized = normalize_graph(graph)
+    validate_graph(normalized)
+    return normalized
+
+
+def _with_slow_adapter(fn):
+    old = executor_module._AdapterRegistry.providers.get("slow")
+    executor_module._AdapterRegistry.providers["slow"] = SlowAdapter
+    try:
+        return fn()
+    finally:
+        if old is None:
+            del executor_module._AdapterRegistry.providers["slow"]
+        else:
+            executor_module._AdapterRegistry.providers["slow"] = old
+
+
+def test_parallel_fan_out_runs_branches_concurrently() -> None:
+    graph = _fan_out_graph(4)
+
+    start = time.monotonic()
+    result = _with_slow_adapter(lambda: run_graph(graph, parallel=True, max_workers=4))
+    elapsed = time.monotonic() - start
+
+    assert result["ok"] is True
+    assert result["final"]["message"] == "joined"
+    assert elapsed < 4 * SlowAdapter.delay_s
+    assert sorted(result["outputs"]) == sorted(["task_pre", "task_join"] + [f"task_llm_{i}" for i in range(4)])
+
+
+def test_parallel_topo_event_order_matches_sequential() -> None:
+    graph = _fan_out_graph(3)
+
+    sequential = _with_slow_adapter(lambda: run_graph(graph))
+    parallel = _with_slow_adapter(lambda: run_graph(graph, parallel=True, max_workers=3))
+
+    assert parallel["order"] == sequential["order"]
+    assert [e["task_id"] for e in parallel["events"]] == [e["task_id"] for e in sequential["events"]]
+    assert parallel["final"] == sequential["final"]
+
+
+def test_parallel_failure_keeps_failure_contract_and_stops_dispatch() -> None:
+    graph = _fan_out_graph(3, failing_branch=1)
+
+    result = _with_slow_adapter(lambda: run_graph(graph, parallel=True, max_workers=3, event_order="completion"))
+
+    assert result["ok"] is False
+    assert result["final"] is None
+    assert result["error"]["error_type"] == "ADAPTER_FAILED"
+    assert result["error"]["task_id"] == "task_llm_1"
+    assert "task_join" not in result["outputs"]
+    assert not any(event["task_id"] == "task_join" for event in result["events"])
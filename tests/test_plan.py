@@ -0,0 +1,109 @@
+from kora.executor import run_graph
+from kora.plan import PLAN_CACHE, build_plan, compile_plan, plan_key
+from kora.task_ir import TaskGraph, normalize_graph, validate_graph
+from kora.templates import GraphTemplate
+
+
+def _payload(question: str = "q") -> dict:
+    return {
+        "graph_id": "plan-demo",
+        "version": "0.1",
+        "root": "task_llm",
+        "defaults": {"budget": {"max_time_ms": 1500, "max_tokens": 300, "max_retries": 2}},
+        "tasks": [
+            {
+                "id": "task_pre",
+                "type": "det.echo",
+                "deps": [],
+                "in": {"message": question},
+                "run": {"kind": "det", "spec": {"handler": "echo", "args": {}}},
+                "policy": {"on_fail": "fail"},
+                "tags": [],
+            },
+            {
+                "id": "task_llm",
+                "type": "llm.answer",
+                "deps": ["task_pre"],
+                "in": {},
+                "run": {
+                    "kind": "llm",
+                    "spec": {
+                        "adapter": "mock",
+                        "input": {"question": question},
+                        "output_schema": {"type": "object", "required": ["status", "task_id", "answer"]},
+                    },
+                },
+                "policy": {"on_fail": "retry", "adaptive": {"routing_profile": "latency"}},
+                "tags": [],
+            },
+        ],
+    }
+
+
+def _graph(question: str = "q") -> TaskGraph:
+    normalized = normalize_graph(TaskGraph.model_validate(_payload(question)))
+    validate_graph(normalized)
+    return normalized
+
+
+def test_build_plan_precomputes_order_indexes_and_policies() -> None:
+    plan = build_plan(_graph())
+
+    assert plan.order == ("task_pre", "task_llm")
+    assert plan.dep_counts == (0, 1)
+    assert plan.dependents == ((1,), ())
+    llm_plan = plan.tasks["task_llm"]
+    assert llm_plan.max_attempts == 3
+    assert llm_plan.budget["max_tokens"] == 300
+    assert llm_plan.adapter == "mock"
+    assert llm_plan.adaptive is not None
+    assert llm_plan.adaptive.self_consistency_enabled is False
+
+
+def test_plan_key_ignores_task_inputs_but_not_policies() -> None:
+    assert plan_key(_graph("a")) == plan_key(_graph("b"))
+
+    payload = _payload()
+    payload["tasks"][1]["policy"]["adaptive"] = {"routing_profile": "reliability"}
+    changed = normalize_graph(TaskGraph.model_validate(payload))
+    assert plan_key(changed) != plan_key(_graph())
+
+
+def test_compile_plan_reuses_cached_plans_across_runs() -> None:
+    PLAN_CACHE.clear()
+    first = _graph("a")
+    plan = compile_plan(first)
+
+    assert compile_plan(first) is plan
+    assert compile_plan(_graph("b")) is plan
+    assert PLAN_CACHE.stats()["misses"] == 1
+
+    template = GraphTemplate(_payload("{{question}}"))
+    bound = template.bind({"question": "c"})
+    assert compile_plan(bound) is template.plan
+    assert run_graph(bound)["ok"] is True
+
+
+def test_compile_plan_memo_rebuilds_when_a_policy_object_is_replaced() -> None:
+    graph = _graph()
+    original = graph.tasks[1].policy
+    assert compile_plan(graph).tasks["task_llm"].max_attempts == 3
+
+    budget = original.budget.model_copy(update={"max_retries": 0})
+    graph.tasks[1].policy = original.model_copy(update={"budget": budget})
+    del original, budget
+
+    assert compile_plan(graph).tasks["task_llm"].max_attempts == 1
+    assert graph._plan_memo[1][4] is graph.tasks[1].policy
+
+
+def test_run_graph_reports_dag_invalid_for_unknown_dependency() -> None:
+    payload = _payload()
+    payload["tasks"][1]["deps"] = ["missing"]
+    graph = TaskGraph.model_validate(payload)
+
+    result = run_graph(graph)
+
+    assert result["ok"] is False
+    assert result["error"]["error_type"] == "DAG_INVALID"
+    assert result["order"] == []
@@ -0,0 +1,78 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from kora import executor as executor_module
+from kora.executor import run_graph, run_graph_async
+from kora.task_ir import Task, TaskGraph, normalize_graph, validate_graph
+
+
+class _Live:
+    seen: dict[str, list[str]] = {}
+
+
+def _live_handler(task: Task, state: dict[str, Any]) -> dict[str, Any]:
+    _Live.seen[task.id] = sorted(state["outputs"])
+    return {"status": "ok", "task_id": task.id, "payload": "x" * 64}
+
+
+def _graph() -> TaskGraph:
+    shape = {
+        "task_a": [],
+        "task_b": ["task_a"],
+        "task_c": ["task_a"],
+        "task_leaf": ["task_a"],
+        "task_root": ["task_b", "task_c"],
+    }
+    graph = TaskGraph.model_validate(
+        {
+            "graph_id": "retention",
+            "version": "0.1",
+            "root": "task_root",
+            "defaults": {"budget": {"max_time_ms": 2000, "max_tokens": 0, "max_retries": 0}},
+            "tasks": [
+                {
+                    "id": task_id,
+                    "type": "det.live",
+                    "deps": deps,
+                    "in": {},
+                    "run": {"kind": "det", "spec": {"handler": "live_probe", "args": {}}},
+                }
+                for task_id, deps in shape.items()
+            ],
+        }
+    )
+    normalized = normalize_graph(graph)
+    validate_graph(normalized)
+    return normalized
+
+
+@pytest.fixture(autouse=True)
+def _register_probe():
+    executor_module.DETERMINISTIC_HANDLERS["live_probe"] = _live_handler
+    _Live.seen = {}
+    yield
+    del executor_module.DETERMINISTIC_HANDLERS["live_probe"]
+
+
+def test_retain_root_releases_outputs_once_dependents_finish() -> None:
+    result = run_graph(_graph(), retain="root")
+
+    assert result["ok"] is True
+    assert list(result["outputs"]) == ["task_root"]
+    assert result["final"]["task_id"] == "task_root"
+    assert "task_a" not in _Live.seen["task_root"]
+    assert "task_leaf" not in _Live.seen["task_root"]
+
+
+def test_retain_ids_and_default_keep_requested_outputs() -> None:
+    parallel = run_graph(_graph(), parallel=True, retain=["task_b"])
+    streamed = asyncio.run(run_graph_async(_graph(), retain=["task_leaf"]))
+    default = run_graph(_graph())
+
+    assert sorted(parallel["outputs"]) == ["task_b", "task_root"]
+    assert sorted(streamed["outputs"]) == ["task_leaf", "task_root"]
+    assert len(default["outputs"]) == 5
+    with pytest.raises(ValueError, match="unknown retain mode"):
+        run_graph(_graph(), retain="none")
@@ -1,4 +1,7 @@
-from kora.retrieval import InMemoryRetrievalStore
+import sqlite3
+import threading
+
+from kora.retrieval import InMemoryRetrievalStore, SQLiteRetrievalStore
 
 
 def test_retrieval_ttl_expiry() -> None:
@@ -13,3 +16,118 @@ def test_retrieval_ttl_expiry() -> None:
 
     now[0] = 1002.0
     assert store.get("k") is None
+
+
+def test_sqlite_retrieval_store_ttl_and_lru(tmp_path) -> None:
+    now = [1000.0]
+    store = SQLiteRetrievalStore(tmp_path / "retrieval.db", max_entries=2, clock=lambda: now[0])
+    try:
+        store.put("a", {"v": 1})
+        store.put("b", {"v": 2}, ttl_seconds=1)
+        assert store.get("a") == {"v": 1}
+        store.put("c", {"v": 3})
+        assert store.get("b") is None
+        assert store.get("a") == {"v": 1}
+
+        store.put("b", {"v": 2}, ttl_seconds=1)
+        now[0] = 1002.0
+        assert store.get("b") is None
+    finally:
+        store.close()
+
+
+def test_sqlite_retrieval_store_is_shared_across_instances(tmp_path) -> None:
+    path = tmp_path / "retrieval.db"
+    writer = SQLiteRetrievalStore(path)
+    reader = SQLiteRetrievalStore(path)
+    try:
+        writer.put("k", {"answer": "warm"})
+        assert reader.get("k") == {"answer": "warm"}
+        reader.clear()
+        assert writer.get("k") is None
+    finally:
+        writer.close()
+        reader.close()
+
+
+def test_in_memory_store_single_shard_is_exact_lru() -> None:
+    store = InMemoryRetrievalStore(max_entries=2, shards=1)
+    store.put("a", 1)
+    store.put("b", 2)
+    assert store.get("a") == 1
+    store.put("c", 3)
+
+    assert store.get("b") is None
+    assert store.get("a") == 1
+    assert store.get("c") == 3
+
+
+def test_in_memory_store_keeps_max_entries_across_shards() -> None:
+    for max_entries in (2, 4, 16, 1000):
+        store = InMemoryRetrievalStore(max_entries=max_entries, shards=16)
+        for index in range(max_entries):
+            store.put(f"key-{index}", index)
+        assert len(store) == max_entries
+        assert all(store.get(f"key-{index}") == index for index in range(max_entries))
+
+    store = InMemoryRetrievalStore(max_entries=8, shards=4)
+    for index in range(8):
+        store.put(f"key-{index}", index)
+    assert store.get("key-0") == 0
+    store.put("key-8", 8)
+    assert store.get("key-1") is None
+    assert store.get("key-0") == 0
+
+    store.configure(max_entries=3)
+    assert len(store) == 3
+    assert [store.get(key) for key in ("key-0", "key-7", "key-8")] == [0, 7, 8]
+
+
+def test_in_memory_store_concurrent_access_stays_bounded() -> None:
+    store = InMemoryRetrievalStore(max_entries=64, shards=8)
+    errors: list[BaseException] = []
+
+    def _worker(offset: int) -> None:
+        try:
+            for index in range(2000):
+                key = f"k{(offset * 7 + index) % 200}"
+                store.put(key, index)
+                store.get(key)
+        except BaseException as exc:  # pragma: no cover - surfaced by the assert below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=_worker, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(store) <= 64
+
+    store.configure(max_entries=8)
+    assert len(store) <= 8
+
+
+def test_sqlite_retrieval_store_hits_on_fresh_entries_stay_read_only(tmp_path) -> None:
+    path = tmp_path / "retrieval.db"
+    store = SQLiteRetrievalStore(path, max_entries=8)
+    try:
+        for index in range(8):
+            store.put(f"k{index}", index)
+        conn = sqlite3.connect(path)
+        seqs_before = dict(conn.execute("SELECT key, seq FROM retrieval_entries"))
+        assert store.get("k7") == 7
+        assert store.get("k6") == 6
+        assert dict(conn.execute("SELECT key, seq FROM retrieval_entries")) == seqs_before
+
+        assert store.get("k0") == 0
+        store.put("k8", 8)
+        store.put("k9", 9)
+        assert store.get("k0") == 0
+        assert store.get("k1") is None
+        assert store.get("k2") is None
+        assert conn.execute("SELECT COUNT(*) FROM retrieval_entries").fetchone() == (8,)
+        conn.close()
+    finally:
+        store.close()
@@ -0,0 +1,181 @@
+import time
+from typing import Any
+
+from kora import executor as executor_module
+from kora.adapters.base import BaseAdapter
+from kora.executor import run_graphs
+from kora.task_ir import TaskGraph, normalize_graph
+from kora.templates import GraphTemplate
+
+
+class _JitterAdapter(BaseAdapter):
+    def run(
+        self,
+        *,
+        task_id: str,
+        input: dict[str, Any],
+        budget: dict[str, Any],
+        output_schema: dict[str, Any],
+    ) -> dict[str, Any]:
+        del budget, output_schema
+        index = int(input["question"])
+        time.sleep(0.05 if index % 2 == 0 else 0.01)
+        return {
+            "ok": True,
+            "output": {"status": "ok", "task_id": task_id, "answer": str(index)},
+            "usage": {"time_ms": 10, "tokens_in": 1, "tokens_out": 1},
+            "meta": {"adapter": "jitter", "model": "mock-jitter"},
+        }
+
+
+def _template() -> GraphTemplate:
+    return GraphTemplate(
+        {
+            "graph_id": "batch-run",
+            "version": "0.1",
+            "root": "task_llm",
+            "defaults": {"budget": {"max_time_ms": 1500, "max_tokens": 300, "max_retries": 0}},
+            "tasks": [
+                {
+                    "id": "task_llm",
+                    "type": "llm.answer",
+                    "deps": [],
+                    "in": {},
+                    "run": {
+                        "kind": "llm",
+                        "spec": {
+                            "adapter": "jitter",
+                            "input": {"question": "{{index}}"},
+                            "output_schema": {"type": "object", "required": ["status", "task_id", "answer"]},
+                        },
+                    },
+                    "policy": {"on_fail": "fail"},
+                    "tags": [],
+                }
+            ],
+        }
+    )
+
+
+def test_run_graphs_streams_ordered_results_concurrently() -> None:
+    template = _template()
+    executor_module._AdapterRegistry.providers["jitter"] = _JitterAdapter
+    try:
+        start = time.monotonic()
+        batch = run_graphs(((template, {"index": str(i)}) for i in range(12)), concurrency=6)
+        answers = [result["final"]["answer"] for result in batch]
+        elapsed = time.monotonic() - start
+    finally:
+        del executor_module._AdapterRegistry.providers["jitter"]
+
+    assert answers == [str(i) for i in range(12)]
+    assert elapsed < 12 * 0.03
+    stats = batch.stats()
+    assert stats["completed"] == 12
+    assert stats["ok"] == 12
+    assert stats["throughput_per_s"] > 0
+
+
+def test_run_graphs_unordered_yields_as_completed() -> None:
+    template = _template()
+    executor_module._AdapterRegistry.providers["jitter"] = _JitterAdapter
+    try:
+        results = list(run_graphs([(template, {"index": str(i)}) for i in range(4)], concurrency=4, ordered=False))
+    finally:
+        del executor_module._AdapterRegistry.providers["jitter"]
+
+    assert sorted(result["batch_index"] for result in results) == [0, 1, 2, 3]
+    assert [result["batch_index"] % 2 for result in results[:2]] == [1, 1]
+
+
+def test_run_graphs_accepts_plain_graphs_and_reports_failures() -> None:
+    payload = {
+        "graph_id": "batch-plain",
+        "version": "0.1",
+        "root": "task_det",
+        "defaults": {"budget": {"max_time_ms": 1500, "max_tokens": 300, "max_retries": 0}},
+        "tasks": [
+            {
+                "id": "task_det",
+                "type": "det.echo",
+                "deps": [],
+                "in": {"message": "hi"},
+                "run": {"kind": "det", "spec": {"handler": "echo", "args": {}}},
+                "policy": {"on_fail": "fail"},
+                "tags": [],
+            }
+        ],
+    }
+    good = normalize_graph(TaskGraph.model_validate(payload))
+    payload["tasks"][0]["run"]["spec"]["handler"] = "missing"
+    bad = normalize_graph(TaskGraph.model_validate(payload))
+
+    batch = run_graphs([good, bad, good], concurrency=2)
+    results = list(batch)
+
+    assert [result["ok"] for result in results] == [True, False, True]
+    assert batch.stats()["failed"] == 1
+
+
+def test_run_graphs_reports_bind_failures_per_item() -> None:
+    template = _template()
+    executor_module._AdapterRegistry.providers["jitter"] = _JitterAdapter
+    try:
+        items = [(template, {"index": "0"}), (template, {}), (template, {"index": "2"})]
+        batch = run_graphs(items, concurrency=2)
+        results = list(batch)
+    finally:
+        del executor_module._AdapterRegistry.providers["jitter"]
+
+    assert [result["ok"] for result in results] == [True, False, True]
+    assert [result["batch_index"] for result in results] == [0, 1, 2]
+    assert results[1]["graph_id"] == "batch-run"
+    assert results[1]["error"]["error_type"] == "INVALID_TASK"
+    assert "missing template parameters" in str(results[1]["error"]["details"])
+    assert results[2]["final"]["answer"] == "2"
+    assert batch.stats()["failed"] == 1
+
+
+class _SlowHeadAdapter(_JitterAdapter):
+    def run(
+        self,
+        *,
+        task_id: str,
+        input: dict[str, Any],
+        budget: dict[str, Any],
+        output_schema: dict[str, Any],
+    ) -> dict[str, Any]:
+        if input["question"] == "0":
+            time.sleep(0.3)
+        return {
+            "ok": True,
+            "output": {"status": "ok", "task_id": task_id, "answer": input["question"]},
+            "usage": {"time_ms": 1, "tokens_in": 1, "tokens_out": 1},
+            "meta": {"adapter": "jitter", "model": "mock-jitter"},
+        }
+
+
+def test_ordered_run_graphs_stops_pulling_while_head_is_slow() -> None:
+    template = _template()
+    pulled: list[int] = []
+
+    def _items():
+        for index in range(200):
+            pulled.append(index)
+            yield template, {"index": str(index)}
+
+    executor_module._AdapterRegistry.providers["jitter"] = _SlowHeadAdapter
+    try:
+        batch = run_graphs(_items(), concurrency=2)
+        first = next(batch)
+        pulled_before_first = len(pulled)
+        batch.close()
+        bad = next(iter(run_graphs([(template, {})])))
+    finally:
+        del executor_module._AdapterRegistry.providers["jitter"]
+
+    assert first["batch_index"] == 0
+    assert pulled_before_first <= 2 * 2 + 1
+    assert first["budget"]["calls"] == 1
+    assert bad["ok"] is False
+    assert set(bad) - {"error"} == set(first)
@@ -0,0 +1,208 @@
+from typing import Any
+
+import pytest
+
+from kora import executor as executor_module
+from kora.adapters.base import BaseAdapter
+from kora.executor import run_graph
+from kora.semantic_retrieval import SemanticRetrievalIndex, hashed_ngram_embedding
+from kora.task_ir import TaskGraph, normalize_graph, validate_graph
+
+
+def test_semantic_index_matches_reworded_text_above_threshold() -> None:
+    index = SemanticRetrievalIndex()
+    index.add("ns", "How do I reset my account password?", {"answer": "reset"})
+
+    hit = index.search("ns", "how do i reset my account password", threshold=0.9)
+    assert hit is not None
+    assert hit[0] == {"answer": "reset"}
+    assert hit[1] >= 0.9
+
+    assert index.search("ns", "What is the refund policy for annual plans?", threshold=0.9) is None
+    assert index.search("other", "How do I reset my account password?", threshold=0.5) is None
+
+
+def test_semantic_index_ttl_and_lru() -> None:
+    now = [1000.0]
+    index = SemanticRetrievalIndex(max_entries=2, clock=lambda: now[0])
+    index.add("ns", "alpha question", 1, ttl_seconds=1)
+    index.add("ns", "beta question", 2)
+    index.add("ns", "gamma question", 3)
+
+    assert len(index) == 2
+    assert index.search("ns", "alpha question", threshold=0.99) is None
+    index.add("ns", "delta question", 4, ttl_seconds=1)
+    now[0] = 1002.0
+    assert index.search("ns", "delta question", threshold=0.99) is None
+
+
+def test_semantic_index_approximate_search_finds_near_duplicate() -> None:
+    pytest.importorskip("numpy")
+    index = SemanticRetrievalIndex(approximate_above=8, lsh_tables=8, lsh_bits=4)
+    for item in range(50):
+        index.add("ns", f"ticket {item} about invoice number {item * 7919}", item)
+    index.add("ns", "How do I reset my account password?", "reset")
+
+    hit = index.search("ns", "How do I reset my account password", threshold=0.9)
+    assert hit is not None
+    assert hit[0] == "reset"
+
+
+def test_semantic_index_skips_expired_best_match_for_next_candidate() -> None:
+    now = [1000.0]
+    index = SemanticRetrievalIndex(clock=lambda: now[0])
+    index.add("ns", "how do i reset my account password", "stale", ttl_seconds=1)
+    index.add("ns", "how do i reset my account password please", "fresh")
+    now[0] = 1002.0
+
+    hit = index.search("ns", "how do i reset my account password", threshold=0.8)
+    assert hit is not None
+    assert hit[0] == "fresh"
+    assert len(index) == 1
+
+
+def test_semantic_index_updates_lsh_tables_incrementally(monkeypatch) -> None:
+    pytest.importorskip("numpy")
+    index = SemanticRetrievalIndex(max_entries=40, approximate_above=8, lsh_tables=8, lsh_bits=4)
+    builds: list[int] = []
+    build_tables = index._build_tables
+    monkeypatch.setattr(index, "_build_tables", lambda bucket: builds.append(1) or build_tables(bucket))
+
+    for item in range(60):
+        index.add("ns", f"ticket {item} about invoice number {item * 7919}", item)
+        assert index.search("ns", f"ticket {item} about invoice number {item * 7919}", threshold=0.99)[0] == item
+
+    assert builds == [1]
+    assert len(index) == 40
+    assert index.search("ns", "ticket 3 about invoice number 23757", threshold=0.99) is None
+    index.add("ns", "ticket 59 about invoice number 467221", "updated")
+    assert index.search("ns", "ticket 59 about invoice number 467221", threshold=0.99)[0] == "updated"
+
+
+def test_hashed_ngram_embedding_is_deterministic() -> None:
+    assert hashed_ngram_embedding("Same text") == hashed_ngram_embedding("same   TEXT")
+
+
+class _MiniAdapter(BaseAdapter):
+    def run(
+        self,
+        *,
+        task_id: str,
+        input: dict[str, Any],
+        budget: dict[str, Any],
+        output_schema: dict[str, Any],
+    ) -> dict[str, Any]:
+        del input, budget, output_schema
+        return {
+            "ok": True,
+            "output": {"status": "ok", "task_id": task_id, "answer": "mini draft"},
+            "usage": {"time_ms": 1, "tokens_in": 1, "tokens_out": 1},
+            "meta": {"adapter": "mock_sem", "model": "mock-mini", "confidence": 0.1},
+        }
+
+
+class _GateAdapter(BaseAdapter):
+    def run(
+        self,
+        *,
+        task_id: str,
+        input: dict[str, Any],
+        budget: dict[str, Any],
+        output_schema: dict[str, Any],
+    ) -> dict[str, Any]:
+        del input, budget, output_schema
+        return {
+            "ok": True,
+            "output": {"status": "ok", "task_id": task_id, "answer": "N/A"},
+            "usage": {"time_ms": 1, "tokens_in": 1, "tokens_out": 1},
+            "meta": {"adapter": "mock_sem:gate", "model": "mock-gate", "confidence": 0.2},
+        }
+
+
+class _FullAdapter(BaseAdapter):
+    calls = 0
+
+    def run(
+        self,
+        *,
+        task_id: str,
+        input: dict[str, Any],
+        budget: dict[str, Any],
+        output_schema: dict[str, Any],
+    ) -> dict[str, Any]:
+        del input, budget, output_schema
+        _FullAdapter.calls += 1
+        return {
+            "ok": True,
+            "output": {"status": "ok", "task_id": task_id, "answer": "full answer"},
+            "usage": {"time_ms": 1, "tokens_in": 1, "tokens_out": 1},
+            "meta": {"adapter": "mock_sem:full", "model": "mock-full", "confidence": 0.95},
+        }
+
+
+def _semantic_graph(question: str) -> TaskGraph:
+    graph = TaskGraph.model_validate(
+        {
+            "graph_id": "semantic-retrieval",
+            "version": "0.1",
+            "root": "task_llm",
+            "defaults": {"budget": {"max_time_ms": 1500, "max_tokens": 300, "max_retries": 0}},
+            "tasks": [
+                {
+                    "id": "task_llm",
+                    "type": "llm.answer",
+                    "deps": [],
+                    "in": {},
+                    "run": {
+                        "kind": "llm",
+                        "spec": {
+                            "adapter": "mock_sem",
+                            "input": {"question": question},
+                            "output_schema": {"type": "object", "required": ["status", "task_id", "answer"]},
+                        },
+                    },
+                    "policy": {
+                        "on_fail": "fail",
+                        "adaptive": {
+                            "escalation_order": ["gate", "full"],
+                            "use_voi": False,
+                            "enable_gate_retrieval": True,
+                            "retrieval_strategy": "semantic",
+                            "retrieval_similarity_threshold": 0.9,
+                        },
+                    },
+                    "tags": [],
+                }
+            ],
+        }
+    )
+    normalized = normalize_graph(graph)
+    validate_graph(normalized)
+    return normalized
+
+
+def test_semantic_strategy_serves_reworded_question_from_gate_retrieval() -> None:
+    providers = executor_module._AdapterRegistry.providers
+    providers["mock_sem"] = _MiniAdapter
+    providers["mock_sem:gate"] = _GateAdapter
+    providers["mock_sem:full"] = _FullAdapter
+    _FullAdapter.calls = 0
+    executor_module.GATE_RETRIEVAL_STORE.clear()
+    executor_module.GATE_SEMANTIC_INDEX.clear()
+    try:
+        first = run_graph(_semantic_graph("How do I reset my account password?"))
+        second = run_graph(_semantic_graph("how do i reset my account password"))
+    finally:
+        for name in ("mock_sem", "mock_sem:gate", "mock_sem:full"):
+            del providers[name]
+        executor_module.GATE_RETRIEVAL_STORE.clear()
+        executor_module.GATE_SEMANTIC_INDEX.clear()
+
+    assert first["ok"] is True
+    assert second["ok"] is True
+    assert _FullAdapter.calls == 1
+    last_meta = second["events"][-1]["meta"]
+    assert last_meta["stop_reason"] == "accepted_gate_retrieval"
+    assert last_meta["gate_retrieval_strategy"] == "semantic"
+    assert last_meta["gate_retrieval_similarity"] >= 0.9
+    assert second["final"]["answer"] == "full answer"
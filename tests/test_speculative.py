@@ -0,0 +1,160 @@
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from kora import executor as executor_module
+from kora.adapters.base import BaseAdapter
+from kora.executor import ESCALATION_STATS, run_graph, run_graph_async
+from kora.task_ir import TaskGraph, normalize_graph, validate_graph
+
+
+class _MiniAdapter(BaseAdapter):
+    confidence = 0.1
+
+    def run(
+        self,
+        *,
+        task_id: str,
+        input: dict[str, Any],
+        budget: dict[str, Any],
+        output_schema: dict[str, Any],
+    ) -> dict[str, Any]:
+        del input, budget, output_schema
+        time.sleep(0.2)
+        return {
+            "ok": True,
+            "output": {"status": "ok", "task_id": task_id, "answer": "mini"},
+            "usage": {"time_ms": 200, "tokens_in": 1, "tokens_out": 1},
+            "meta": {"adapter": "spec", "model": "mock-mini", "confidence": _MiniAdapter.confidence},
+        }
+
+
+class _FullAdapter(BaseAdapter):
+    calls = 0
+    delay_s = 0.2
+
+    def run(
+        self,
+        *,
+        task_id: str,
+        input: dict[str, Any],
+        budget: dict[str, Any],
+        output_schema: dict[str, Any],
+    ) -> dict[str, Any]:
+        del input, budget, output_schema
+        _FullAdapter.calls += 1
+        time.sleep(_FullAdapter.delay_s)
+        return {
+            "ok": True,
+            "output": {"status": "ok", "task_id": task_id, "answer": "full"},
+            "usage": {"time_ms": 200, "tokens_in": 1, "tokens_out": 1},
+            "meta": {"adapter": "spec:full", "model": "mock-full", "confidence": 0.95},
+        }
+
+
+def _graph() -> TaskGraph:
+    graph = TaskGraph.model_validate(
+        {
+            "graph_id": "speculative-escalation",
+            "version": "0.1",
+            "root": "task_llm",
+            "defaults": {"budget": {"max_time_ms": 1500, "max_tokens": 300, "max_retries": 0}},
+            "tasks": [
+                {
+                    "id": "task_llm",
+                    "type": "llm.speculative",
+                    "deps": [],
+                    "in": {},
+                    "run": {
+                        "kind": "llm",
+                        "spec": {
+                            "adapter": "spec",
+                            "input": {"question": "q"},
+                            "output_schema": {"type": "object", "required": ["status", "task_id", "answer"]},
+                        },
+                    },
+                    "policy": {
+                        "on_fail": "fail",
+                        "adaptive": {
+                            "escalation_order": ["full"],
+                            "use_voi": False,
+                            "self_consistency_enabled": False,
+                            "speculative_escalation_threshold": 0.5,
+                        },
+                    },
+                    "tags": [],
+                }
+            ],
+        }
+    )
+    normalized = normalize_graph(graph)
+    validate_graph(normalized)
+    return normalized
+
+
+def _run_with_warm_stats(*, confidence: float, use_async: bool = False) -> tuple[dict[str, Any], float]:
+    providers = executor_module._AdapterRegistry.providers
+    providers["spec"] = _MiniAdapter
+    providers["spec:full"] = _FullAdapter
+    _MiniAdapter.confidence = confidence
+    _FullAdapter.calls = 0
+    for _ in range(5):
+        ESCALATION_STATS.record("llm.speculative", "spec", True)
+    try:
+        start = time.monotonic()
+        result = asyncio.run(run_graph_async(_graph())) if use_async else run_graph(_graph())
+        return result, time.monotonic() - start
+    finally:
+        del providers["spec"]
+        del providers["spec:full"]
+        ESCALATION_STATS.clear()
+
+
+def test_speculative_escalation_overlaps_next_stage() -> None:
+    result, elapsed = _run_with_warm_stats(confidence=0.1)
+
+    assert result["ok"] is True
+    assert result["final"]["answer"] == "full"
+    assert [event["meta"]["adapter"] for event in result["events"]] == ["spec", "spec:full"]
+    assert result["events"][0]["meta"]["speculated_next_stage"] == "full"
+    assert result["events"][1]["meta"]["speculative"] is True
+    assert _FullAdapter.calls == 1
+    assert elapsed < 0.35
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_speculative_result_is_discarded_when_earlier_stage_accepted(use_async: bool) -> None:
+    _FullAdapter.delay_s = 0.5
+    try:
+        result, _ = _run_with_warm_stats(confidence=0.99, use_async=use_async)
+    finally:
+        _FullAdapter.delay_s = 0.2
+
+    assert result["ok"] is True
+    assert result["final"]["answer"] == "mini"
+    assert len(result["events"]) == 1
+    assert result["events"][0]["meta"]["speculated_next_stage"] == "full"
+    assert result["budget"]["calls"] == 2
+    assert result["budget"]["tokens_in"] == 1
+    assert result["budget"]["tokens_out"] == 1 + 300
+
+
+def test_no_speculation_without_escalation_history() -> None:
+    providers = executor_module._AdapterRegistry.providers
+    providers["spec"] = _MiniAdapter
+    providers["spec:full"] = _FullAdapter
+    _MiniAdapter.confidence = 0.99
+    _FullAdapter.calls = 0
+    ESCALATION_STATS.clear()
+    try:
+        result = run_graph(_graph())
+    finally:
+        del providers["spec"]
+        del providers["spec:full"]
+        ESCALATION_STATS.clear()
+
+    assert result["ok"] is True
+    assert _FullAdapter.calls == 0
+    assert "speculated_next_stage" not in result["events"][0]["meta"]
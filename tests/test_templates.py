@@ -0,0 +1,68 @@
+import pytest
+
+from kora.executor import run_graph
+from kora.templates import GraphTemplate
+
+
+def _template_payload() -> dict:
+    return {
+        "graph_id": "template-demo",
+        "version": "0.1",
+        "root": "task_echo",
+        "defaults": {"budget": {"max_time_ms": 1500, "max_tokens": 300, "max_retries": 1}},
+        "tasks": [
+            {
+                "id": "task_pre",
+                "type": "det.classify_simple",
+                "deps": [],
+                "in": {"text": "{{prompt}}"},
+                "run": {"kind": "det", "spec": {"handler": "classify_simple", "args": {"text": "{{prompt}}"}}},
+                "policy": {"on_fail": "fail"},
+                "tags": [],
+            },
+            {
+                "id": "task_echo",
+                "type": "det.echo",
+                "deps": ["task_pre"],
+                "in": {"message": "user said: {{prompt}}"},
+                "run": {"kind": "det", "spec": {"handler": "echo", "args": {}}},
+                "policy": {"on_fail": "fail"},
+                "tags": [],
+            },
+        ],
+    }
+
+
+def test_template_binds_parameters_without_touching_template() -> None:
+    template = GraphTemplate(_template_payload())
+
+    bound = template.bind({"prompt": "hi"}, graph_id="req-1")
+
+    assert template.params == frozenset({"prompt"})
+    assert template.order == ["task_pre", "task_echo"]
+    assert bound.graph_id == "req-1"
+    assert bound.tasks[0].in_ == {"text": "hi"}
+    assert bound.tasks[0].run.spec.args == {"text": "hi"}
+    assert bound.tasks[1].in_ == {"message": "user said: hi"}
+    assert template.graph.tasks[0].in_ == {"text": "{{prompt}}"}
+    assert bound.tasks[0].policy.budget is not None
+
+
+def test_template_whole_placeholder_keeps_value_type_and_runs() -> None:
+    payload = _template_payload()
+    payload["tasks"][0]["in"] = {"text": "{{prompt}}", "limit": "{{limit}}"}
+    template = GraphTemplate(payload)
+
+    bound = template.bind({"prompt": "x" * 100, "limit": 3})
+    result = run_graph(bound)
+
+    assert bound.tasks[0].in_["limit"] == 3
+    assert result["ok"] is True
+    assert result["outputs"]["task_pre"]["is_simple"] is False
+
+
+def test_template_bind_rejects_missing_parameters() -> None:
+    template = GraphTemplate(_template_payload())
+
+    with pytest.raises(ValueError, match="missing template parameters"):
+        template.bind({})
@@ -0,0 +1,40 @@
+import pytest
+
+from kora.verification import ValidatorCache, schema_hash, validate_schema
+
+
+def test_schema_hash_is_key_order_independent() -> None:
+    assert schema_hash({"type": "object", "required": ["a"]}) == schema_hash({"required": ["a"], "type": "object"})
+
+
+def test_validator_cache_counts_hits_and_misses() -> None:
+    cache = ValidatorCache(max_entries=2)
+    schema = {"type": "object", "required": ["a"]}
+
+    first = cache.get(schema)
+    second = cache.get({"required": ["a"], "type": "object"})
+
+    assert first is second
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_validator_cache_evicts_least_recently_used() -> None:
+    cache = ValidatorCache(max_entries=2)
+    a = {"type": "object", "required": ["a"]}
+    b = {"type": "object", "required": ["b"]}
+    c = {"type": "object", "required": ["c"]}
+
+    cache.get(a)
+    cache.get(b)
+    cache.get(a)
+    cache.get(c)
+    cache.get(a)
+
+    assert cache.stats()["size"] == 2
+    cache.get(b)
+    assert cache.stats()["misses"] == 4
+
+
+def test_validate_schema_reports_validation_message() -> None:
+    with pytest.raises(ValueError, match="'must_exist' is a required property"):
+        validate_schema({"status": "ok"}, {"type": "object", "required": ["must_exist"]})